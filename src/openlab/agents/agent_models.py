@@ -7,7 +7,7 @@ from datetime import UTC, datetime
 from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AgentEventType(StrEnum):
@@ -26,7 +26,13 @@ class AgentEventType(StrEnum):
 
 
 class AgentEvent(BaseModel):
-    """Mirrors the PipelineEvent pattern for agent streaming."""
+    """Mirrors the PipelineEvent pattern for agent streaming.
+
+    Immutable once emitted. The runner builds its own events with
+    ``model_construct`` to skip validation of trusted internal values.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     event_type: AgentEventType
     stage: str = ""
@@ -65,6 +71,7 @@ class ProvenanceEntry(BaseModel):
     sources: list[str] = Field(default_factory=list)
     parent_call_id: str | None = None
     error: str | None = None
+    cache_hit: bool = False
 
 
 class CitationStatus(StrEnum):
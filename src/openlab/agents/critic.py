@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass, field
 
 from openlab.agents.agent_models import CitationStatus, Claim
 from openlab.agents.tools import ToolRegistry
 
+# PMIDs per EuropePMC OR-query; keeps the query string a sane length
+_PMID_BATCH = 100
+
 
 @dataclass
 class CriticReport:
@@ -51,8 +53,10 @@ async def run_critic(
 async def validate_citations(
     tools: ToolRegistry, claims: list[Claim]
 ) -> tuple[list[Claim], list[str]]:
-    """Batch-validate PMIDs/DOIs via EuropePMC. Max 10 concurrent."""
-    sem = asyncio.Semaphore(10)
+    """Batch-validate PMIDs/DOIs via EuropePMC.
+
+    PMIDs are checked ``_PMID_BATCH`` at a time, one OR-query per batch.
+    """
     call_ids: list[str] = []
 
     # Collect unique PMIDs to validate
@@ -66,17 +70,17 @@ async def validate_citations(
     valid_pmids: set[str] = set()
     invalid_pmids: set[str] = set()
 
-    async def _check_pmid(pmid: str) -> None:
-        async with sem:
-            result = await tools.call("pmid_validate", {"pmid": pmid})
-            if result.success:
-                call_ids.append(result.call_id)
-                if result.data.get("valid"):
-                    valid_pmids.add(pmid)
-                else:
-                    invalid_pmids.add(pmid)
-
-    await asyncio.gather(*[_check_pmid(p) for p in pmids_to_check])
+    pmids = sorted(pmids_to_check)
+    batches = [pmids[i:i + _PMID_BATCH] for i in range(0, len(pmids), _PMID_BATCH)]
+    results = await tools.call_many(
+        [("pmid_validate_batch", {"pmids": batch}) for batch in batches]
+    )
+    for result in results:
+        if not result.success:
+            continue
+        call_ids.append(result.call_id)
+        for pmid, hit in result.data["results"].items():
+            (valid_pmids if hit["valid"] else invalid_pmids).add(pmid)
 
     # Update claims with validation status
     validated: list[Claim] = []
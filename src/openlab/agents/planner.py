@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
+from graphlib import CycleError, TopologicalSorter
 
 
 @dataclass
@@ -26,6 +28,31 @@ class DossierPlan:
             result.setdefault(step.phase, []).append(step)
         return result
 
+    def layers(self) -> Iterator[tuple[str, ...]]:
+        """Step ids grouped into layers that can run concurrently; see :func:`iter_layers`."""
+        return iter_layers({step.step_id: step.depends_on for step in self.steps})
+
+
+def iter_layers(dependencies: Mapping[str, Iterable[str]]) -> Iterator[tuple[str, ...]]:
+    """Yield groups of step ids whose dependencies are all satisfied.
+
+    The steps in a group can run concurrently. The next group is computed when
+    the caller resumes the iterator, so a group counts as done once the caller
+    has finished it. A cyclic graph falls back to one step at a time in
+    declaration order.
+    """
+    sorter = TopologicalSorter(dependencies)
+    try:
+        sorter.prepare()
+    except CycleError:
+        for step_id in dependencies:
+            yield (step_id,)
+        return
+    while sorter.is_active():
+        ready = sorter.get_ready()
+        yield ready
+        sorter.done(*ready)
+
 
 def plan_gene_dossier(gene_symbol: str, cancer_type: str | None = None) -> DossierPlan:
     """Create a fixed execution plan for gene dossier generation.
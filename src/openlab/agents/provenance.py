@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import time
 import uuid
+from collections.abc import Callable
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 
@@ -12,10 +13,15 @@ from openlab.agents.agent_models import ProvenanceEntry
 
 
 class ProvenanceLedger:
-    """In-memory append-only provenance log for a single agent run."""
+    """In-memory append-only provenance log for a single agent run.
 
-    def __init__(self, run_id: str) -> None:
+    ``id_factory`` generates call ids; it defaults to 12 hex chars of a random
+    UUID. Tests can pass a counter-based factory for deterministic ids.
+    """
+
+    def __init__(self, run_id: str, id_factory: Callable[[], str] | None = None) -> None:
         self.run_id = run_id
+        self._new_id = id_factory or _random_call_id
         self._entries: dict[str, ProvenanceEntry] = {}
         self._lock = asyncio.Lock()
         self._start_times: dict[str, float] = {}
@@ -26,7 +32,7 @@ class ProvenanceLedger:
         arguments: dict,
         parent_call_id: str | None = None,
     ) -> str:
-        call_id = uuid.uuid4().hex[:12]
+        call_id = self._new_id()
         async with self._lock:
             self._entries[call_id] = ProvenanceEntry(
                 call_id=call_id,
@@ -45,6 +51,7 @@ class ProvenanceLedger:
         sources: list[str] | None = None,
         success: bool = True,
         error: str | None = None,
+        cache_hit: bool = False,
     ) -> None:
         async with self._lock:
             entry = self._entries.get(call_id)
@@ -54,6 +61,7 @@ class ProvenanceLedger:
             entry.success = success
             entry.error = error
             entry.sources = sources or []
+            entry.cache_hit = cache_hit
             start = self._start_times.get(call_id)
             if start is not None:
                 entry.duration_ms = int((time.monotonic() - start) * 1000)
@@ -88,8 +96,17 @@ class ProvenanceLedger:
                 current = entry.parent_call_id
             return chain
 
+    def clear(self) -> None:
+        """Drop all recorded entries, keeping the run id."""
+        self._entries.clear()
+        self._start_times.clear()
+
     def total_calls(self) -> int:
         return len(self._entries)
 
     def total_duration_ms(self) -> int:
         return sum(e.duration_ms for e in self._entries.values())
+
+
+def _random_call_id() -> str:
+    return uuid.uuid4().hex[:12]
@@ -12,26 +12,24 @@ async def retrieve_gene_identity(
 ) -> tuple[dict[str, Any], list[str], list[dict[str, Any]]]:
     """Fetch gene identity from NCBI, Ensembl, UniProt in parallel.
 
+    The three sources are independent, so wall time is the slowest lookup
+    rather than the sum; only NCBI's own esearch -> efetch hop is sequential.
+
     Returns (merged_identity, call_ids, per_source_data) where per_source_data
     is a list of individual source results tagged with their source name.
     """
-    import asyncio
-
     source_names = ["ncbi", "ensembl", "uniprot"]
-    results = await asyncio.gather(
-        tools.call("ncbi_gene_info", {"gene_symbol": gene_symbol}),
-        tools.call("ensembl_lookup", {"gene_symbol": gene_symbol}),
-        tools.call("uniprot_lookup", {"gene_symbol": gene_symbol}),
-        return_exceptions=True,
-    )
+    results = await tools.call_many([
+        ("ncbi_gene_info", {"gene_symbol": gene_symbol}),
+        ("ensembl_lookup", {"gene_symbol": gene_symbol}),
+        ("uniprot_lookup", {"gene_symbol": gene_symbol}),
+    ])
 
     identity: dict[str, Any] = {"gene_symbol": gene_symbol}
     call_ids: list[str] = []
     per_source: list[dict[str, Any]] = []
 
     for name, r in zip(source_names, results, strict=True):
-        if isinstance(r, BaseException):
-            continue
         if r.success:
             identity.update(r.data)
             call_ids.append(r.call_id)
@@ -44,23 +42,21 @@ async def retrieve_literature(
     tools: ToolRegistry, gene_symbol: str, cancer_type: str | None = None
 ) -> tuple[list[dict], list[str]]:
     """Fetch literature from EuropePMC (general + cancer-specific)."""
-    import asyncio
-
-    tasks = [tools.call("literature_search", {"gene_symbol": gene_symbol})]
+    specs: list[tuple[str, dict[str, Any]]] = [
+        ("literature_search", {"gene_symbol": gene_symbol}),
+    ]
     if cancer_type:
-        tasks.append(tools.call(
+        specs.append((
             "cancer_literature",
             {"gene_symbol": gene_symbol, "cancer_type": cancer_type},
         ))
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    results = await tools.call_many(specs)
 
     articles: list[dict] = []
     call_ids: list[str] = []
 
     for r in results:
-        if isinstance(r, BaseException):
-            continue
         if r.success:
             articles.extend(r.data.get("articles", []))
             call_ids.append(r.call_id)
@@ -76,8 +72,6 @@ async def retrieve_cancer_evidence(
     Returns (cancer_evidence_list, call_ids) where each item in the list is
     an individual evidence dict (variant/mutation/entry) tagged with its source.
     """
-    import asyncio
-
     source_tools = [
         "clinvar_search",
         "cosmic_search",
@@ -87,17 +81,12 @@ async def retrieve_cancer_evidence(
         "tcga_gdc_search",
     ]
 
-    results = await asyncio.gather(
-        *(tools.call(t, {"gene_symbol": gene_symbol}) for t in source_tools),
-        return_exceptions=True,
-    )
+    results = await tools.call_many([(t, {"gene_symbol": gene_symbol}) for t in source_tools])
 
     evidence: list[dict] = []
     call_ids: list[str] = []
 
     for r in results:
-        if isinstance(r, BaseException):
-            continue
         if not r.success:
             continue
         call_ids.append(r.call_id)
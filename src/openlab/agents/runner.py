@@ -34,7 +34,14 @@ async def run_dossier_agent(
     run_id = uuid.uuid4().hex[:16]
     own_http = http is None
     if own_http:
-        http = httpx.AsyncClient(timeout=30.0, follow_redirects=True)
+        # One pooled HTTP/2 connection per upstream host, multiplexing the
+        # retrieval fan-out instead of paying a TLS handshake per request
+        http = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            follow_redirects=True,
+        )
 
     # Load config
     from openlab.config import config
@@ -47,7 +54,7 @@ async def run_dossier_agent(
     ledger = ProvenanceLedger(run_id)
     tools = ToolRegistry(http, ledger)
 
-    yield AgentEvent(
+    yield AgentEvent.model_construct(
         event_type=AgentEventType.PROGRESS,
         stage="init",
         data={"gene_symbol": gene_symbol, "cancer_type": cancer_type},
@@ -60,7 +67,7 @@ async def run_dossier_agent(
         from openlab.agents.planner import plan_gene_dossier
 
         plan = plan_gene_dossier(gene_symbol, cancer_type)
-        yield AgentEvent(
+        yield AgentEvent.model_construct(
             event_type=AgentEventType.PLAN_CREATED,
             stage="planning",
             data={"phases": len(plan.phases()), "steps": len(plan.steps)},
@@ -68,15 +75,10 @@ async def run_dossier_agent(
             run_id=run_id,
         )
 
-        # Phase 2: Identity retrieval (parallel)
-        yield AgentEvent(
-            event_type=AgentEventType.TOOL_STARTED,
-            stage="identity",
-            data={"tools": ["ncbi_gene_info", "ensembl_lookup", "uniprot_lookup"]},
-            progress=0.1,
-            run_id=run_id,
-        )
-
+        # Phases 2-3: Retrieval, scheduled as a DAG. Literature and cancer
+        # sources only need the symbol, so they overlap identity resolution;
+        # only the local evidence fetch waits for the resolved gene id.
+        from openlab.agents.planner import iter_layers
         from openlab.agents.retriever import (
             retrieve_cancer_evidence,
             retrieve_existing_evidence,
@@ -84,60 +86,74 @@ async def run_dossier_agent(
             retrieve_literature,
         )
 
-        identity, id_call_ids, identity_sources = await asyncio.wait_for(
-            retrieve_gene_identity(tools, gene_symbol),
-            timeout=timeout,
-        )
+        retrieved: dict[str, Any] = {}
+        retrieval_steps = {
+            "identity": lambda: retrieve_gene_identity(tools, gene_symbol),
+            "literature": lambda: retrieve_literature(tools, gene_symbol, cancer_type),
+            "cancer": lambda: retrieve_cancer_evidence(tools, gene_symbol),
+            "existing": lambda: retrieve_existing_evidence(
+                tools, gene_symbol, _gene_id_int(retrieved["identity"][0])
+            ),
+        }
+        retrieval_deps = {"identity": [], "literature": [], "cancer": [], "existing": ["identity"]}
+        started: set[str] = set()
+
+        for layer in iter_layers(retrieval_deps):
+            stages = {"identity" if step == "identity" else "evidence" for step in layer}
+            if "identity" in stages - started:
+                yield AgentEvent.model_construct(
+                    event_type=AgentEventType.TOOL_STARTED,
+                    stage="identity",
+                    data={"tools": ["ncbi_gene_info", "ensembl_lookup", "uniprot_lookup"]},
+                    progress=0.1,
+                    run_id=run_id,
+                )
+            if "evidence" in stages - started:
+                yield AgentEvent.model_construct(
+                    event_type=AgentEventType.TOOL_STARTED,
+                    stage="evidence",
+                    data={"tools": [
+                        "literature_search", "cancer_literature", "evidence_fetch",
+                        "clinvar_search", "cosmic_search", "oncokb_search",
+                        "cbioportal_search", "civic_search", "tcga_gdc_search",
+                    ]},
+                    progress=0.1,
+                    run_id=run_id,
+                )
+            started |= stages
 
-        if not identity.get("gene_id") and not identity.get("id"):
-            yield AgentEvent(
-                event_type=AgentEventType.RUN_FAILED,
-                stage="identity",
-                error=f"Could not resolve gene identity for {gene_symbol}",
-                run_id=run_id,
+            results = await asyncio.wait_for(
+                asyncio.gather(*(retrieval_steps[step]() for step in layer)),
+                timeout=timeout,
             )
-            return
-
-        yield AgentEvent(
-            event_type=AgentEventType.TOOL_COMPLETED,
-            stage="identity",
-            data={"gene_symbol": gene_symbol, "sources_found": len(id_call_ids)},
-            progress=0.2,
-            run_id=run_id,
-        )
-
-        # Phase 3: Evidence retrieval (parallel — literature + DB + cancer sources)
-        yield AgentEvent(
-            event_type=AgentEventType.TOOL_STARTED,
-            stage="evidence",
-            data={"tools": [
-                "literature_search", "cancer_literature", "evidence_fetch",
-                "clinvar_search", "cosmic_search", "oncokb_search",
-                "cbioportal_search", "civic_search", "tcga_gdc_search",
-            ]},
-            progress=0.25,
-            run_id=run_id,
-        )
-
-        gene_id = identity.get("gene_id")
-        gene_id_int = int(gene_id) if gene_id and str(gene_id).isdigit() else None
+            retrieved.update(zip(layer, results, strict=True))
+
+            if "identity" in layer:
+                identity, id_call_ids, identity_sources = retrieved["identity"]
+                if not identity.get("gene_id") and not identity.get("id"):
+                    yield AgentEvent.model_construct(
+                        event_type=AgentEventType.RUN_FAILED,
+                        stage="identity",
+                        error=f"Could not resolve gene identity for {gene_symbol}",
+                        run_id=run_id,
+                    )
+                    return
+
+                yield AgentEvent.model_construct(
+                    event_type=AgentEventType.TOOL_COMPLETED,
+                    stage="identity",
+                    data={"gene_symbol": gene_symbol, "sources_found": len(id_call_ids)},
+                    progress=0.2,
+                    run_id=run_id,
+                )
 
-        lit_task = retrieve_literature(tools, gene_symbol, cancer_type)
-        ev_task = retrieve_existing_evidence(tools, gene_symbol, gene_id_int)
-        cancer_task = retrieve_cancer_evidence(tools, gene_symbol)
-
-        (
-            (articles, lit_call_ids),
-            (existing_evidence, ev_call_ids),
-            (cancer_evidence, cancer_call_ids),
-        ) = await asyncio.wait_for(
-            asyncio.gather(lit_task, ev_task, cancer_task),
-            timeout=timeout,
-        )
+        articles, _ = retrieved["literature"]
+        existing_evidence, _ = retrieved["existing"]
+        cancer_evidence, _ = retrieved["cancer"]
 
         # Check max tool calls
         if ledger.total_calls() > max_tools:
-            yield AgentEvent(
+            yield AgentEvent.model_construct(
                 event_type=AgentEventType.RUN_FAILED,
                 stage="evidence",
                 error=f"Max tool calls ({max_tools}) exceeded",
@@ -145,7 +161,7 @@ async def run_dossier_agent(
             )
             return
 
-        yield AgentEvent(
+        yield AgentEvent.model_construct(
             event_type=AgentEventType.TOOL_COMPLETED,
             stage="evidence",
             data={
@@ -186,7 +202,7 @@ async def run_dossier_agent(
         convergence = conv_result.data.get("convergence_score", 0.0) if conv_result.success else 0.0
 
         # Phase 5: LLM synthesis
-        yield AgentEvent(
+        yield AgentEvent.model_construct(
             event_type=AgentEventType.SYNTHESIS_STARTED,
             stage="synthesis",
             data={"evidence_count": len(all_evidence)},
@@ -218,7 +234,7 @@ async def run_dossier_agent(
             sections.append((section_name, content, claims, syn_call_ids))
 
             for claim in claims:
-                yield AgentEvent(
+                yield AgentEvent.model_construct(
                     event_type=AgentEventType.CLAIM_EXTRACTED,
                     stage="synthesis",
                     data={
@@ -229,7 +245,7 @@ async def run_dossier_agent(
                     run_id=run_id,
                 )
 
-        yield AgentEvent(
+        yield AgentEvent.model_construct(
             event_type=AgentEventType.SYNTHESIS_COMPLETED,
             stage="synthesis",
             data={"sections": len(sections)},
@@ -248,7 +264,7 @@ async def run_dossier_agent(
         critic_call_ids: list[str] = []
 
         if auto_critic and all_claims:
-            yield AgentEvent(
+            yield AgentEvent.model_construct(
                 event_type=AgentEventType.CRITIC_STARTED,
                 stage="validation",
                 data={"claims_to_check": len(all_claims)},
@@ -264,7 +280,7 @@ async def run_dossier_agent(
                 timeout=timeout,
             )
 
-            yield AgentEvent(
+            yield AgentEvent.model_construct(
                 event_type=AgentEventType.CRITIC_COMPLETED,
                 stage="validation",
                 data={
@@ -299,7 +315,7 @@ async def run_dossier_agent(
             cancer_type=cancer_type,
         )
 
-        yield AgentEvent(
+        yield AgentEvent.model_construct(
             event_type=AgentEventType.DOSSIER_COMPLETED,
             stage="complete",
             data={
@@ -316,7 +332,7 @@ async def run_dossier_agent(
         )
 
     except TimeoutError:
-        yield AgentEvent(
+        yield AgentEvent.model_construct(
             event_type=AgentEventType.RUN_FAILED,
             stage="timeout",
             error=f"Agent run timed out after {timeout}s",
@@ -324,7 +340,7 @@ async def run_dossier_agent(
         )
     except Exception as exc:
         logger.exception("Agent run failed: %s", exc)
-        yield AgentEvent(
+        yield AgentEvent.model_construct(
             event_type=AgentEventType.RUN_FAILED,
             stage="error",
             error=str(exc),
@@ -335,6 +351,11 @@ async def run_dossier_agent(
             await http.aclose()
 
 
+def _gene_id_int(identity: dict[str, Any]) -> int | None:
+    gene_id = identity.get("gene_id")
+    return int(gene_id) if gene_id and str(gene_id).isdigit() else None
+
+
 def _normalize_identity_for_convergence(src: dict[str, Any]) -> dict[str, Any]:
     """Map raw identity source data into fields the evidence normalizer handles.
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 from typing import Any
 
@@ -65,18 +66,47 @@ async def synthesize_section(
     call_ids = [result.call_id] if result.success else []
 
     markdown = result.data.get("response", "") if result.success else ""
-    claims = extract_claims(markdown)
+    # Claim extraction is pure regex work; keep it off the event loop so
+    # in-flight tool calls keep being serviced while a long section parses.
+    claims = await asyncio.to_thread(extract_claims, markdown) if markdown else []
 
     return markdown, claims, call_ids
 
 
+_FOOTNOTE_RE = re.compile(
+    r"^\[(\d+)\]\s*(?:\[?(?:PMID|PubMed):\s*(\d+)\]?|\[?DOI:\s*(10\.\S+?)\]?)",
+    re.MULTILINE,
+)
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Every citation form in one alternation, so a sentence is scanned once and
+# each match is dispatched on ``lastgroup``.
+_CITATION_RE = re.compile(
+    r"\[PMID:\s*(?P<pmid>\d+)\]"
+    r"|\[DOI:\s*(?P<doi>10\.\S+?)\]"
+    r"|\[PubMed:\s*(?P<pubmed>\d+)\]"
+    r"|\[(?P<bracket>[^\]]*,[^\]]*)\]"
+    r"|\[(?P<footnote>\d+)\]"
+    r"|\[(?P<range>\d+-\d+)\]"
+)
+_BRACKET_PMID_RE = re.compile(r"(?:PMID|PubMed):\s*(\d+)")
+_BRACKET_DOI_RE = re.compile(r"DOI:\s*(10\.\S+?)(?:,|\s|$)")
+_CONFIDENCE_RE = re.compile(r"\((\d\.\d+)\)")
+# Markup stripped from the claim text
+_MARKUP_RE = re.compile(
+    r"\[PMID:\s*\d+\]"
+    r"|\[PubMed:\s*\d+\]"
+    r"|\[DOI:\s*10\.\S+?\]"
+    r"|\[[^\]]*,\s*(?:PMID|PubMed|DOI):[^\]]*\]"
+    r"|\[SPECULATIVE\]"
+    r"|\(\d\.\d+\)"
+)
+
+
 def _build_footnote_map(text: str) -> dict[int, list[str]]:
     """Scan for footnote-style reference lists and map numbers to PMIDs/DOIs."""
     mapping: dict[int, list[str]] = {}
-    for m in re.finditer(
-        r"^\[(\d+)\]\s*(?:\[?(?:PMID|PubMed):\s*(\d+)\]?|\[?DOI:\s*(10\.\S+?)\]?)",
-        text, re.MULTILINE,
-    ):
+    for m in _FOOTNOTE_RE.finditer(text):
         num = int(m.group(1))
         cites: list[str] = []
         if m.group(2):
@@ -88,6 +118,37 @@ def _build_footnote_map(text: str) -> dict[int, list[str]]:
     return mapping
 
 
+def _sentence_citations(sentence: str, footnote_map: dict[int, list[str]]) -> list[str]:
+    """Collect a sentence's citations, deduplicated, in a single regex pass.
+
+    Citations are grouped by form (PMID, DOI, PubMed, comma-separated
+    brackets, footnotes, footnote ranges) and the groups concatenated in that
+    order.
+    """
+    groups: dict[str, list[str]] = {
+        "pmid": [], "doi": [], "pubmed": [], "bracket": [], "footnote": [], "range": [],
+    }
+    for m in _CITATION_RE.finditer(sentence):
+        kind = m.lastgroup
+        value = m.group(kind)
+        if kind in ("pmid", "pubmed"):
+            groups[kind].append(f"PMID:{value}")
+        elif kind == "doi":
+            groups[kind].append(f"DOI:{value}")
+        elif kind == "bracket":
+            groups[kind].extend(f"PMID:{p}" for p in _BRACKET_PMID_RE.findall(value))
+            groups[kind].extend(f"DOI:{d}" for d in _BRACKET_DOI_RE.findall(value))
+        elif kind == "footnote":
+            groups[kind].extend(footnote_map.get(int(value), ()))
+        else:
+            start_s, end_s = value.split("-")
+            for n in range(int(start_s), int(end_s) + 1):
+                groups[kind].extend(footnote_map.get(n, ()))
+
+    # Deduplicate citations while preserving order
+    return list(dict.fromkeys(c for group in groups.values() for c in group))
+
+
 def extract_claims(llm_response: str) -> list[Claim]:
     """Extract structured claims from LLM response text.
 
@@ -98,84 +159,39 @@ def extract_claims(llm_response: str) -> list[Claim]:
     claims: list[Claim] = []
     footnote_map = _build_footnote_map(llm_response)
 
-    # Split into sentences (rough)
-    sentences = re.split(r"(?<=[.!?])\s+", llm_response)
+    # Bound once: this loop runs for every sentence of every LLM response
+    append = claims.append
+    new_claim = Claim.model_construct
+    find_confidence = _CONFIDENCE_RE.search
+    strip_markup = _MARKUP_RE.sub
 
-    for sentence in sentences:
+    # Split into sentences (rough)
+    for sentence in _SENTENCE_SPLIT_RE.split(llm_response):
         sentence = sentence.strip()
         if len(sentence) < 20:
             continue
 
-        # Extract citations — tolerate whitespace around colon (LLMs vary)
-        pmids = re.findall(r"\[PMID:\s*(\d+)\]", sentence)
-        dois = re.findall(r"\[DOI:\s*(10\.\S+?)\]", sentence)
-        citations = [f"PMID:{p}" for p in pmids] + [f"DOI:{d}" for d in dois]
-
-        # PubMed: variant (LLMs often emit this instead of PMID:)
-        pubmed_ids = re.findall(r"\[PubMed:\s*(\d+)\]", sentence)
-        citations.extend(f"PMID:{p}" for p in pubmed_ids)
-
-        # Comma-separated citation brackets: [source, PubMed:111, PMID:222]
-        for bracket in re.findall(r"\[([^\]]*,[^\]]*)\]", sentence):
-            for m in re.finditer(r"(?:PMID|PubMed):\s*(\d+)", bracket):
-                citations.append(f"PMID:{m.group(1)}")
-            for m in re.finditer(r"DOI:\s*(10\.\S+?)(?:,|\s|$)", bracket):
-                citations.append(f"DOI:{m.group(1)}")
-
-        # Resolve footnote-style [N] references via the map
-        footnote_refs = re.findall(r"\[(\d+)\]", sentence)
-        for ref_num in footnote_refs:
-            n = int(ref_num)
-            if n in footnote_map:
-                citations.extend(footnote_map[n])
-
-        # Resolve ranged refs like [4-20]
-        range_refs = re.findall(r"\[(\d+)-(\d+)\]", sentence)
-        for start_s, end_s in range_refs:
-            for n in range(int(start_s), int(end_s) + 1):
-                if n in footnote_map:
-                    citations.extend(footnote_map[n])
-
-        # Deduplicate citations while preserving order
-        seen: set[str] = set()
-        unique_citations: list[str] = []
-        for c in citations:
-            if c not in seen:
-                seen.add(c)
-                unique_citations.append(c)
-        citations = unique_citations
-
-        # Check for speculation marker
-        is_speculative = "[SPECULATIVE]" in sentence
-
-        # Extract confidence
-        conf_match = re.search(r"\((\d\.\d+)\)", sentence)
-        confidence = float(conf_match.group(1)) if conf_match else 0.0
+        citations = _sentence_citations(sentence, footnote_map)
 
         # Claims without citations get confidence=0.0 and marked speculative
-        if not citations:
-            confidence = 0.0
+        if citations:
+            is_speculative = "[SPECULATIVE]" in sentence
+            conf_match = find_confidence(sentence)
+            confidence = float(conf_match.group(1)) if conf_match else 0.0
+        else:
             is_speculative = True
+            confidence = 0.0
 
-        # Clean the claim text
-        claim_text = sentence
-        claim_text = re.sub(r"\[PMID:\s*\d+\]", "", claim_text)
-        claim_text = re.sub(r"\[PubMed:\s*\d+\]", "", claim_text)
-        claim_text = re.sub(r"\[DOI:\s*10\.\S+?\]", "", claim_text)
-        claim_text = re.sub(r"\[[^\]]*,\s*(?:PMID|PubMed|DOI):[^\]]*\]", "", claim_text)
-        claim_text = re.sub(r"\[SPECULATIVE\]", "", claim_text)
-        claim_text = re.sub(r"\(\d\.\d+\)", "", claim_text)
-        claim_text = claim_text.strip()
+        claim_text = strip_markup("", sentence).strip()
 
         if len(claim_text) > 15:
-            claims.append(
-                Claim(
-                    claim_text=claim_text,
-                    confidence=confidence,
-                    citations=citations,
-                    is_speculative=is_speculative,
-                )
-            )
+            # Fields are already the declared types, so skip validation
+            append(new_claim(
+                claim_text=claim_text,
+                confidence=confidence,
+                citations=citations,
+                is_speculative=is_speculative,
+            ))
 
     return claims
 
@@ -2,23 +2,123 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import functools
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
+import ijson
+import orjson
 
 from openlab.agents.agent_models import ToolResult
 from openlab.agents.provenance import ProvenanceLedger
 
 logger = logging.getLogger(__name__)
 
+# Read-only lookups whose results may be reused, with a time-to-live in
+# seconds. Anything not listed here (LLM synthesis, DB reads) is always called.
+CACHEABLE_TOOLS: dict[str, float] = {
+    "ncbi_gene_info": 24 * 3600,
+    "ensembl_lookup": 3600,
+    "uniprot_lookup": 3600,
+    "pmid_validate": 24 * 3600,
+    "pmid_validate_batch": 24 * 3600,
+    "cancer_literature": 3600,
+}
+
+
+# Upstream host per network tool, and how many requests each host may have in
+# flight from one registry (NCBI asks for at most 3/s without an API key).
+TOOL_HOSTS: dict[str, str] = {
+    "ncbi_gene_info": "eutils.ncbi.nlm.nih.gov",
+    "ensembl_lookup": "rest.ensembl.org",
+    "uniprot_lookup": "rest.uniprot.org",
+    "literature_search": "europepmc.org",
+    "cancer_literature": "europepmc.org",
+    "pmid_validate": "europepmc.org",
+    "pmid_validate_batch": "europepmc.org",
+}
+HOST_CONCURRENCY: dict[str, int] = {
+    "eutils.ncbi.nlm.nih.gov": 3,
+    "rest.ensembl.org": 5,
+    "rest.uniprot.org": 5,
+    "europepmc.org": 5,
+}
+
+
+class ToolCache:
+    """LRU of successful read-only tool results, keyed on tool name and arguments.
+
+    Entries expire after the tool's TTL in :data:`CACHEABLE_TOOLS`. One cache
+    can be shared between registries to deduplicate lookups across runs.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict, list[str]]] = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def _key(tool_name: str, arguments: dict[str, Any]) -> tuple[str, str]:
+        return tool_name, repr(sorted(arguments.items()))
+
+    def get(
+        self, tool_name: str, arguments: dict[str, Any]
+    ) -> tuple[dict[str, Any], list[str]] | None:
+        key = self._key(tool_name, arguments)
+        hit = self._entries.get(key)
+        if hit is None:
+            return None
+        expires, data, sources = hit
+        if time.monotonic() >= expires:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(data), list(sources)
+
+    def put(
+        self, tool_name: str, arguments: dict[str, Any], data: dict[str, Any], sources: list[str]
+    ) -> None:
+        key = self._key(tool_name, arguments)
+        expires = time.monotonic() + CACHEABLE_TOOLS[tool_name]
+        self._entries[key] = (expires, copy.deepcopy(data), list(sources))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
 
 class ToolRegistry:
-    """Registry of callable tools with automatic provenance tracking."""
+    """Registry of callable tools with automatic provenance tracking.
+
+    Results of :data:`CACHEABLE_TOOLS` are served from ``cache`` when possible;
+    a hit is still logged to the ledger, flagged with ``cache_hit``. Identical
+    cacheable calls that arrive while one is already in flight wait for it
+    instead of going upstream again, and are flagged the same way. Calls to
+    the same upstream host are bounded by :data:`HOST_CONCURRENCY`.
+    """
 
-    def __init__(self, http: httpx.AsyncClient, ledger: ProvenanceLedger) -> None:
+    def __init__(
+        self,
+        http: httpx.AsyncClient,
+        ledger: ProvenanceLedger,
+        cache: ToolCache | None = None,
+    ) -> None:
         self.http = http
         self.ledger = ledger
+        self.cache = cache if cache is not None else ToolCache()
+        self._host_sems = {
+            host: asyncio.Semaphore(limit) for host, limit in HOST_CONCURRENCY.items()
+        }
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
         self._tools: dict[str, Any] = {}
         self._register_builtins()
 
@@ -29,6 +129,7 @@ class ToolRegistry:
         self._tools["literature_search"] = _literature_search
         self._tools["cancer_literature"] = _cancer_literature
         self._tools["pmid_validate"] = _pmid_validate
+        self._tools["pmid_validate_batch"] = _pmid_validate_batch
         self._tools["evidence_fetch"] = _evidence_fetch
         self._tools["convergence_score"] = _convergence_score
         self._tools["llm_synthesize"] = _llm_synthesize
@@ -56,15 +157,31 @@ class ToolRegistry:
             )
 
         call_id = await self.ledger.start_call(tool_name, arguments, parent_call_id)
+        cacheable = tool_name in CACHEABLE_TOOLS
+        cached = self.cache.get(tool_name, arguments) if cacheable else None
+        if cached is not None:
+            data, sources = cached
+            await self.ledger.complete_call(
+                call_id, sources=sources, success=True, cache_hit=True
+            )
+            return ToolResult(
+                call_id=call_id, tool_name=tool_name, success=True, data=data, sources=sources
+            )
+
         try:
-            result = await func(self.http, **arguments)
-            sources = result.pop("_sources", []) if isinstance(result, dict) else []
-            await self.ledger.complete_call(call_id, sources=sources, success=True)
+            if cacheable:
+                data, sources, shared = await self._single_flight(func, tool_name, arguments)
+            else:
+                data, sources = await self._invoke(func, tool_name, arguments)
+                shared = False
+            await self.ledger.complete_call(
+                call_id, sources=sources, success=True, cache_hit=shared
+            )
             return ToolResult(
                 call_id=call_id,
                 tool_name=tool_name,
                 success=True,
-                data=result if isinstance(result, dict) else {"result": result},
+                data=data,
                 sources=sources,
             )
         except Exception as exc:
@@ -77,6 +194,70 @@ class ToolRegistry:
                 error=str(exc),
             )
 
+    async def _invoke(
+        self, func: Any, tool_name: str, arguments: dict[str, Any]
+    ) -> tuple[dict[str, Any], list[str]]:
+        sem = self._host_sems.get(TOOL_HOSTS.get(tool_name, ""))
+        if sem is None:
+            result = await func(self.http, **arguments)
+        else:
+            async with sem:
+                result = await func(self.http, **arguments)
+        sources = result.pop("_sources", []) if isinstance(result, dict) else []
+        data = result if isinstance(result, dict) else {"result": result}
+        # Soft failures come back as {"error": ...}; don't pin those
+        if tool_name in CACHEABLE_TOOLS and "error" not in data:
+            self.cache.put(tool_name, arguments, data, sources)
+        return data, sources
+
+    async def _single_flight(
+        self, func: Any, tool_name: str, arguments: dict[str, Any]
+    ) -> tuple[dict[str, Any], list[str], bool]:
+        """Run a read-only call, or join the identical one already in flight.
+
+        The upstream call runs as its own task, so a caller that is cancelled
+        (e.g. by ``wait_for``) doesn't fail the others waiting on it. Joiners
+        get their own copy of the result; the flag says whether we joined.
+        """
+        key = ToolCache._key(tool_name, arguments)
+        flight = self._inflight.get(key)
+        joined = flight is not None
+        if flight is None:
+            flight = asyncio.ensure_future(self._invoke(func, tool_name, arguments))
+            self._inflight[key] = flight
+            flight.add_done_callback(functools.partial(self._land, key))
+
+        data, sources = await asyncio.shield(flight)
+        if joined:
+            return copy.deepcopy(data), list(sources), True
+        return data, sources, False
+
+    def _land(self, key: tuple[str, str], flight: asyncio.Future) -> None:
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        if not flight.cancelled():
+            flight.exception()  # retrieved here even if every caller went away
+
+    async def call_many(
+        self,
+        specs: list[tuple[str, dict[str, Any]]],
+        parent_call_id: str | None = None,
+    ) -> list[ToolResult]:
+        """Run independent ``(tool_name, arguments)`` calls concurrently.
+
+        Results come back in input order; a call that raises is reported as a
+        failed :class:`ToolResult` rather than propagated.
+        """
+        results = await asyncio.gather(
+            *(self.call(name, args, parent_call_id) for name, args in specs),
+            return_exceptions=True,
+        )
+        return [
+            ToolResult(call_id="", tool_name=name, success=False, error=str(r))
+            if isinstance(r, BaseException) else r
+            for (name, _), r in zip(specs, results, strict=True)
+        ]
+
     @property
     def available_tools(self) -> list[str]:
         return list(self._tools)
@@ -132,7 +313,8 @@ async def _cancer_literature(
     query = f'"{gene_symbol}" AND ("cancer" OR "oncogene" OR "tumor suppressor")'
     if cancer_type:
         query += f' AND "{cancer_type}"'
-    resp = await http.get(
+    async with http.stream(
+        "GET",
         "https://www.ebi.ac.uk/europepmc/webservices/rest/search",
         params={
             "query": query,
@@ -141,40 +323,97 @@ async def _cancer_literature(
             "pageSize": "25",
             "sort": "CITED desc",
         },
-    )
-    resp.raise_for_status()
-    data = resp.json()
-    results = data.get("resultList", {}).get("result", [])
-    articles = [
-        {
-            "pmid": r.get("pmid", ""),
-            "title": r.get("title", ""),
-            "abstract": r.get("abstractText", ""),
-            "authors": r.get("authorString", ""),
-            "journal": r.get("journalTitle", ""),
-            "year": r.get("pubYear", ""),
-            "doi": r.get("doi", ""),
-            "cited_by": r.get("citedByCount", 0),
-        }
-        for r in results
-    ]
+    ) as resp:
+        resp.raise_for_status()
+        articles = [
+            {
+                "pmid": r.get("pmid", ""),
+                "title": r.get("title", ""),
+                "abstract": r.get("abstractText", ""),
+                "authors": r.get("authorString", ""),
+                "journal": r.get("journalTitle", ""),
+                "year": r.get("pubYear", ""),
+                "doi": r.get("doi", ""),
+                "cited_by": r.get("citedByCount", 0),
+            }
+            async for r in _europepmc_results(resp)
+        ]
     return {"articles": articles, "_sources": ["https://europepmc.org"]}
 
 
+# "core" EuropePMC responses carry full abstracts and metadata; above this size
+# (or with no Content-Length) results are parsed one record at a time.
+_STREAM_PARSE_BYTES = 256 * 1024
+
+
+class _ByteStreamReader:
+    """Async file-like view of a streamed response body, for ijson."""
+
+    def __init__(self, resp: httpx.Response) -> None:
+        self._chunks = resp.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:  # ijson probes with read(0) to tell bytes from str
+            return b""
+        return await anext(self._chunks, b"")
+
+
+async def _europepmc_results(resp: httpx.Response) -> AsyncIterator[dict[str, Any]]:
+    """Yield the ``resultList.result`` records of a streamed EuropePMC response.
+
+    Small responses are read whole and parsed with orjson. Large ones are
+    stream-parsed, so only one record is held in memory at a time.
+    """
+    length = resp.headers.get("content-length")
+    if length is not None and int(length) <= _STREAM_PARSE_BYTES:
+        data = orjson.loads(await resp.aread())
+        for r in data.get("resultList", {}).get("result", []):
+            yield r
+        return
+
+    async for r in ijson.items(_ByteStreamReader(resp), "resultList.result.item"):
+        yield r
+
+
 async def _pmid_validate(http: httpx.AsyncClient, pmid: str, **kw) -> dict[str, Any]:
-    resp = await http.get(
-        "https://www.ebi.ac.uk/europepmc/webservices/rest/search",
-        params={"query": f"EXT_ID:{pmid}", "format": "json", "pageSize": "1"},
-    )
-    resp.raise_for_status()
-    data = resp.json()
-    results = data.get("resultList", {}).get("result", [])
-    valid = len(results) > 0
+    batch = await _pmid_validate_batch(http, [pmid])
+    hit = batch["results"][pmid]
     return {
         "pmid": pmid,
-        "valid": valid,
-        "title": results[0].get("title", "") if valid else "",
-        "_sources": [f"https://europepmc.org/article/MED/{pmid}"] if valid else [],
+        "valid": hit["valid"],
+        "title": hit["title"],
+        "_sources": batch["_sources"],
+    }
+
+
+async def _pmid_validate_batch(
+    http: httpx.AsyncClient, pmids: list[str], **kw
+) -> dict[str, Any]:
+    """Validate many PMIDs with one ``(EXT_ID:a OR ...) AND SRC:MED`` EuropePMC query.
+
+    ``EXT_ID`` also matches non-MEDLINE records (preprints, patents), which have
+    no ``pmid`` and would otherwise use up the ``pageSize`` slots.
+    """
+    found: dict[str, str] = {}
+    if pmids:
+        resp = await http.get(
+            "https://www.ebi.ac.uk/europepmc/webservices/rest/search",
+            params={
+                "query": "(" + " OR ".join(f"EXT_ID:{p}" for p in pmids) + ") AND SRC:MED",
+                "resultType": "lite",
+                "format": "json",
+                "pageSize": str(len(pmids)),
+            },
+        )
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+        for r in data.get("resultList", {}).get("result", []):
+            found.setdefault(str(r.get("pmid", "")), r.get("title", ""))
+
+    results = {p: {"valid": p in found, "title": found.get(p, "")} for p in pmids}
+    return {
+        "results": results,
+        "_sources": [f"https://europepmc.org/article/MED/{p}" for p in pmids if p in found],
     }
 
 
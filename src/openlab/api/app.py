@@ -17,7 +17,12 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage shared resources: httpx client + DB auto-create in dev mode."""
-    app.state.http = httpx.AsyncClient(timeout=30.0, follow_redirects=True)
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        follow_redirects=True,
+    )
 
     # Auto-create SQLite tables in dev mode (no alembic needed for quick start)
     if config.database.url.startswith("sqlite"):
@@ -44,6 +44,7 @@ class ProvenanceEntryOut(BaseModel):
     sources: list[str] = Field(default_factory=list)
     parent_call_id: str | None = None
     error: str | None = None
+    cache_hit: bool = False
 
 
 class ClaimOut(BaseModel):
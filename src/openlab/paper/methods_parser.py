@@ -14,7 +14,7 @@ from openlab.paper.protocol_models import ExtractedProtocol, ProtocolStep, Reage
 logger = logging.getLogger(__name__)
 
 # Technique detection patterns
-_TECHNIQUE_PATTERNS = [
+_TECHNIQUE_PATTERNS = [(re.compile(pattern), name) for pattern, name in [
     (r"(?i)\b(RNA[- ]?seq(?:uencing)?)\b", "RNA-seq"),
     (r"(?i)\b(ChIP[- ]?seq(?:uencing)?)\b", "ChIP-seq"),
     (r"(?i)\b(ATAC[- ]?seq(?:uencing)?)\b", "ATAC-seq"),
@@ -33,7 +33,7 @@ _TECHNIQUE_PATTERNS = [
     (r"(?i)\b(CRISPR|Cas9)\b", "CRISPR"),
     (r"(?i)\b(immunohistochemistry|IHC)\b", "immunohistochemistry"),
     (r"(?i)\b(qPCR|RT-qPCR|quantitative PCR)\b", "qPCR"),
-]
+]]
 
 # Reagent patterns
 _REAGENT_PATTERN = re.compile(
@@ -48,6 +48,18 @@ _DURATION_PATTERN = re.compile(
     r"(\d+[\.\d]*)\s*(min(?:ute)?s?|h(?:our)?s?|sec(?:ond)?s?|days?)"
 )
 
+# Organism detection patterns
+_ORGANISM_PATTERNS = [(re.compile(pattern), name) for pattern, name in [
+    (r"(?i)\b(Homo sapiens|human)\b", "Homo sapiens"),
+    (r"(?i)\b(Mus musculus|mouse|mice)\b", "Mus musculus"),
+    (r"(?i)\b(Escherichia coli|E\. coli)\b", "Escherichia coli"),
+    (r"(?i)\b(Saccharomyces cerevisiae|yeast)\b", "Saccharomyces cerevisiae"),
+    (r"(?i)\b(Drosophila melanogaster|fruit fly)\b", "Drosophila melanogaster"),
+    (r"(?i)\b(Caenorhabditis elegans|C\. elegans)\b", "Caenorhabditis elegans"),
+    (r"(?i)\b(Danio rerio|zebrafish)\b", "Danio rerio"),
+    (r"(?i)\b(Arabidopsis thaliana)\b", "Arabidopsis thaliana"),
+]]
+
 
 def parse_methods(
     methods_text: str,
@@ -100,7 +112,7 @@ def _detect_techniques(text: str) -> list[str]:
     """Detect bioinformatics/lab techniques mentioned in text."""
     found = []
     for pattern, name in _TECHNIQUE_PATTERNS:
-        if re.search(pattern, text) and name not in found:
+        if pattern.search(text) and name not in found:
             found.append(name)
     return found
 
@@ -175,17 +187,7 @@ def _extract_reagents(text: str) -> list[Reagent]:
 def _detect_organisms(text: str) -> list[str]:
     """Detect organism names mentioned in text."""
     organisms = []
-    patterns = [
-        (r"(?i)\b(Homo sapiens|human)\b", "Homo sapiens"),
-        (r"(?i)\b(Mus musculus|mouse|mice)\b", "Mus musculus"),
-        (r"(?i)\b(Escherichia coli|E\. coli)\b", "Escherichia coli"),
-        (r"(?i)\b(Saccharomyces cerevisiae|yeast)\b", "Saccharomyces cerevisiae"),
-        (r"(?i)\b(Drosophila melanogaster|fruit fly)\b", "Drosophila melanogaster"),
-        (r"(?i)\b(Caenorhabditis elegans|C\. elegans)\b", "Caenorhabditis elegans"),
-        (r"(?i)\b(Danio rerio|zebrafish)\b", "Danio rerio"),
-        (r"(?i)\b(Arabidopsis thaliana)\b", "Arabidopsis thaliana"),
-    ]
-    for pattern, name in patterns:
-        if re.search(pattern, text) and name not in organisms:
+    for pattern, name in _ORGANISM_PATTERNS:
+        if pattern.search(text) and name not in organisms:
             organisms.append(name)
     return organisms
@@ -8,6 +8,11 @@ import yaml
 
 from openlab.paper.protocol_models import PipelineConfig
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,7 +33,7 @@ def validate_yaml(yaml_str: str) -> list[str]:
 
     # Parse YAML
     try:
-        data = yaml.safe_load(yaml_str)
+        data = yaml.load(yaml_str, Loader=_SafeLoader)
     except yaml.YAMLError as e:
         return [f"Invalid YAML: {e}"]
 
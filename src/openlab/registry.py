@@ -42,6 +42,7 @@ class SourceRegistration:
 
 # Global registries — populated by contrib modules at import time
 _source_registry: dict[str, SourceRegistration] = {}
+_sources_by_group: dict[str, dict[str, SourceRegistration]] = {}
 _evidence_type_map: dict[str, Any] = {}
 _convergence_weights: dict[str, float] = {}
 
@@ -66,7 +67,11 @@ def register_source(
         description=description,
         group=group,
     )
+    previous = _source_registry.get(name)
+    if previous is not None:
+        _sources_by_group.get(previous.group, {}).pop(name, None)
     _source_registry[name] = reg
+    _sources_by_group.setdefault(group, {})[name] = reg
     _evidence_type_map[name] = evidence_type
     _convergence_weights[name] = convergence_weight
     logger.debug("Registered evidence source: %s (%s)", name, group)
@@ -82,6 +87,11 @@ def list_registered_sources() -> dict[str, SourceRegistration]:
     return dict(_source_registry)
 
 
+def list_registered_sources_by_group(group: str) -> dict[str, SourceRegistration]:
+    """Return the registered sources in one group."""
+    return dict(_sources_by_group.get(group, {}))
+
+
 def get_evidence_type_map() -> dict[str, Any]:
     """Return the current source -> EvidenceType mapping."""
     return dict(_evidence_type_map)
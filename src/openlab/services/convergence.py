@@ -13,6 +13,9 @@ from __future__ import annotations
 import random
 from typing import Any
 
+import numpy as np
+from scipy import sparse
+
 from openlab.services.evidence_normalizer import NormalizedEvidence, normalize_evidence
 
 # Source-specific weights for convergence scoring.
@@ -70,27 +73,9 @@ def compute_convergence(evidence_list: list[dict[str, Any]]) -> float:
     if len(normalized) < 2:
         return 1.0 if normalized else 0.0
 
-    total_weighted_sim = 0.0
-    total_weight = 0.0
-
-    for i in range(len(normalized)):
-        ev_i, norm_i = normalized[i]
-        w_i = _get_weight(ev_i)
-
-        for j in range(i + 1, len(normalized)):
-            ev_j, norm_j = normalized[j]
-            w_j = _get_weight(ev_j)
-
-            sim = _pairwise_agreement(norm_i, norm_j)
-            pair_weight = w_i * w_j
-            total_weighted_sim += sim * pair_weight
-            total_weight += pair_weight
-
-    if total_weight == 0:
-        return 0.0
-
-    score = total_weighted_sim / total_weight
-    return round(max(0.0, min(1.0, score)), 3)
+    return _weighted_agreement(
+        [norm for _, norm in normalized], [_get_weight(ev) for ev, _ in normalized]
+    )
 
 
 # --- Tier definitions for dossier convergence ---
@@ -255,82 +240,129 @@ def _pairwise_agreement(a: NormalizedEvidence, b: NormalizedEvidence) -> float:
       - Keyword bigram overlap × 0.8
       - Keyword unigram Jaccard × 0.3
     """
+    return _set_agreement(_agreement_sets(a), _agreement_sets(b))
+
+
+# Layer weights in _pairwise_agreement order; a layer only counts towards the
+# weighted average when at least one side of the pair has terms in it.
+_LAYER_WEIGHTS = (3.0, 2.0, 1.5, 0.5, 0.8, 0.3)
+_EC_LAYER = 1
+_EC_PREFIX = len(_LAYER_WEIGHTS)  # extra slot: EC numbers truncated to 3 levels
+
+# Below this many records the pairwise loop beats building sparse matrices.
+_MATRIX_MIN_RECORDS = 48
+# Total pair weight below which there is nothing to average.
+_MIN_TOTAL_WEIGHT = 1e-6
+
+
+def _agreement_sets(norm: NormalizedEvidence) -> tuple[frozenset[str], ...]:
+    """The per-layer term sets of one record, built once rather than per pair."""
+    return (
+        frozenset(norm.go_terms),
+        frozenset(norm.ec_numbers),
+        frozenset(c for c in norm.categories if ":" in c),
+        frozenset(c.split(":")[0] for c in norm.categories),
+        frozenset(_make_bigrams(norm.keywords)),
+        frozenset(norm.keywords),
+        frozenset(".".join(ec.split(".")[:3]) for ec in norm.ec_numbers),
+    )
+
+
+def _set_agreement(a: tuple[frozenset[str], ...], b: tuple[frozenset[str], ...]) -> float:
     total_score = 0.0
     total_weight = 0.0
-
-    # GO term Jaccard
-    if a.go_terms or b.go_terms:
-        if a.go_terms and b.go_terms:
-            union = a.go_terms | b.go_terms
-            jaccard = len(a.go_terms & b.go_terms) / len(union) if union else 0.0
-        else:
-            jaccard = 0.0
-        total_score += jaccard * 3.0
-        total_weight += 3.0
-
-    # EC number agreement
-    if a.ec_numbers or b.ec_numbers:
-        if a.ec_numbers and b.ec_numbers:
-            if a.ec_numbers & b.ec_numbers:
-                ec_score = 1.0
-            else:
-                a_prefixes = {".".join(ec.split(".")[:3]) for ec in a.ec_numbers}
-                b_prefixes = {".".join(ec.split(".")[:3]) for ec in b.ec_numbers}
-                ec_score = 0.7 if a_prefixes & b_prefixes else 0.0
-        else:
-            ec_score = 0.0
-        total_score += ec_score * 2.0
-        total_weight += 2.0
-
-    # Subcategory match (fine-grained, categories with ':')
-    a_sub = {c for c in a.categories if ":" in c}
-    b_sub = {c for c in b.categories if ":" in c}
-    if a_sub or b_sub:
-        if a_sub and b_sub:
-            union = a_sub | b_sub
-            jaccard = len(a_sub & b_sub) / len(union) if union else 0.0
-        else:
-            jaccard = 0.0
-        total_score += jaccard * 1.5
-        total_weight += 1.5
-
-    # Broad category match (parent before ':')
-    a_broad = {c.split(":")[0] for c in a.categories} if a.categories else set()
-    b_broad = {c.split(":")[0] for c in b.categories} if b.categories else set()
-    if a_broad or b_broad:
-        if a_broad and b_broad:
-            union = a_broad | b_broad
-            jaccard = len(a_broad & b_broad) / len(union) if union else 0.0
-        else:
-            jaccard = 0.0
-        total_score += jaccard * 0.5
-        total_weight += 0.5
-
-    # Keyword bigram overlap
-    a_bigrams = _make_bigrams(a.keywords)
-    b_bigrams = _make_bigrams(b.keywords)
-    if a_bigrams or b_bigrams:
-        if a_bigrams and b_bigrams:
-            union = a_bigrams | b_bigrams
-            jaccard = len(a_bigrams & b_bigrams) / len(union) if union else 0.0
-        else:
-            jaccard = 0.0
-        total_score += jaccard * 0.8
-        total_weight += 0.8
-
-    # Keyword unigram Jaccard
-    if a.keywords or b.keywords:
-        if a.keywords and b.keywords:
-            union = a.keywords | b.keywords
-            jaccard = len(a.keywords & b.keywords) / len(union) if union else 0.0
+    for layer, weight in enumerate(_LAYER_WEIGHTS):
+        terms_a, terms_b = a[layer], b[layer]
+        if not (terms_a or terms_b):
+            continue
+        if not (terms_a and terms_b):
+            score = 0.0
+        elif layer != _EC_LAYER:
+            score = len(terms_a & terms_b) / len(terms_a | terms_b)
+        elif terms_a & terms_b:
+            score = 1.0
         else:
-            jaccard = 0.0
-        total_score += jaccard * 0.3
-        total_weight += 0.3
+            score = 0.7 if a[_EC_PREFIX] & b[_EC_PREFIX] else 0.0
+        total_score += score * weight
+        total_weight += weight
 
     return total_score / total_weight if total_weight > 0 else 0.0
 
 
+def _intersection_counts(term_sets: list[frozenset[str]]) -> np.ndarray:
+    """|A ∩ B| for every pair of sets, as X @ X.T over a one-hot term matrix.
+
+    The diagonal holds the set sizes.
+    """
+    term_index: dict[str, int] = {}
+    rows: list[int] = []
+    cols: list[int] = []
+    for i, terms in enumerate(term_sets):
+        for term in terms:
+            rows.append(i)
+            cols.append(term_index.setdefault(term, len(term_index)))
+
+    x = sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)),
+        shape=(len(term_sets), max(len(term_index), 1)),
+    )
+    return (x @ x.T).toarray()
+
+
+def _agreement_matrix(sets: list[tuple[frozenset[str], ...]]) -> np.ndarray:
+    """_set_agreement for every pair of records at once."""
+    n = len(sets)
+    total_score = np.zeros((n, n))
+    total_weight = np.zeros((n, n))
+
+    for layer, weight in enumerate(_LAYER_WEIGHTS):
+        inter = _intersection_counts([s[layer] for s in sets])
+        size = np.diag(inter)
+        present = (size[:, None] > 0) | (size[None, :] > 0)
+        if layer == _EC_LAYER:
+            prefix_inter = _intersection_counts([s[_EC_PREFIX] for s in sets])
+            score = np.where(inter > 0, 1.0, np.where(prefix_inter > 0, 0.7, 0.0))
+        else:
+            union = size[:, None] + size[None, :] - inter
+            score = np.divide(inter, union, out=np.zeros((n, n)), where=union > 0)
+        total_score += np.where(present, score * weight, 0.0)
+        total_weight += np.where(present, weight, 0.0)
+
+    return np.divide(
+        total_score, total_weight, out=np.zeros((n, n)), where=total_weight > 0
+    )
+
+
+def _weighted_agreement(norms: list[NormalizedEvidence], weights: list[float]) -> float:
+    """Source-weighted mean of pairwise agreement over all pairs of records.
+
+    Each pair counts with the product of its two source weights. Large
+    inputs go through sparse matrix products instead of the pairwise loop.
+    """
+    sets = [_agreement_sets(norm) for norm in norms]
+    n = len(sets)
+
+    if n >= _MATRIX_MIN_RECORDS:
+        upper = np.triu_indices(n, k=1)
+        w = np.asarray(weights)
+        pair_weights = np.outer(w, w)[upper]
+        total_weighted_sim = float(_agreement_matrix(sets)[upper] @ pair_weights)
+        total_weight = float(pair_weights.sum())
+    else:
+        total_weighted_sim = 0.0
+        total_weight = 0.0
+        for i in range(n):
+            for j in range(i + 1, n):
+                pair_weight = weights[i] * weights[j]
+                total_weighted_sim += _set_agreement(sets[i], sets[j]) * pair_weight
+                total_weight += pair_weight
+
+    if total_weight < _MIN_TOTAL_WEIGHT:
+        return 0.0
+
+    return round(max(0.0, min(1.0, total_weighted_sim / total_weight)), 3)
+
+
 def compute_convergence_from_orm(evidence_rows: list) -> float:
     """Compute convergence from ORM Evidence rows (DB-backed entry point).
 
@@ -363,26 +395,9 @@ def compute_convergence_from_orm(evidence_rows: list) -> float:
         source = (ev.payload or {}).get("source", "")
         return ORM_SOURCE_WEIGHTS.get(source, 0.5)
 
-    total_weighted_sim = 0.0
-    total_weight = 0.0
-
-    for i in range(len(normalized)):
-        ev_i, norm_i = normalized[i]
-        w_i = _orm_weight(ev_i)
-
-        for j in range(i + 1, len(normalized)):
-            ev_j, norm_j = normalized[j]
-            w_j = _orm_weight(ev_j)
-
-            sim = _pairwise_agreement(norm_i, norm_j)
-            pair_weight = w_i * w_j
-            total_weighted_sim += sim * pair_weight
-            total_weight += pair_weight
-
-    if total_weight == 0:
-        return 0.0
-
-    return round(max(0.0, min(1.0, total_weighted_sim / total_weight)), 3)
+    return _weighted_agreement(
+        [norm for _, norm in normalized], [_orm_weight(ev) for ev, _ in normalized]
+    )
 
 
 def _make_bigrams(keywords: set[str]) -> set[str]:
@@ -3,6 +3,7 @@
 import tempfile
 from pathlib import Path
 
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from openlab.exceptions import ImportError_, ParseError
@@ -23,22 +24,33 @@ def _is_unknown_function(product: str | None) -> bool:
     )
 
 
-def _parsed_gene_to_model(pg: ParsedGene) -> Gene:
-    """Convert a parsed gene dataclass to a Gene ORM model."""
-    essentiality = "unknown"
-
-    return Gene(
-        locus_tag=pg.locus_tag,
-        name=pg.name,
-        sequence=pg.sequence,
-        protein_sequence=pg.protein_sequence,
-        length=pg.length,
-        strand=pg.strand,
-        start=pg.start,
-        end=pg.end,
-        product=pg.product,
-        essentiality=essentiality,
-    )
+def _parsed_gene_row(pg: ParsedGene) -> dict:
+    """Convert a parsed gene dataclass to Gene column values for a bulk insert."""
+    return {
+        "locus_tag": pg.locus_tag,
+        "name": pg.name,
+        "sequence": pg.sequence,
+        "protein_sequence": pg.protein_sequence,
+        "length": pg.length,
+        "strand": pg.strand,
+        "start": pg.start,
+        "end": pg.end,
+        "product": pg.product,
+        "essentiality": "unknown",
+    }
+
+
+# Locus tags per IN (...) lookup, well under SQLite's bound-parameter limit
+_LOOKUP_BATCH = 500
+
+
+def _existing_locus_tags(db: Session, locus_tags: list[str]) -> set[str]:
+    """Which of ``locus_tags`` are already in the genes table."""
+    existing: set[str] = set()
+    for i in range(0, len(locus_tags), _LOOKUP_BATCH):
+        batch = locus_tags[i:i + _LOOKUP_BATCH]
+        existing.update(db.scalars(select(Gene.locus_tag).where(Gene.locus_tag.in_(batch))))
+    return existing
 
 
 def import_genbank(db: Session, path: Path | str) -> dict:
@@ -52,19 +64,22 @@ def import_genbank(db: Session, path: Path | str) -> dict:
     except Exception as exc:
         raise ParseError(f"Failed to parse GenBank file: {exc}") from exc
 
-    imported = 0
+    # One lookup for all locus tags and one multi-row INSERT, instead of a
+    # query plus ORM add per gene. Repeats within the file are skipped too.
+    seen = _existing_locus_tags(db, [pg.locus_tag for pg in result.genes])
+    rows = []
     skipped = 0
     for pg in result.genes:
-        existing = db.query(Gene).filter(Gene.locus_tag == pg.locus_tag).first()
-        if existing:
+        if pg.locus_tag in seen:
             skipped += 1
             continue
+        seen.add(pg.locus_tag)
+        rows.append(_parsed_gene_row(pg))
 
-        gene = _parsed_gene_to_model(pg)
-        db.add(gene)
-        imported += 1
-
+    if rows:
+        db.execute(insert(Gene), rows)
     db.commit()
+    imported = len(rows)
 
     unknown_count = sum(
         1 for pg in result.genes if _is_unknown_function(pg.product)
@@ -92,27 +107,28 @@ def import_fasta(db: Session, path: Path | str) -> dict:
     except Exception as exc:
         raise ParseError(f"Failed to parse FASTA file: {exc}") from exc
 
-    imported = 0
+    seen = _existing_locus_tags(db, [entry.id for entry in entries])
+    rows = []
     skipped = 0
     for entry in entries:
-        existing = db.query(Gene).filter(Gene.locus_tag == entry.id).first()
-        if existing:
+        if entry.id in seen:
             skipped += 1
             continue
-
-        gene = Gene(
-            locus_tag=entry.id,
-            sequence=entry.sequence,
-            length=entry.length,
-            strand=0,
-            start=0,
-            end=entry.length,
-            notes=entry.description,
-        )
-        db.add(gene)
-        imported += 1
-
+        seen.add(entry.id)
+        rows.append({
+            "locus_tag": entry.id,
+            "sequence": entry.sequence,
+            "length": entry.length,
+            "strand": 0,
+            "start": 0,
+            "end": entry.length,
+            "notes": entry.description,
+        })
+
+    if rows:
+        db.execute(insert(Gene), rows)
     db.commit()
+    imported = len(rows)
     return {
         "file": str(path),
         "total_entries": len(entries),
@@ -161,11 +177,11 @@ def import_genome_from_text(db: Session, genbank_text: str) -> dict:
     db.add(genome)
     db.flush()
 
-    for pg in result.genes:
-        gene = _parsed_gene_to_model(pg)
-        gene.genome_id = genome.genome_id
-        db.add(gene)
-
+    if result.genes:
+        db.execute(
+            insert(Gene),
+            [{**_parsed_gene_row(pg), "genome_id": genome.genome_id} for pg in result.genes],
+        )
     db.commit()
 
     unknown_count = sum(1 for pg in result.genes if _is_unknown_function(pg.product))
@@ -1,10 +1,14 @@
 """Gene expression simulation module.
 
 First-order transcription and translation with degradation, coupled to
-metabolic resource availability. Runs interleaved with metabolism.
+metabolic resource availability. Runs interleaved with metabolism. All
+per-gene work is vectorized over the state arrays; stochastic mode draws
+one batched Poisson sample per array rather than one per gene.
 """
 from __future__ import annotations
 
+import numpy as np
+
 from openlab.models import CellSpecGene
 from openlab.simulation.state import CellState
 
@@ -37,87 +41,161 @@ class GeneExpressionModule:
         self._genes = genes
         self._stochastic = stochastic
 
+        # Per-gene constants, laid out in spec order to match the state arrays
+        self._locus_tags = [gene.locus_tag for gene in genes]
+        self._gene_rates = np.array(
+            [gene.expression_rate if gene.expression_rate is not None else 1.0 for gene in genes],
+            dtype=np.float64,
+        )
+        # Essential unknown genes: maintain minimum protein level
+        self._min_protein_mask = np.array(
+            [gene.classification == "unknown" and not gene.predicted_function for gene in genes],
+            dtype=bool,
+        )
+
+        # Reused per-step work arrays; nothing here outlives a single step
+        n_genes = len(genes)
+        self._scratch: dict[str, np.ndarray] = {
+            name: np.empty(n_genes, dtype=np.float64)
+            for name in ("modifier", "txn_rate", "tln_rate", "new_mrna", "new_protein")
+        }
+
+        # Bind the synthesis variant once instead of branching every step;
+        # a spec without genes has nothing to express.
+        if not genes:
+            self.step = _no_op_step
+        else:
+            self.step = self._step_stochastic if stochastic else self._step_deterministic
+
     def step(self, state: CellState, dt: float) -> None:
-        """Execute one gene expression timestep."""
-        atp_conc = state.get_metabolite("atp")
-        aa_conc = state.get_metabolite("aa_pool")
-
-        atp_factor = atp_conc / (KM_ATP + atp_conc) if (KM_ATP + atp_conc) > 0 else 0.0
-        aa_factor = aa_conc / (KM_AA + aa_conc) if (KM_AA + aa_conc) > 0 else 0.0
-
-        has_metabolites = "atp" in state.metabolite_index
-
-        txn_resource = atp_factor if has_metabolites else 1.0
-        tln_resource = (atp_factor * aa_factor) if has_metabolites else 1.0
-
-        total_atp_consumed = 0.0
-        total_gtp_consumed = 0.0
-        total_ntp_consumed = 0.0
-        total_aa_consumed = 0.0
-
-        for i, gene in enumerate(self._genes):
-            if state.is_knocked_out(gene.locus_tag):
-                state.mrna_counts[i] = max(
-                    0.0, state.mrna_counts[i] - MRNA_DEGRADATION_RATE * state.mrna_counts[i] * dt
-                )
-                state.protein_counts[i] = max(
-                    0.0, state.protein_counts[i] - PROTEIN_DEGRADATION_RATE * state.protein_counts[i] * dt
-                )
-                continue
-
-            gene_rate = gene.expression_rate if gene.expression_rate is not None else 1.0
-
-            # Apply expression modifier and methylation penalty
-            modifier = state.gene_expression_modifiers[i]
-            methylation_penalty = 1.0 - state.methylation[i] * 0.8
-            effective_modifier = modifier * methylation_penalty
-
-            eff_txn_rate = BASE_TRANSCRIPTION_RATE * txn_resource * gene_rate * effective_modifier
-            eff_tln_rate = BASE_TRANSLATION_RATE * tln_resource * gene_rate * effective_modifier
-
-            # Transcription
-            mrna = state.mrna_counts[i]
-            if self._stochastic:
-                new_mrna = float(state.rng.poisson(max(0.0, eff_txn_rate * dt)))
-            else:
-                new_mrna = eff_txn_rate * dt
-            degraded_mrna = MRNA_DEGRADATION_RATE * mrna * dt
-            state.mrna_counts[i] = max(0.0, mrna + new_mrna - degraded_mrna)
-
-            if new_mrna > 0 and has_metabolites:
-                ntp_cost = new_mrna * AVG_MRNA_LENGTH * NTP_PER_NUCLEOTIDE
-                total_atp_consumed += ntp_cost * 0.25
-                total_gtp_consumed += ntp_cost * 0.25
-                total_ntp_consumed += ntp_cost * 0.50
-
-            # Translation
-            protein = state.protein_counts[i]
-            if self._stochastic:
-                new_protein = float(state.rng.poisson(max(0.0, eff_tln_rate * state.mrna_counts[i] * dt)))
-            else:
-                new_protein = eff_tln_rate * state.mrna_counts[i] * dt
-            degraded_protein = PROTEIN_DEGRADATION_RATE * protein * dt
-            state.protein_counts[i] = max(0.0, protein + new_protein - degraded_protein)
-
-            if new_protein > 0 and has_metabolites:
-                total_atp_consumed += new_protein * AVG_PROTEIN_LENGTH * ATP_PER_AMINO_ACID
-                total_gtp_consumed += new_protein * AVG_PROTEIN_LENGTH * GTP_PER_AMINO_ACID
-                total_aa_consumed += new_protein * AVG_PROTEIN_LENGTH * AA_PER_AMINO_ACID
-
-            # Essential unknown genes: maintain minimum protein level
-            if gene.classification == "unknown" and not gene.predicted_function:
-                state.protein_counts[i] = max(state.protein_counts[i], 20.0)
-
-        # Convert molecule counts to concentration changes (mM)
+        """Execute one gene expression timestep.
+
+        Instances rebind ``step`` to the stochastic or deterministic variant in
+        ``__init__`` so the hot path carries no per-call mode branch.
+        """
+        if self._stochastic:
+            self._step_stochastic(state, dt)
+        else:
+            self._step_deterministic(state, dt)
+
+    def _step_deterministic(self, state: CellState, dt: float) -> None:
+        eff_txn_rate, eff_tln_rate, min_protein_mask, has_metabolites = self._rates(state)
+        scratch = self._scratch
+
+        new_mrna = np.multiply(eff_txn_rate, dt, out=scratch["new_mrna"])
+        _decay_and_add(state.mrna_counts, 1.0 - MRNA_DEGRADATION_RATE * dt, new_mrna)
+
+        new_protein = np.multiply(eff_tln_rate, state.mrna_counts, out=scratch["new_protein"])
+        np.multiply(new_protein, dt, out=new_protein)
+        _decay_and_add(state.protein_counts, 1.0 - PROTEIN_DEGRADATION_RATE * dt, new_protein)
+        np.maximum(state.protein_counts, 20.0, out=state.protein_counts, where=min_protein_mask)
+
+        if has_metabolites:
+            # Only positive synthesis draws on resources
+            mrna_made = float(np.maximum(new_mrna, 0.0, out=new_mrna).sum())
+            protein_made = float(np.maximum(new_protein, 0.0, out=new_protein).sum())
+            _consume_resources(state, mrna_made, protein_made)
+
+    def _step_stochastic(self, state: CellState, dt: float) -> None:
+        eff_txn_rate, eff_tln_rate, min_protein_mask, has_metabolites = self._rates(state)
+        scratch = self._scratch
+
+        # Poisson lambdas are built in scratch; the draws themselves are fresh arrays
+        lam = np.multiply(eff_txn_rate, dt, out=scratch["new_mrna"])
+        new_mrna = state.rng.poisson(np.maximum(lam, 0.0, out=lam))
+        _decay_and_add(state.mrna_counts, 1.0 - MRNA_DEGRADATION_RATE * dt, new_mrna)
+
+        lam = np.multiply(eff_tln_rate, state.mrna_counts, out=scratch["new_protein"])
+        np.multiply(lam, dt, out=lam)
+        new_protein = state.rng.poisson(np.maximum(lam, 0.0, out=lam))
+        _decay_and_add(state.protein_counts, 1.0 - PROTEIN_DEGRADATION_RATE * dt, new_protein)
+        np.maximum(state.protein_counts, 20.0, out=state.protein_counts, where=min_protein_mask)
+
+        if has_metabolites:
+            _consume_resources(state, float(new_mrna.sum()), float(new_protein.sum()))
+
+    def _rates(
+        self, state: CellState
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, bool]:
+        """Per-gene transcription/translation rates, protein-floor mask, resource flag."""
+        has_metabolites = state.has_metabolites
         if has_metabolites:
-            volume_l = state.volume * 1e-15
-            mol_to_mm = 1.0 / (6.022e23 * volume_l) * 1e3
-
-            total_energy_cost = total_atp_consumed + total_gtp_consumed
-            _consume_metabolite(state, "atp", total_energy_cost * mol_to_mm)
-            _consume_metabolite(state, "aa_pool", total_aa_consumed * mol_to_mm)
-            _consume_metabolite(state, "ctp", total_ntp_consumed * 0.5 * mol_to_mm)
-            _consume_metabolite(state, "utp", total_ntp_consumed * 0.5 * mol_to_mm)
+            atp_conc = state.get_metabolite("atp")
+            aa_conc = state.get_metabolite("aa_pool")
+
+            atp_factor = atp_conc / (KM_ATP + atp_conc) if (KM_ATP + atp_conc) > 0 else 0.0
+            aa_factor = aa_conc / (KM_AA + aa_conc) if (KM_AA + aa_conc) > 0 else 0.0
+
+            txn_resource = atp_factor
+            tln_resource = atp_factor * aa_factor
+        else:
+            txn_resource = tln_resource = 1.0
+
+        # Apply expression modifier and methylation penalty
+        scratch = self._scratch
+        effective_modifier = np.multiply(state.methylation, -0.8, out=scratch["modifier"])
+        np.add(effective_modifier, 1.0, out=effective_modifier)
+        np.multiply(effective_modifier, state.gene_expression_modifiers, out=effective_modifier)
+        np.multiply(effective_modifier, self._gene_rates, out=effective_modifier)
+
+        eff_txn_rate = np.multiply(
+            effective_modifier, BASE_TRANSCRIPTION_RATE * txn_resource, out=scratch["txn_rate"]
+        )
+        eff_tln_rate = np.multiply(
+            effective_modifier, BASE_TRANSLATION_RATE * tln_resource, out=scratch["tln_rate"]
+        )
+
+        # Knocked-out genes only degrade
+        knocked_out = self._knockout_mask(state)
+        min_protein_mask = self._min_protein_mask
+        if knocked_out is not None:
+            eff_txn_rate[knocked_out] = 0.0
+            eff_tln_rate[knocked_out] = 0.0
+            min_protein_mask = min_protein_mask & ~knocked_out
+
+        return eff_txn_rate, eff_tln_rate, min_protein_mask, has_metabolites
+
+    def _knockout_mask(self, state: CellState) -> np.ndarray | None:
+        """Boolean mask of knocked-out genes, or None when nothing is knocked out."""
+        if not state.knocked_out_genes:
+            return None
+        return np.fromiter(
+            (state.is_knocked_out(tag) for tag in self._locus_tags),
+            dtype=bool,
+            count=len(self._locus_tags),
+        )
+
+
+def _no_op_step(state: CellState, dt: float) -> None:
+    return None
+
+
+def _decay_and_add(counts: np.ndarray, decay: float, synthesized: np.ndarray) -> None:
+    """Degrade-then-synthesize in place: decay, add, clamp at zero."""
+    np.multiply(counts, decay, out=counts)
+    np.add(counts, synthesized, out=counts)
+    np.maximum(counts, 0.0, out=counts)
+
+
+def _consume_resources(state: CellState, mrna_made: float, protein_made: float) -> None:
+    """Charge this step's synthesized mRNA and protein against the metabolite pools."""
+    ntp_cost = mrna_made * AVG_MRNA_LENGTH * NTP_PER_NUCLEOTIDE
+    aa_used = protein_made * AVG_PROTEIN_LENGTH
+
+    total_atp_consumed = ntp_cost * 0.25 + aa_used * ATP_PER_AMINO_ACID
+    total_gtp_consumed = ntp_cost * 0.25 + aa_used * GTP_PER_AMINO_ACID
+    total_ntp_consumed = ntp_cost * 0.50
+    total_aa_consumed = aa_used * AA_PER_AMINO_ACID
+
+    # Convert molecule counts to concentration changes (mM)
+    volume_l = state.volume * 1e-15
+    mol_to_mm = 1.0 / (6.022e23 * volume_l) * 1e3
+
+    total_energy_cost = total_atp_consumed + total_gtp_consumed
+    _consume_metabolite(state, "atp", total_energy_cost * mol_to_mm)
+    _consume_metabolite(state, "aa_pool", total_aa_consumed * mol_to_mm)
+    _consume_metabolite(state, "ctp", total_ntp_consumed * 0.5 * mol_to_mm)
+    _consume_metabolite(state, "utp", total_ntp_consumed * 0.5 * mol_to_mm)
 
 
 def _consume_metabolite(state: CellState, met_id: str, amount: float) -> None:
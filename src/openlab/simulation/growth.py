@@ -22,6 +22,13 @@ class GrowthModule:
 
     def __init__(self, stochastic: bool = False):
         self._stochastic = stochastic
+        # Bind mode-specific threshold jitter and partitioning once
+        if stochastic:
+            self._division_threshold = _stochastic_threshold
+            self._partition = _partition_stochastic
+        else:
+            self._division_threshold = _deterministic_threshold
+            self._partition = _partition_deterministic
 
     def step(self, state: CellState, dt: float) -> bool:
         """Execute one growth timestep. Returns True if division occurred."""
@@ -40,11 +47,7 @@ class GrowthModule:
 
         state.mass_accumulated = state.dry_mass
 
-        threshold = DIVISION_MASS_THRESHOLD
-        if self._stochastic:
-            threshold *= state.rng.lognormal(0, 0.05)
-
-        if state.dry_mass >= threshold:
+        if state.dry_mass >= self._division_threshold(state):
             self._divide(state)
             return True
         return False
@@ -54,17 +57,33 @@ class GrowthModule:
         state.division_count += 1
         state.generation += 1
 
-        if self._stochastic:
-            state.protein_counts = state.rng.binomial(
-                state.protein_counts.astype(np.int64).clip(0), 0.5
-            ).astype(np.float64)
-            state.mrna_counts = state.rng.binomial(
-                state.mrna_counts.astype(np.int64).clip(0), 0.5
-            ).astype(np.float64)
-        else:
-            state.protein_counts *= 0.5
-            state.mrna_counts *= 0.5
+        self._partition(state)
 
         state.dry_mass *= 0.5
         state.volume *= 0.5
         state.mass_accumulated = 0.0
+
+
+def _binomial_halve(rng: np.random.Generator, counts: np.ndarray) -> None:
+    """Binomially partition molecule counts between daughters, in place."""
+    n = counts.astype(np.int64)
+    np.maximum(n, 0, out=n)
+    np.copyto(counts, rng.binomial(n, 0.5))
+
+
+def _deterministic_threshold(state: CellState) -> float:
+    return DIVISION_MASS_THRESHOLD
+
+
+def _stochastic_threshold(state: CellState) -> float:
+    return DIVISION_MASS_THRESHOLD * state.rng.lognormal(0, 0.05)
+
+
+def _partition_deterministic(state: CellState) -> None:
+    state.protein_counts *= 0.5
+    state.mrna_counts *= 0.5
+
+
+def _partition_stochastic(state: CellState) -> None:
+    _binomial_halve(state.rng, state.protein_counts)
+    _binomial_halve(state.rng, state.mrna_counts)
@@ -21,9 +21,13 @@ class MetabolismModule:
 
     def step(self, state: CellState, dt: float) -> None:
         """Execute one metabolism timestep."""
+        if not self._reactions:
+            return
+
         for rxn in self._reactions:
             rate = self._compute_rate(rxn, state)
-            if not math.isfinite(rate) or rate <= 0:
+            # Rejects NaN, +inf and non-positive rates in one comparison
+            if not 0.0 < rate < math.inf:
                 continue
 
             # Flux limit: cap rate so no substrate goes negative
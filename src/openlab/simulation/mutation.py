@@ -5,6 +5,8 @@ distribution ensures most mutations are mild with occasional large effects.
 """
 from __future__ import annotations
 
+import numpy as np
+
 from openlab.models import CellSpecGene
 from openlab.simulation.state import CellState
 
@@ -19,11 +21,13 @@ class MutationModule:
         self, state: CellState, genes: list[CellSpecGene]
     ) -> None:
         """Roll for mutations on each gene after a division event."""
-        for i, gene in enumerate(genes):
-            if state.rng.random() < self.mutation_rate:
-                # Log-normal: mean-neutral, ~15% std dev
-                factor = state.rng.lognormal(0, 0.15)
-                state.gene_expression_modifiers[i] *= factor
-                state.mutations[gene.locus_tag] = float(
-                    state.gene_expression_modifiers[i]
-                )
+        mutated = np.flatnonzero(state.rng.random(len(genes)) < self.mutation_rate)
+        if mutated.size == 0:
+            return
+
+        # Log-normal: mean-neutral, ~15% std dev
+        state.gene_expression_modifiers[mutated] *= state.rng.lognormal(
+            0, 0.15, size=mutated.size
+        )
+        for i in mutated:
+            state.mutations[genes[i].locus_tag] = float(state.gene_expression_modifiers[i])
@@ -5,9 +5,9 @@ resource competition, stochastic division, mutations, and epigenetics.
 """
 from __future__ import annotations
 
-import copy
 import logging
 import math
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 
@@ -28,7 +28,18 @@ REPLENISH_RATE = 0.05
 
 
 class PopulationEngine:
-    """Multi-cell population simulation on a 2D nutrient grid."""
+    """Multi-cell population simulation on a 2D nutrient grid.
+
+    ``on_progress(pct, time, snapshot)`` is called every 100 macro-steps with a
+    lightweight snapshot: the same keys as a recorded snapshot minus
+    ``nutrient_field``. The payload is never shared with the returned results,
+    so callbacks may mutate or JSON-encode it freely.
+    """
+
+    # Moore neighbourhood, used for daughter placement
+    _NEIGHBOR_OFFSETS = np.array(
+        [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)]
+    )
 
     def __init__(
         self,
@@ -38,12 +49,17 @@ class PopulationEngine:
         on_progress: callable | None = None,
     ):
         self.spec = spec
+        self.seed = seed
         self.grid_size = spec.simulation_parameters.grid_size
         self.rng = np.random.default_rng(seed)
         self._on_progress = on_progress
 
         # Grid state
         self.cells: dict[tuple[int, int], CellState] = {}
+        self._occupied = np.zeros((self.grid_size, self.grid_size), dtype=bool)
+        # Per-site aggregates for snapshots, refreshed as cells step or are placed
+        self._growth_rates = np.zeros((self.grid_size, self.grid_size), dtype=np.float64)
+        self._mutation_counts = np.zeros((self.grid_size, self.grid_size), dtype=np.int64)
         self.nutrient_field = np.full(
             (self.grid_size, self.grid_size), BASE_GLUCOSE, dtype=np.float64
         )
@@ -53,6 +69,7 @@ class PopulationEngine:
         cell = CellState.from_spec(spec, seed=seed)
         cell.cell_id = 0
         self.cells[(center, center)] = cell
+        self._occupied[center, center] = True
         self._next_cell_id = 1
 
         # Shared modules
@@ -67,7 +84,11 @@ class PopulationEngine:
         self._diffusion_rate = spec.simulation_parameters.nutrient_diffusion_rate
 
     def run(self, duration: float) -> list[dict]:
-        """Run population simulation, return list of snapshot dicts."""
+        """Run population simulation, return list of JSON-ready snapshot dicts.
+
+        Nutrient grids are held as array copies while running and converted
+        to nested lists in one pass at the end (see :func:`serialize_snapshots`).
+        """
         snapshots: list[dict] = []
         record_interval = 60.0
         next_record_time = 0.0
@@ -75,13 +96,15 @@ class PopulationEngine:
         total_macro_steps = math.ceil(duration / self._expression_dt)
 
         snapshots.append(self._snapshot(0.0))
+        last_snapshot = snapshots[-1]
 
         for step_idx in range(total_macro_steps):
             current_time = (step_idx + 1) * self._expression_dt
             self._step_all(num_sub_steps)
 
             if current_time >= next_record_time:
-                snapshots.append(self._snapshot(current_time))
+                last_snapshot = self._snapshot(current_time)
+                snapshots.append(last_snapshot)
                 next_record_time += record_interval
 
             if (step_idx + 1) % 100 == 0:
@@ -91,10 +114,38 @@ class PopulationEngine:
                     f"cells={len(self.cells)}"
                 )
                 if self._on_progress:
-                    self._on_progress(pct, current_time, self._snapshot(current_time))
+                    self._on_progress(
+                        pct, current_time, self._progress_snapshot(current_time, last_snapshot)
+                    )
 
         snapshots.append(self._snapshot(duration))
-        return snapshots
+        return serialize_snapshots(snapshots)
+
+    def run_replicates(
+        self, duration: float, n_replicates: int, n_workers: int | None = None
+    ) -> list[list[dict]]:
+        """Run independent replicates of this spec in a process pool.
+
+        Each replicate starts from a fresh engine with its own seed, spawned
+        from this engine's seed, so results are reproducible. ``on_progress``
+        is not forwarded to worker processes.
+        """
+        seeds = [
+            int(child.generate_state(1)[0])
+            for child in np.random.SeedSequence(self.seed).spawn(n_replicates)
+        ]
+        spec_json = self.spec.model_dump_json()
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            futures = [pool.submit(_run_one, spec_json, s, duration) for s in seeds]
+            return [future.result() for future in futures]
+
+    def _progress_snapshot(self, time: float, recorded: dict) -> dict:
+        """Lightweight snapshot for ``on_progress``, reusing ``recorded`` if taken at ``time``."""
+        if recorded["time"] != time:
+            return self._snapshot(time, lightweight=True)
+        progress = {k: v for k, v in recorded.items() if k != "nutrient_field"}
+        progress["cells"] = [dict(cell) for cell in recorded["cells"]]
+        return progress
 
     def _step_all(self, num_sub_steps: int) -> None:
         """One macro-step: run all cells, diffuse nutrients, handle divisions."""
@@ -119,6 +170,8 @@ class PopulationEngine:
 
             # Epigenetics
             self._epigenetics.step(cell, self.spec.genes)
+            self._growth_rates[pos] = cell.growth_rate
+            self._mutation_counts[pos] = len(cell.mutations)
 
             # Write back consumed nutrients
             consumed_glucose = cell.get_metabolite("glucose")
@@ -138,24 +191,17 @@ class PopulationEngine:
 
     def _try_place_daughter(self, parent_pos: tuple[int, int]) -> bool:
         """Clone parent state into a random empty neighbor. Returns False if blocked."""
-        r, c = parent_pos
-        neighbors = []
-        for dr in (-1, 0, 1):
-            for dc in (-1, 0, 1):
-                if dr == 0 and dc == 0:
-                    continue
-                nr = (r + dr) % self.grid_size
-                nc = (c + dc) % self.grid_size
-                if (nr, nc) not in self.cells:
-                    neighbors.append((nr, nc))
-
-        if not neighbors:
+        coords = (np.asarray(parent_pos) + self._NEIGHBOR_OFFSETS) % self.grid_size
+        free = np.flatnonzero(~self._occupied[coords[:, 0], coords[:, 1]])
+        if free.size == 0:
             return False
 
-        target = neighbors[self.rng.integers(len(neighbors))]
+        nr, nc = coords[free[self.rng.integers(free.size)]]
+        target = (int(nr), int(nc))
         parent = self.cells[parent_pos]
 
-        # Create daughter as deep copy of parent state
+        # Create daughter as deep copy of parent state; knockout/mutation
+        # containers are usually empty, so only copy them when populated.
         daughter = CellState(
             time=parent.time,
             metabolite_concentrations=parent.metabolite_concentrations.copy(),
@@ -168,10 +214,10 @@ class PopulationEngine:
             growth_rate=parent.growth_rate,
             mass_accumulated=0.0,
             division_count=parent.division_count,
-            knocked_out_genes=set(parent.knocked_out_genes),
+            knocked_out_genes=set(parent.knocked_out_genes) if parent.knocked_out_genes else None,
             rng=np.random.default_rng(self.rng.integers(2**31)),
             gene_expression_modifiers=parent.gene_expression_modifiers.copy(),
-            mutations=dict(parent.mutations),
+            mutations=dict(parent.mutations) if parent.mutations else None,
             methylation=parent.methylation.copy(),
             cell_id=self._next_cell_id,
             parent_id=parent.cell_id,
@@ -179,20 +225,22 @@ class PopulationEngine:
         )
         self._next_cell_id += 1
         self.cells[target] = daughter
+        self._occupied[target] = True
+        self._growth_rates[target] = daughter.growth_rate
+        self._mutation_counts[target] = len(daughter.mutations)
         return True
 
-    def _snapshot(self, time: float) -> dict:
-        """Capture population snapshot as dict."""
+    def _snapshot(self, time: float, *, lightweight: bool = False) -> dict:
+        """Capture population snapshot as dict.
+
+        With ``lightweight=True`` the nutrient grid is omitted (progress updates).
+        """
         cells_data = []
-        total_mutations = 0
         max_gen = 0
-        fitness_sum = 0.0
 
         for (r, c), cell in self.cells.items():
             mutation_count = len(cell.mutations)
-            total_mutations += mutation_count
             max_gen = max(max_gen, cell.generation)
-            fitness_sum += cell.growth_rate
 
             cells_data.append(
                 CellSnapshotData(
@@ -208,13 +256,32 @@ class PopulationEngine:
             )
 
         n_cells = len(self.cells)
-        return {
+        fitness_sum = float(np.sum(self._growth_rates, dtype=np.float64))
+        total_mutations = int(self._mutation_counts.sum())
+        snap = {
             "time": time,
             "total_cells": n_cells,
             "grid_size": self.grid_size,
             "cells": cells_data,
-            "nutrient_field": self.nutrient_field.tolist(),
             "mean_fitness": fitness_sum / n_cells if n_cells > 0 else 0.0,
             "total_mutations": total_mutations,
             "generations_max": max_gen,
         }
+        if not lightweight:
+            snap["nutrient_field"] = self.nutrient_field.copy()
+        return snap
+
+
+def _run_one(spec_json: str, seed: int, duration: float) -> list[dict]:
+    """Process-pool entry point: rebuild an engine from a serialized spec and run it."""
+    engine = PopulationEngine(CellSpec.model_validate_json(spec_json), seed=seed)
+    return engine.run(duration)
+
+
+def serialize_snapshots(snapshots: list[dict]) -> list[dict]:
+    """Convert snapshot nutrient grids to nested lists in a single pass after a run."""
+    return [
+        {**snap, "nutrient_field": snap["nutrient_field"].tolist()}
+        if isinstance(snap.get("nutrient_field"), np.ndarray) else snap
+        for snap in snapshots
+    ]
@@ -5,6 +5,8 @@ concentrations, protein counts, and mRNA counts.
 """
 from __future__ import annotations
 
+from functools import cached_property
+
 import numpy as np
 
 from openlab.models import CellSpec
@@ -106,6 +108,11 @@ class CellState:
             rng=np.random.default_rng(seed),
         )
 
+    @cached_property
+    def has_metabolites(self) -> bool:
+        """Whether this state tracks metabolite pools (resource-coupled expression)."""
+        return "atp" in self.metabolite_index
+
     def is_knocked_out(self, locus_tag: str) -> bool:
         return locus_tag in self.knocked_out_genes
 
@@ -1,16 +1,27 @@
 """Sparse stoichiometric matrix (metabolites x reactions).
 
-Uses scipy.sparse COO format for storage efficiency.
+Built from scipy.sparse COO triples and stored in CSC format.
 """
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
 
 import numpy as np
 from scipy import sparse
 
 from openlab.models import CellSpecReaction, CellSpecMetabolite
 
+try:
+    from numba import njit, prange
+except ImportError:  # optional: pip install openlab[simulation]
+    njit = None
+    prange = range
+
 
 @dataclass
 class MassBalanceResult:
@@ -24,37 +35,51 @@ class MassBalanceResult:
 class StoichiometricMatrix:
     """Sparse stoichiometric matrix S where S[i,j] is the coefficient of
     metabolite i in reaction j. Negative = consumed, positive = produced.
+
+    Stored as CSC since most consumers read by reaction (column). Treat
+    ``matrix`` as immutable once constructed: the CSR view used for row access
+    and ``compute_flux`` is cached on first use.
+
+    Networks whose coefficients are all small integers are stored as ``int16``
+    to cut the bytes SpMV has to stream; every accessor still returns float64.
     """
 
     def __init__(
         self,
         metabolite_ids: list[str],
         reaction_ids: list[str],
-        matrix: sparse.coo_matrix | None = None,
+        matrix: sparse.spmatrix | None = None,
     ):
-        self.metabolite_ids = metabolite_ids
-        self.reaction_ids = reaction_ids
-        self._met_index = {mid: i for i, mid in enumerate(metabolite_ids)}
-        self._rxn_index = {rid: i for i, rid in enumerate(reaction_ids)}
+        # Copied so a memoized instance can't change under the caller's lists
+        self.metabolite_ids = list(metabolite_ids)
+        self.reaction_ids = list(reaction_ids)
+        self._met_index = {mid: i for i, mid in enumerate(self.metabolite_ids)}
+        self._rxn_index = {rid: i for i, rid in enumerate(self.reaction_ids)}
+        self._compiled_spmv: Callable[[np.ndarray, np.ndarray], np.ndarray] | None = None
 
         if matrix is not None:
-            self.matrix = matrix.tocsr()
+            self.matrix = matrix.tocsc()
         else:
-            self.matrix = sparse.csr_matrix(
+            self.matrix = sparse.csc_matrix(
                 (len(metabolite_ids), len(reaction_ids))
             )
 
+        # The matrix is immutable, so its sizes are fixed at construction
+        self._n_met = len(metabolite_ids)
+        self._n_rxn = len(reaction_ids)
+        self._nnz = int(self.matrix.nnz)
+
     @property
     def num_metabolites(self) -> int:
-        return len(self.metabolite_ids)
+        return self._n_met
 
     @property
     def num_reactions(self) -> int:
-        return len(self.reaction_ids)
+        return self._n_rxn
 
     @property
     def num_nonzero(self) -> int:
-        return self.matrix.nnz
+        return self._nnz
 
     @classmethod
     def from_reactions(
@@ -62,76 +87,157 @@ class StoichiometricMatrix:
         reactions: list[CellSpecReaction],
         metabolites: list[CellSpecMetabolite],
     ) -> StoichiometricMatrix:
-        """Build from lists of Reaction and Metabolite models."""
+        """Build from lists of Reaction and Metabolite models.
+
+        Memoized on the content of the inputs; see :func:`_memoized`.
+        """
+        key = _fingerprint(
+            cls.__qualname__,
+            "reactions",
+            [m.id for m in metabolites],
+            [
+                (
+                    r.id,
+                    [(p.metabolite_id, p.coefficient) for p in r.substrates],
+                    [(p.metabolite_id, p.coefficient) for p in r.products],
+                )
+                for r in reactions
+            ],
+        )
+        return _memoized(key, lambda: cls._build_from_reactions(reactions, metabolites))
+
+    @classmethod
+    def _build_from_reactions(
+        cls,
+        reactions: list[CellSpecReaction],
+        metabolites: list[CellSpecMetabolite],
+    ) -> StoichiometricMatrix:
         met_ids = [m.id for m in metabolites]
         rxn_ids = [r.id for r in reactions]
         met_index = {mid: i for i, mid in enumerate(met_ids)}
 
-        rows: list[int] = []
-        cols: list[int] = []
-        vals: list[float] = []
+        # Upper bound on nonzeros; entries for unknown metabolites are dropped
+        capacity = sum(len(r.substrates) + len(r.products) for r in reactions)
+        rows = np.empty(capacity, dtype=np.int32)
+        cols = np.empty(capacity, dtype=np.int32)
+        vals = np.empty(capacity, dtype=np.float64)
 
+        k = 0
         for j, rxn in enumerate(reactions):
-            for sub in rxn.substrates:
-                mi = met_index.get(sub.metabolite_id)
-                if mi is not None:
-                    rows.append(mi)
-                    cols.append(j)
-                    vals.append(-abs(sub.coefficient))
-
-            for prod in rxn.products:
-                mi = met_index.get(prod.metabolite_id)
-                if mi is not None:
-                    rows.append(mi)
-                    cols.append(j)
-                    vals.append(abs(prod.coefficient))
-
-        coo = sparse.coo_matrix(
-            (vals, (rows, cols)),
-            shape=(len(met_ids), len(rxn_ids)),
-        )
-
-        return cls(met_ids, rxn_ids, coo)
+            for participants, sign in ((rxn.substrates, -1.0), (rxn.products, 1.0)):
+                for p in participants:
+                    mi = met_index.get(p.metabolite_id)
+                    if mi is not None:
+                        rows[k] = mi
+                        cols[k] = j
+                        vals[k] = sign * abs(p.coefficient)
+                        k += 1
+
+        csc = _csc_from_triples(rows[:k], cols[:k], vals[:k], (len(met_ids), len(rxn_ids)))
+        return cls(met_ids, rxn_ids, csc)
 
     def get(self, metabolite_idx: int, reaction_idx: int) -> float:
         return float(self.matrix[metabolite_idx, reaction_idx])
 
+    @cached_property
+    def _csr(self) -> sparse.csr_matrix:
+        return self.matrix.tocsr()
+
     def get_reaction_column(self, reaction_idx: int) -> np.ndarray:
-        return np.asarray(self.matrix[:, reaction_idx].todense()).flatten()
+        return _dense_slice(self.matrix, reaction_idx, self.num_metabolites)
 
     def get_metabolite_row(self, metabolite_idx: int) -> np.ndarray:
-        return np.asarray(self.matrix[metabolite_idx, :].todense()).flatten()
+        return _dense_slice(self._csr, metabolite_idx, self.num_reactions)
 
     def compute_flux(self, rates: np.ndarray) -> np.ndarray:
-        """dC/dt = S @ v"""
-        return np.asarray(self.matrix @ rates).flatten()
+        """dC/dt = S @ v
+
+        ``rates`` holds one rate per reaction; a ``(num_reactions, 1)`` column
+        vector is accepted and flattened.
+        """
+        # The numba kernels index ``rates`` without bounds checks, so validate here
+        rates = np.ascontiguousarray(rates, dtype=np.float64).reshape(-1)
+        if rates.shape != (self.num_reactions,):
+            raise ValueError(
+                f"rates has {rates.size} entries, expected one per reaction "
+                f"({self.num_reactions})"
+            )
+        if self._compiled_spmv is not None:
+            out = np.empty(self.num_metabolites, dtype=np.float64)
+            return self._compiled_spmv(rates, out)
+        if njit is None:
+            return np.asarray(self.matrix @ rates).flatten()
+        m = self._csr
+        out = np.empty(self.num_metabolites, dtype=np.float64)
+        kernel = _csr_matvec_par if self.num_metabolites > _PARALLEL_MIN_ROWS else _csr_matvec
+        return kernel(m.data, m.indices, m.indptr, rates, out)
+
+    def compute_flux_batch(self, rates: np.ndarray) -> np.ndarray:
+        """Fluxes for many rate vectors at once: S @ V.
+
+        ``rates`` has shape ``(num_reactions, n_samples)``; the result has shape
+        ``(num_metabolites, n_samples)``.
+        """
+        return np.asarray(self.matrix @ np.asfortranarray(rates, dtype=np.float64))
+
+    def compile_spmv(self) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+        """Generate an SpMV with this matrix's coefficients and structure hard-coded.
+
+        The returned ``spmv(x, out)`` is straight-line code, one assignment per
+        metabolite, JIT-compiled with numba when available. Once compiled,
+        ``compute_flux`` uses it for every call.
+
+        The kernel is cached on the instance, so it is shared by every caller
+        holding the same memoized matrix. That is safe because it depends only on
+        the immutable ``matrix`` and returns the same values as the uncompiled path.
+        """
+        if self._compiled_spmv is None:
+            csr = self._csr
+            lines = ["def spmv(x, out):"]
+            for i in range(self.num_metabolites):
+                start, end = csr.indptr[i], csr.indptr[i + 1]
+                terms = " + ".join(
+                    f"{float(csr.data[k])!r} * x[{int(csr.indices[k])}]"
+                    for k in range(start, end)
+                )
+                lines.append(f"    out[{i}] = {terms or '0.0'}")
+            lines.append("    return out")
+
+            namespace: dict = {}
+            exec(compile("\n".join(lines), "<stoichiometric spmv>", "exec"), namespace)
+            spmv = namespace["spmv"]
+            self._compiled_spmv = njit(fastmath=True)(spmv) if njit is not None else spmv
+        return self._compiled_spmv
 
     def check_mass_balance(self) -> list[MassBalanceResult]:
-        results = []
-        dense = self.matrix.toarray()
+        data, indptr = self.matrix.data, self.matrix.indptr
 
-        for j in range(self.num_reactions):
-            col = dense[:, j]
-            nonzero_mask = col != 0
-            sum_coeff = float(col.sum())
-            n_participants = int(nonzero_mask.sum())
-            balanced = abs(sum_coeff) < 1e-6 or n_participants <= 2
+        # Per-column sums and participant counts straight from the CSC arrays
+        sums = np.zeros(self.num_reactions, dtype=np.float64)
+        nonempty = np.diff(indptr) > 0
+        if nonempty.any():
+            sums[nonempty] = np.add.reduceat(data, indptr[:-1][nonempty])
+        nonzero = np.concatenate(([0], np.cumsum(data != 0)))
+        counts = nonzero[indptr[1:]] - nonzero[indptr[:-1]]
+        balanced = (np.abs(sums) < 1e-6) | (counts <= 2)
 
-            results.append(MassBalanceResult(
-                reaction_id=self.reaction_ids[j],
-                sum_coefficients=sum_coeff,
-                num_participants=n_participants,
-                balanced=balanced,
-            ))
-
-        return results
+        return [
+            MassBalanceResult(
+                reaction_id=rid,
+                sum_coefficients=float(total),
+                num_participants=int(n),
+                balanced=bool(ok),
+            )
+            for rid, total, n, ok in zip(self.reaction_ids, sums, counts, balanced, strict=True)
+        ]
 
     def to_coo_list(self) -> list[list[float]]:
         coo = self.matrix.tocoo()
-        return [
-            [float(r), float(c), float(v)]
-            for r, c, v in zip(coo.row, coo.col, coo.data)
-        ]
+        triples = np.empty((coo.nnz, 3), dtype=np.float64)
+        triples[:, 0] = coo.row
+        triples[:, 1] = coo.col
+        triples[:, 2] = coo.data
+        return triples.tolist()
 
     @classmethod
     def from_coo_list(
@@ -139,19 +245,162 @@ class StoichiometricMatrix:
         coo_list: list[list[float]],
         metabolite_ids: list[str],
         reaction_ids: list[str],
+    ) -> StoichiometricMatrix:
+        """Build from ``[row, col, value]`` triples, memoized on content."""
+        key = _fingerprint(cls.__qualname__, "coo", metabolite_ids, reaction_ids, coo_list)
+        return _memoized(
+            key, lambda: cls._build_from_coo_list(coo_list, metabolite_ids, reaction_ids)
+        )
+
+    @classmethod
+    def _build_from_coo_list(
+        cls,
+        coo_list: list[list[float]],
+        metabolite_ids: list[str],
+        reaction_ids: list[str],
     ) -> StoichiometricMatrix:
         if not coo_list:
             return cls(metabolite_ids, reaction_ids)
 
-        rows = [int(entry[0]) for entry in coo_list]
-        cols = [int(entry[1]) for entry in coo_list]
-        vals = [entry[2] for entry in coo_list]
+        triples = np.asarray(coo_list, dtype=np.float64)
+        csc = _csc_from_triples(
+            triples[:, 0].astype(np.int32),
+            triples[:, 1].astype(np.int32),
+            triples[:, 2],
+            (len(metabolite_ids), len(reaction_ids)),
+        )
+        return cls(metabolite_ids, reaction_ids, csc)
+
+    def to_npz(self, path: str | Path) -> None:
+        """Persist as packed numpy arrays (compressed ``.npz``).
 
-        coo = sparse.coo_matrix(
-            (vals, (rows, cols)),
-            shape=(len(metabolite_ids), len(reaction_ids)),
+        Far more compact than :meth:`to_coo_list` for large networks, and
+        :meth:`from_npz` loads it without any Python-level parsing.
+        """
+        coo = self.matrix.tocoo()
+        np.savez_compressed(
+            path,
+            row=coo.row.astype(np.int32),
+            col=coo.col.astype(np.int32),
+            data=coo.data,
+            met_ids=np.array(self.metabolite_ids, dtype=str),
+            rxn_ids=np.array(self.reaction_ids, dtype=str),
         )
-        return cls(metabolite_ids, reaction_ids, coo)
+
+    @classmethod
+    def from_npz(cls, path: str | Path) -> StoichiometricMatrix:
+        """Load a matrix written by :meth:`to_npz`."""
+        with np.load(path) as f:
+            met_ids = f["met_ids"].tolist()
+            rxn_ids = f["rxn_ids"].tolist()
+            coo = sparse.coo_matrix(
+                (f["data"], (f["row"], f["col"])),
+                shape=(len(met_ids), len(rxn_ids)),
+            )
+        return cls(met_ids, rxn_ids, coo)
 
     def to_dense(self) -> np.ndarray:
-        return self.matrix.toarray()
+        return self.matrix.toarray().astype(np.float64, copy=False)
+
+
+# Recently built matrices keyed on an input fingerprint. Instances are shared
+# between callers, so they must be treated as immutable.
+_MEMO_SIZE = 8
+_memo: OrderedDict[bytes, StoichiometricMatrix] = OrderedDict()
+
+# Above this many metabolites compute_flux splits the rows across threads;
+# below it the thread start-up costs more than the extra memory bandwidth buys.
+_PARALLEL_MIN_ROWS = 1024
+
+
+def _fingerprint(*parts: object) -> bytes:
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).digest()
+
+
+def _memoized(
+    key: bytes, build: Callable[[], StoichiometricMatrix]
+) -> StoichiometricMatrix:
+    """Return the cached matrix for ``key``, building (and evicting LRU) on a miss."""
+    cached = _memo.get(key)
+    if cached is not None:
+        _memo.move_to_end(key)
+        return cached
+    matrix = _memo[key] = build()
+    if len(_memo) > _MEMO_SIZE:
+        _memo.popitem(last=False)
+    return matrix
+
+
+def _csc_from_triples(
+    rows: np.ndarray, cols: np.ndarray, vals: np.ndarray, shape: tuple[int, int]
+) -> sparse.csc_matrix:
+    """Build a canonical CSC matrix from COO triples without SciPy's sort-and-sum.
+
+    Triples are sorted by (column, row) and duplicates summed here, so the
+    arrays can be handed to ``csc_matrix`` as-is.
+    """
+    if vals.size:
+        order = np.lexsort((rows, cols))
+        rows, cols, vals = rows[order], cols[order], vals[order]
+        first = np.empty(vals.size, dtype=bool)
+        first[0] = True
+        first[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+        starts = np.flatnonzero(first)
+        rows, cols, vals = rows[starts], cols[starts], np.add.reduceat(vals, starts)
+
+    indptr = np.zeros(shape[1] + 1, dtype=np.int32)
+    np.cumsum(np.bincount(cols, minlength=shape[1]), out=indptr[1:])
+    matrix = sparse.csc_matrix(
+        (_compact_coefficients(vals), rows.astype(np.int32, copy=False), indptr), shape=shape
+    )
+    matrix.has_canonical_format = True
+    return matrix
+
+
+def _compact_coefficients(vals: np.ndarray) -> np.ndarray:
+    """Downcast to int16 when every coefficient is an integer that fits.
+
+    Stoichiometric coefficients are almost always small integers, and SpMV on
+    the matrix is memory-bound, so the narrower payload is a direct speed-up.
+    """
+    limit = np.iinfo(np.int16).max
+    if vals.size and np.all(np.abs(vals) <= limit) and np.array_equal(vals, np.rint(vals)):
+        return vals.astype(np.int16)
+    return vals
+
+
+def _dense_slice(compressed: sparse.spmatrix, idx: int, length: int) -> np.ndarray:
+    """Densify one major-axis slice (CSR row / CSC column) from the raw arrays."""
+    start, end = compressed.indptr[idx], compressed.indptr[idx + 1]
+    out = np.zeros(length, dtype=np.float64)
+    out[compressed.indices[start:end]] = compressed.data[start:end]
+    return out
+
+
+def _csr_matvec(
+    data: np.ndarray, indices: np.ndarray, indptr: np.ndarray, x: np.ndarray, out: np.ndarray
+) -> np.ndarray:
+    """CSR sparse matrix-vector product written into ``out``."""
+    for i in range(len(indptr) - 1):
+        acc = 0.0
+        for k in range(indptr[i], indptr[i + 1]):
+            acc += data[k] * x[indices[k]]
+        out[i] = acc
+    return out
+
+
+def _csr_matvec_par(
+    data: np.ndarray, indices: np.ndarray, indptr: np.ndarray, x: np.ndarray, out: np.ndarray
+) -> np.ndarray:
+    """Row-parallel :func:`_csr_matvec`; each thread owns a disjoint slice of ``out``."""
+    for i in prange(len(indptr) - 1):
+        acc = 0.0
+        for k in range(indptr[i], indptr[i + 1]):
+            acc += data[k] * x[indices[k]]
+        out[i] = acc
+    return out
+
+
+if njit is not None:
+    _csr_matvec = njit(cache=True, fastmath=True)(_csr_matvec)
+    _csr_matvec_par = njit(parallel=True, cache=True, fastmath=True)(_csr_matvec_par)
@@ -7,19 +7,20 @@ Usage:
     python start.py dagster    — Start Dagster webserver
     python start.py all        — Start server + dashboard + dagster
     python start.py status     — Health check all services
+
+Requires the package to be installed (``pip install -e .``). Heavy imports
+are deferred into the command that needs them, so e.g. ``status`` only
+pays for httpx.
 """
 
 from __future__ import annotations
 
-import os
+import importlib.util
 import subprocess
 import sys
 import time
 from pathlib import Path
 
-# Ensure biolab is importable
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 
 def cmd_setup():
     """Initialize database, fetch genome, and import."""
@@ -128,16 +129,15 @@ def cmd_all():
     processes.append(("Dashboard (8501)", proc))
     print("  Started dashboard on :8501")
 
-    # Dagster (optional)
-    try:
-        import dagster
+    # Dagster (optional) -- only probe for it; the subprocess does the import
+    if importlib.util.find_spec("dagster") is not None:
         proc = subprocess.Popen([
             sys.executable, "-m", "dagster", "dev",
             "-p", "3000",
         ])
         processes.append(("Dagster (3000)", proc))
         print("  Started Dagster on :3000")
-    except ImportError:
+    else:
         print("  Dagster not installed, skipping (pip install dagster dagster-webserver)")
 
     print(f"\nAll services running. Press Ctrl+C to stop.\n")
@@ -0,0 +1,37 @@
+"""Parse-once GenBank fixtures for test seeding.
+
+Parsing a GenBank file is CPU-bound Python, so each fixture is parsed at most
+once per session (keyed on path and mtime) into plain ``Gene`` row dicts that
+can be bulk-inserted. Tests of the importer itself should keep calling
+``import_genbank``.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from openlab.db.models.gene import Gene
+from openlab.ingestion.genbank import parse_genbank
+from openlab.services.import_service import _parsed_gene_row
+
+FIXTURES = Path(__file__).parent / "fixtures"
+MINI_SYN3A = FIXTURES / "mini_syn3a.gb"
+
+
+@lru_cache
+def _gene_rows(path: str, mtime: float) -> tuple[dict, ...]:
+    result = parse_genbank(Path(path))
+    return tuple(_parsed_gene_row(pg) for pg in result.genes)
+
+
+def gene_rows(path: Path = MINI_SYN3A) -> list[dict]:
+    """``Gene`` rows for a GenBank fixture, as fresh dicts safe to mutate."""
+    return [dict(row) for row in _gene_rows(str(path), path.stat().st_mtime)]
+
+
+def seed_genes(db: Session, path: Path = MINI_SYN3A) -> None:
+    """Bulk-insert the fixture's genes, as ``import_genbank`` would, and flush."""
+    db.execute(insert(Gene), gene_rows(path))
+    db.flush()
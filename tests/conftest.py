@@ -1,37 +1,120 @@
+import asyncio
+
 import pytest
 from sqlalchemy import create_engine, event
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from openlab.db.models import Base
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is POSIX-only
+    uvloop = None
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop when it is installed.
+
+    The async tests talk to mocked transports that answer instantly, so they
+    spend most of their time in event-loop scheduling; uvloop's callback
+    dispatch is much cheaper.
+    """
+    if uvloop is not None:
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
 # Use SQLite for tests -- fast, no PG dependency needed
 TEST_DATABASE_URL = "sqlite://"
 
 
 @pytest.fixture(scope="session")
-def engine():
-    eng = create_engine(TEST_DATABASE_URL)
+def make_engine():
+    """Factory for in-memory SQLite engines with the test schema created.
+
+    Given a ``template`` engine, the new database is a page-for-page copy of
+    it made with SQLite's online backup API, which is far cheaper than
+    running the DDL (and any seeding) again.
+    """
+
+    def _make(template=None):
+        # One in-memory database per engine: every checkout reuses the same
+        # DBAPI connection, so the schema is created exactly once.
+        eng = create_engine(
+            TEST_DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+
+        # SQLite needs explicit FK enforcement; durability is irrelevant for tests
+        @event.listens_for(eng, "connect")
+        def set_sqlite_pragma(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.execute("PRAGMA journal_mode=MEMORY")
+            cursor.execute("PRAGMA synchronous=OFF")
+            cursor.close()
+            # Let SQLAlchemy own BEGIN so SAVEPOINTs nest inside the test transaction
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(eng, "begin")
+        def do_begin(conn):
+            conn.exec_driver_sql("BEGIN")
+
+        if template is None:
+            Base.metadata.create_all(eng)
+        else:
+            source = template.raw_connection()
+            target = eng.raw_connection()
+            try:
+                source.driver_connection.backup(target.driver_connection)
+            finally:
+                target.close()
+                source.close()
+        return eng
+
+    return _make
 
-    # SQLite needs explicit FK enforcement
-    @event.listens_for(eng, "connect")
-    def set_sqlite_pragma(dbapi_connection, connection_record):
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
 
-    Base.metadata.create_all(eng)
+@pytest.fixture(scope="session")
+def schema_template(make_engine):
+    """An untouched database with the test schema, only ever copied from."""
+    eng = make_engine()
+    yield eng
+    eng.dispose()
+
+
+@pytest.fixture()
+def fresh_engine(make_engine, schema_template):
+    """A private database per test, for code that has to really commit."""
+    eng = make_engine(template=schema_template)
+    yield eng
+    eng.dispose()
+
+
+@pytest.fixture(scope="session")
+def engine(make_engine, schema_template):
+    eng = make_engine(template=schema_template)
     yield eng
     Base.metadata.drop_all(eng)
 
 
+@pytest.fixture(scope="module")
+def connection(engine):
+    """One connection per test module; each test rolls back its own transaction."""
+    conn = engine.connect()
+    yield conn
+    conn.close()
+
+
 @pytest.fixture()
-def db(engine) -> Session:
-    connection = engine.connect()
+def db(connection) -> Session:
     transaction = connection.begin()
-    session = sessionmaker(bind=connection)()
+    # Session commits only release SAVEPOINTs inside the outer transaction
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
 
     yield session
 
     session.close()
     transaction.rollback()
-    connection.close()
@@ -1,29 +1,104 @@
 """Shared fixtures for agent tests."""
 
+import itertools
+
 import httpx
 import pytest
+import pytest_asyncio
 
 from openlab.agents.provenance import ProvenanceLedger
 from openlab.agents.tools import ToolRegistry
 
 
+def _empty_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={})
+
+
+@pytest_asyncio.fixture(scope="module")
+async def mock_http(request):
+    """An httpx.AsyncClient that doesn't make real requests, shared by the module.
+
+    Requests go to the test module's ``mock_handler`` if it defines one;
+    otherwise every request gets an empty JSON object back.
+    """
+    handler = getattr(request.module, "mock_handler", _empty_handler)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        yield client
+
+
+def counter_ids():
+    """Deterministic 12-char call ids: c00000000000, c00000000001, ..."""
+    counter = itertools.count()
+    return lambda: f"c{next(counter):011d}"
+
+
+@pytest.fixture(scope="session")
+def _session_ledger():
+    return ProvenanceLedger(run_id="test-run-001", id_factory=counter_ids())
+
+
+@pytest.fixture(autouse=True)
+def _reset_ledger(request):
+    """Empty the session ledger before every test, unless the test is marked ``no_tools``."""
+    if request.node.get_closest_marker("no_tools") is None:
+        request.getfixturevalue("_session_ledger").clear()
+
+
 @pytest.fixture
-def mock_http():
-    """An httpx.AsyncClient that doesn't make real requests."""
-    transport = httpx.MockTransport(
-        lambda req: httpx.Response(200, json={})
+def ledger(_session_ledger):
+    return _session_ledger
+
+
+@pytest.fixture(scope="module")
+def tools(mock_http, _session_ledger):
+    return ToolRegistry(mock_http, _session_ledger)
+
+
+@pytest.fixture(scope="module")
+def sample_claim():
+    from openlab.agents.agent_models import Claim
+
+    return Claim(claim_text="Test claim")
+
+
+@pytest.fixture(scope="module")
+def sample_dossier():
+    from openlab.agents.agent_models import DossierSection, GeneDossier
+
+    return GeneDossier(
+        gene_symbol="TP53",
+        ncbi_gene_id="7157",
+        cancer_type="colorectal",
+        sections=[
+            DossierSection(title="Overview", content="# Overview\nTP53 is important.")
+        ],
     )
-    return httpx.AsyncClient(transport=transport)
 
 
-@pytest.fixture
-def ledger():
-    return ProvenanceLedger(run_id="test-run-001")
+@pytest.fixture(scope="module")
+def sample_event():
+    from openlab.agents.agent_models import AgentEvent, AgentEventType
 
+    return AgentEvent(
+        event_type=AgentEventType.PROGRESS,
+        stage="test",
+        data={"key": "value"},
+        progress=0.5,
+        run_id="abc123",
+    )
 
-@pytest.fixture
-def tools(mock_http, ledger):
-    return ToolRegistry(mock_http, ledger)
+
+@pytest.fixture(scope="module")
+def sample_provenance_entry():
+    from openlab.agents.agent_models import ProvenanceEntry
+
+    return ProvenanceEntry(
+        call_id="abc",
+        tool_name="ncbi_gene_info",
+        duration_ms=150,
+        success=True,
+        sources=["https://ncbi.nlm.nih.gov"],
+    )
 
 
 @pytest.fixture
@@ -1,5 +1,8 @@
 """Tests for agent Pydantic models."""
 
+import pytest
+from pydantic import ValidationError
+
 from openlab.agents.agent_models import (
     AgentEvent,
     AgentEventType,
@@ -7,22 +10,13 @@ from openlab.agents.agent_models import (
     AgentRunStatus,
     CitationStatus,
     Claim,
-    DossierSection,
-    GeneDossier,
-    ProvenanceEntry,
     ToolCall,
     ToolResult,
 )
 
 
-def test_agent_event_creation():
-    event = AgentEvent(
-        event_type=AgentEventType.PROGRESS,
-        stage="test",
-        data={"key": "value"},
-        progress=0.5,
-        run_id="abc123",
-    )
+def test_agent_event_creation(sample_event):
+    event = sample_event
     assert event.event_type == AgentEventType.PROGRESS
     assert event.stage == "test"
     assert event.progress == 0.5
@@ -59,8 +53,8 @@ def test_tool_result():
     assert result.sources == ["http://example.com"]
 
 
-def test_claim_defaults():
-    claim = Claim(claim_text="Test claim")
+def test_claim_defaults(sample_claim):
+    claim = sample_claim
     assert claim.confidence == 0.0
     assert claim.citations == []
     assert claim.citation_status == CitationStatus.UNCHECKED
@@ -78,29 +72,16 @@ def test_claim_with_citations():
     assert len(claim.citations) == 1
 
 
-def test_gene_dossier():
-    dossier = GeneDossier(
-        gene_symbol="TP53",
-        ncbi_gene_id="7157",
-        cancer_type="colorectal",
-        sections=[
-            DossierSection(title="Overview", content="# Overview\nTP53 is important.")
-        ],
-    )
+def test_gene_dossier(sample_dossier):
+    dossier = sample_dossier
     assert dossier.gene_symbol == "TP53"
     dumped = dossier.model_dump()
     assert dumped["gene_symbol"] == "TP53"
     assert len(dumped["sections"]) == 1
 
 
-def test_provenance_entry():
-    entry = ProvenanceEntry(
-        call_id="abc",
-        tool_name="ncbi_gene_info",
-        duration_ms=150,
-        success=True,
-        sources=["https://ncbi.nlm.nih.gov"],
-    )
+def test_provenance_entry(sample_provenance_entry):
+    entry = sample_provenance_entry
     assert entry.duration_ms == 150
     assert entry.sources[0].startswith("https://")
 
@@ -112,8 +93,20 @@ def test_agent_run_record():
     assert record.gene_symbol == "BRAF"
 
 
-def test_agent_event_types():
-    # Verify all event types are valid
-    for evt in AgentEventType:
-        event = AgentEvent(event_type=evt, run_id="test")
-        assert event.event_type == evt
+@pytest.mark.parametrize("evt", list(AgentEventType))
+def test_agent_event_types(evt):
+    event = AgentEvent(event_type=evt, run_id="test")
+    assert event.event_type == evt
+
+
+def test_agent_event_is_frozen(sample_event):
+    with pytest.raises(ValidationError):
+        sample_event.stage = "changed"
+
+
+def test_constructed_event_matches_validated():
+    kwargs = {"event_type": AgentEventType.PROGRESS, "stage": "init", "run_id": "r1"}
+    built = AgentEvent.model_construct(**kwargs)
+    validated = AgentEvent(**kwargs)
+    assert built.model_dump(exclude={"timestamp"}) == validated.model_dump(exclude={"timestamp"})
+    assert built.timestamp is not None
@@ -1,5 +1,7 @@
 """Tests for critic validation."""
 
+import re
+
 import httpx
 import pytest
 
@@ -14,26 +16,23 @@ from openlab.agents.critic import (
 from openlab.agents.provenance import ProvenanceLedger
 from openlab.agents.tools import ToolRegistry
 
+_KNOWN_PMIDS = {"12345", "20301340"}
+
 
-def _europepmc_handler(request: httpx.Request) -> httpx.Response:
+def mock_handler(request: httpx.Request) -> httpx.Response:
     query = dict(request.url.params).get("query", "")
-    if "EXT_ID:12345" in query or "EXT_ID:20301340" in query:
-        return httpx.Response(
-            200,
-            json={"resultList": {"result": [{"pmid": "12345", "title": "Valid paper"}]}},
-        )
-    if "EXT_ID:99999" in query:
-        return httpx.Response(200, json={"resultList": {"result": []}})
-    return httpx.Response(200, json={"resultList": {"result": []}})
+    requested = re.findall(r"EXT_ID:(\d+)", query)
+    return httpx.Response(
+        200,
+        json={"resultList": {"result": [
+            {"pmid": pmid, "title": "Valid paper"} for pmid in requested if pmid in _KNOWN_PMIDS
+        ]}},
+    )
 
 
 @pytest.fixture
-async def critic_tools():
-    ledger = ProvenanceLedger("critic-test")
-    http = httpx.AsyncClient(transport=httpx.MockTransport(_europepmc_handler))
-    tools = ToolRegistry(http, ledger)
-    yield tools
-    await http.aclose()
+def critic_tools(mock_http):
+    return ToolRegistry(mock_http, ProvenanceLedger("critic-test"))
 
 
 async def test_validate_valid_citations(critic_tools):
@@ -123,3 +122,18 @@ async def test_full_critic(critic_tools):
     report, call_ids = await run_critic(critic_tools, claims, ["ncbi_blast", "literature"])
     assert report.claims_checked == 2
     assert isinstance(report, CriticReport)
+
+
+async def test_citations_are_validated_in_one_batch(critic_tools):
+    claims = [
+        Claim(claim_text="Known claims", citations=["PMID:12345", "PMID:20301340"]),
+        Claim(claim_text="Unknown claim", citations=["PMID:99999"]),
+    ]
+
+    validated, call_ids = await validate_citations(critic_tools, claims)
+
+    assert len(call_ids) == 1
+    entries = await critic_tools.ledger.get_entries()
+    assert [e.tool_name for e in entries] == ["pmid_validate_batch"]
+    assert validated[0].citation_status == CitationStatus.VALID
+    assert validated[1].citation_status == CitationStatus.INVALID
@@ -1,6 +1,10 @@
 """Tests for deterministic plan generation."""
 
-from openlab.agents.planner import plan_gene_dossier
+import pytest
+
+from openlab.agents.planner import iter_layers, plan_gene_dossier
+
+pytestmark = pytest.mark.no_tools
 
 
 def test_plan_gene_dossier_basic():
@@ -50,3 +54,16 @@ def test_plan_without_cancer():
     # Should still have cancer_literature step (with empty cancer_type)
     step_names = [s.tool_name for s in plan.steps]
     assert "cancer_literature" in step_names
+
+
+def test_plan_layers_follow_dependencies():
+    plan = plan_gene_dossier("TP53", "colorectal")
+    layers = [set(layer) for layer in plan.layers()]
+    assert layers[0] == {"ncbi", "ensembl", "uniprot"}
+    assert layers[1] == {"literature", "cancer_lit", "evidence"}
+    assert [len(layer) for layer in layers[2:]] == [1, 1, 1, 1]
+
+
+def test_iter_layers_falls_back_to_serial_on_cycle():
+    layers = list(iter_layers({"a": ["b"], "b": ["a"], "c": []}))
+    assert layers == [("a",), ("b",), ("c",)]
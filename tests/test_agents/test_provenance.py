@@ -37,9 +37,7 @@ async def test_nested_chain():
     assert chain[2].call_id == parent_id
 
 
-async def test_concurrent_access():
-    ledger = ProvenanceLedger("run-3")
-
+async def test_concurrent_access(ledger):
     async def _make_call(i: int):
         cid = await ledger.start_call(f"tool_{i}", {"i": i})
         await asyncio.sleep(0.01)
@@ -87,3 +85,27 @@ async def test_complete_nonexistent():
     # Should not raise
     await ledger.complete_call("nonexistent", success=True)
     assert ledger.total_calls() == 0
+
+
+async def test_clear_resets_entries():
+    ledger = ProvenanceLedger("run-8")
+    cid = await ledger.start_call("tool", {})
+    await ledger.complete_call(cid)
+    ledger.clear()
+    assert ledger.total_calls() == 0
+    assert await ledger.get_entries() == []
+    assert ledger.run_id == "run-8"
+
+
+async def test_shared_ledger_starts_empty(ledger, tools):
+    assert tools.ledger is ledger
+    assert ledger.total_calls() == 0
+    await ledger.start_call("tool", {})
+
+
+async def test_id_factory_is_used(ledger):
+    first = await ledger.start_call("tool", {})
+    second = await ledger.start_call("tool", {})
+
+    assert first.startswith("c") and len(first) == 12
+    assert int(second[1:]) == int(first[1:]) + 1
@@ -1,5 +1,7 @@
 """Tests for evidence retriever with mocked tools."""
 
+import asyncio
+
 import httpx
 import pytest
 
@@ -12,7 +14,7 @@ from openlab.agents.retriever import (
 from openlab.agents.tools import ToolRegistry
 
 
-def _mock_handler(request: httpx.Request) -> httpx.Response:
+def mock_handler(request: httpx.Request) -> httpx.Response:
     url = str(request.url)
     if "eutils.ncbi" in url and "esearch" in url:
         return httpx.Response(200, json={"esearchresult": {"idlist": ["7157"]}})
@@ -34,12 +36,8 @@ def _mock_handler(request: httpx.Request) -> httpx.Response:
 
 
 @pytest.fixture
-async def tools_with_mock():
-    ledger = ProvenanceLedger("retriever-test")
-    http = httpx.AsyncClient(transport=httpx.MockTransport(_mock_handler))
-    registry = ToolRegistry(http, ledger)
-    yield registry
-    await http.aclose()
+def tools_with_mock(mock_http):
+    return ToolRegistry(mock_http, ProvenanceLedger("retriever-test"))
 
 
 async def test_retrieve_gene_identity(tools_with_mock):
@@ -64,3 +62,21 @@ async def test_retrieve_existing_evidence(tools_with_mock):
     # Without gene_id, returns empty
     evidence, call_ids = await retrieve_existing_evidence(tools_with_mock, "TP53", None)
     assert isinstance(evidence, list)
+
+
+async def test_identity_sources_are_fetched_concurrently(tools_with_mock):
+    # Each fake source waits for the other two; a serial fan-out would deadlock
+    barrier = asyncio.Barrier(3)
+
+    async def _source(http, gene_symbol, **kw):
+        await barrier.wait()
+        return {"gene_symbol": gene_symbol}
+
+    for name in ("ncbi_gene_info", "ensembl_lookup", "uniprot_lookup"):
+        tools_with_mock._tools[name] = _source
+
+    _, call_ids, per_source = await asyncio.wait_for(
+        retrieve_gene_identity(tools_with_mock, "TP53"), timeout=1.0
+    )
+    assert len(call_ids) == 3
+    assert [s["source"] for s in per_source] == ["ncbi", "ensembl", "uniprot"]
@@ -6,7 +6,7 @@ from openlab.agents.agent_models import AgentEventType
 from openlab.agents.runner import run_dossier_agent
 
 
-def _full_mock_handler(request: httpx.Request) -> httpx.Response:
+def mock_handler(request: httpx.Request) -> httpx.Response:
     """Comprehensive mock that handles all tool calls."""
     url = str(request.url)
 
@@ -93,12 +93,10 @@ def _full_mock_handler(request: httpx.Request) -> httpx.Response:
     return httpx.Response(200, json={})
 
 
-async def test_runner_yields_events():
+async def test_runner_yields_events(mock_http):
     """Verify the runner yields a sequence of expected events."""
-    http = httpx.AsyncClient(transport=httpx.MockTransport(_full_mock_handler))
-
     event_types = []
-    async for event in run_dossier_agent("TP53", "colorectal", http=http):
+    async for event in run_dossier_agent("TP53", "colorectal", http=mock_http):
         event_types.append(event.event_type)
         assert event.run_id  # Every event has a run_id
 
@@ -108,15 +106,11 @@ async def test_runner_yields_events():
     assert AgentEventType.TOOL_STARTED in event_types
     assert AgentEventType.TOOL_COMPLETED in event_types
 
-    await http.aclose()
-
 
-async def test_runner_completes_or_fails():
+async def test_runner_completes_or_fails(mock_http):
     """Runner should end with either DOSSIER_COMPLETED or RUN_FAILED."""
-    http = httpx.AsyncClient(transport=httpx.MockTransport(_full_mock_handler))
-
     last_event = None
-    async for event in run_dossier_agent("TP53", "colorectal", http=http):
+    async for event in run_dossier_agent("TP53", "colorectal", http=mock_http):
         last_event = event
 
     assert last_event is not None
@@ -124,15 +118,25 @@ async def test_runner_completes_or_fails():
         AgentEventType.DOSSIER_COMPLETED,
         AgentEventType.RUN_FAILED,
     )
-    await http.aclose()
-
 
-async def test_runner_without_cancer_type():
-    http = httpx.AsyncClient(transport=httpx.MockTransport(_full_mock_handler))
 
+async def test_runner_without_cancer_type(mock_http):
     events = []
-    async for event in run_dossier_agent("BRAF", http=http):
+    async for event in run_dossier_agent("BRAF", http=mock_http):
         events.append(event)
 
     assert len(events) > 0
-    await http.aclose()
+
+
+async def test_runner_overlaps_evidence_with_identity(mock_http):
+    events = [event async for event in run_dossier_agent("TP53", "colorectal", http=mock_http)]
+    started = [
+        (e.event_type, e.stage) for e in events
+        if e.event_type in (AgentEventType.TOOL_STARTED, AgentEventType.TOOL_COMPLETED)
+    ]
+
+    # Evidence retrieval starts alongside identity rather than after it
+    assert started[:2] == [
+        (AgentEventType.TOOL_STARTED, "identity"),
+        (AgentEventType.TOOL_STARTED, "evidence"),
+    ]
@@ -1,6 +1,9 @@
 """Tests for claim extraction and synthesis."""
 
-from openlab.agents.synthesizer import extract_claims
+import threading
+
+from openlab.agents import synthesizer
+from openlab.agents.synthesizer import extract_claims, synthesize_section
 
 
 def test_extract_pmid_citations():
@@ -105,3 +108,25 @@ def test_footnote_map_pubmed_prefix():
     cited = [c for c in claims if not c.is_speculative]
     assert len(cited) >= 1
     assert "PMID:20301694" in cited[0].citations
+
+
+async def test_synthesize_section_extracts_claims_off_the_event_loop(tools, monkeypatch):
+    async def fake_llm(http, prompt, system_prompt=None, **kw):
+        return {"response": "TP53 is a tumor suppressor [PMID:20301340] (0.9).", "_sources": []}
+
+    threads: list[int] = []
+
+    def recording_extract(markdown):
+        threads.append(threading.get_ident())
+        return extract_claims(markdown)
+
+    monkeypatch.setitem(tools._tools, "llm_synthesize", fake_llm)
+    monkeypatch.setattr(synthesizer, "extract_claims", recording_extract)
+
+    markdown, claims, call_ids = await synthesize_section(
+        tools, "Overview", {"gene_symbol": "TP53"}, []
+    )
+
+    assert claims and claims[0].citations == ["PMID:20301340"]
+    assert len(call_ids) == 1
+    assert threads and threads[0] != threading.get_ident()
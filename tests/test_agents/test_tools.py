@@ -1,17 +1,19 @@
 """Tests for tool registry with mocked HTTP."""
 
 
+import asyncio
+
 import httpx
 
 from openlab.agents.provenance import ProvenanceLedger
-from openlab.agents.tools import ToolRegistry
+from openlab.agents.tools import CACHEABLE_TOOLS, HOST_CONCURRENCY, ToolCache, ToolRegistry
 
 
 def _mock_transport(handler):
     return httpx.MockTransport(handler)
 
 
-def _europepmc_handler(request: httpx.Request) -> httpx.Response:
+def mock_handler(request: httpx.Request) -> httpx.Response:
     """Mock EuropePMC responses."""
     url = str(request.url)
     if "europepmc" in url and "EXT_ID:" in url:
@@ -47,34 +49,29 @@ def _europepmc_handler(request: httpx.Request) -> httpx.Response:
     return httpx.Response(200, json={})
 
 
-async def test_unknown_tool():
+async def test_unknown_tool(mock_http):
     ledger = ProvenanceLedger("test-run")
-    http = httpx.AsyncClient(transport=_mock_transport(lambda r: httpx.Response(200, json={})))
-    tools = ToolRegistry(http, ledger)
+    tools = ToolRegistry(mock_http, ledger)
 
     result = await tools.call("nonexistent_tool", {})
     assert not result.success
     assert "Unknown tool" in result.error
-    await http.aclose()
 
 
-async def test_available_tools():
+async def test_available_tools(mock_http):
     ledger = ProvenanceLedger("test-run")
-    http = httpx.AsyncClient(transport=_mock_transport(lambda r: httpx.Response(200, json={})))
-    tools = ToolRegistry(http, ledger)
+    tools = ToolRegistry(mock_http, ledger)
 
     available = tools.available_tools
     assert "ncbi_gene_info" in available
     assert "cancer_literature" in available
     assert "pmid_validate" in available
     assert "llm_synthesize" in available
-    await http.aclose()
 
 
-async def test_cancer_literature():
+async def test_cancer_literature(mock_http):
     ledger = ProvenanceLedger("test-run")
-    http = httpx.AsyncClient(transport=_mock_transport(_europepmc_handler))
-    tools = ToolRegistry(http, ledger)
+    tools = ToolRegistry(mock_http, ledger)
 
     result = await tools.call(
         "cancer_literature",
@@ -84,26 +81,45 @@ async def test_cancer_literature():
     assert len(result.data.get("articles", [])) > 0
     assert result.call_id
     assert ledger.total_calls() == 1
-    await http.aclose()
 
 
-async def test_pmid_validate():
+async def test_pmid_validate(mock_http):
     ledger = ProvenanceLedger("test-run")
-    http = httpx.AsyncClient(transport=_mock_transport(_europepmc_handler))
-    tools = ToolRegistry(http, ledger)
+    tools = ToolRegistry(mock_http, ledger)
 
     result = await tools.call("pmid_validate", {"pmid": "12345"})
     assert result.success
     assert result.data.get("valid") is True
     assert result.data.get("pmid") == "12345"
-    await http.aclose()
 
 
-async def test_provenance_tracking():
+async def test_pmid_validate_batch_skips_non_medline_records():
+    queries: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = dict(request.url.params)["query"]
+        queries.append(query)
+        results = [{"id": "PPR123", "source": "PPR", "title": "Preprint"}]
+        if "SRC:MED" in query:
+            results = []
+        results.append({"id": "12345", "source": "MED", "pmid": "12345", "title": "Test Paper"})
+        return httpx.Response(200, json={"resultList": {"result": results}})
+
     ledger = ProvenanceLedger("test-run")
-    http = httpx.AsyncClient(transport=_mock_transport(_europepmc_handler))
+    http = httpx.AsyncClient(transport=_mock_transport(handler))
     tools = ToolRegistry(http, ledger)
 
+    result = await tools.call("pmid_validate", {"pmid": "12345"})
+    assert result.success
+    assert result.data["valid"] is True
+    assert result.data["title"] == "Test Paper"
+    assert queries == ["(EXT_ID:12345) AND SRC:MED"]
+
+
+async def test_provenance_tracking(mock_http):
+    ledger = ProvenanceLedger("test-run")
+    tools = ToolRegistry(mock_http, ledger)
+
     await tools.call("cancer_literature", {"gene_symbol": "TP53"})
     await tools.call("pmid_validate", {"pmid": "12345"})
 
@@ -111,13 +127,11 @@ async def test_provenance_tracking():
     assert len(entries) == 2
     assert entries[0].tool_name == "cancer_literature"
     assert entries[1].tool_name == "pmid_validate"
-    await http.aclose()
 
 
-async def test_convergence_score_tool():
+async def test_convergence_score_tool(mock_http):
     ledger = ProvenanceLedger("test-run")
-    http = httpx.AsyncClient(transport=_mock_transport(lambda r: httpx.Response(200, json={})))
-    tools = ToolRegistry(http, ledger)
+    tools = ToolRegistry(mock_http, ledger)
 
     evidence = [
         {"source": "ncbi_blast", "go_terms": ["GO:0006915"]},
@@ -126,4 +140,182 @@ async def test_convergence_score_tool():
     result = await tools.call("convergence_score", {"evidence_list": evidence})
     assert result.success
     assert "convergence_score" in result.data
+
+
+async def test_read_only_tools_are_cached():
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        return mock_handler(request)
+
+    ledger = ProvenanceLedger("test-run")
+    http = httpx.AsyncClient(transport=_mock_transport(handler))
+    tools = ToolRegistry(http, ledger)
+
+    first = await tools.call("pmid_validate", {"pmid": "12345"})
+    title = first.data["title"]
+    first.data["title"] = "mutated by caller"
+    second = await tools.call("pmid_validate", {"pmid": "12345"})
+
+    assert len(requests) == 1
+    assert second.data["title"] == title
+    assert second.call_id != first.call_id
+    entries = await ledger.get_entries()
+    assert [e.cache_hit for e in entries] == [False, True]
+    assert entries[1].sources == entries[0].sources
+    await http.aclose()
+
+
+async def test_uncacheable_tools_always_run():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json={})
+
+    http = httpx.AsyncClient(transport=_mock_transport(handler))
+    tools = ToolRegistry(http, ProvenanceLedger("test-run"))
+
+    await tools.call("literature_search", {"gene_symbol": "TP53"})
+    await tools.call("literature_search", {"gene_symbol": "TP53"})
+    assert calls == 2
+    await http.aclose()
+
+
+async def test_cache_can_be_shared_and_expires(mock_http, monkeypatch):
+    cache = ToolCache()
+    first = ToolRegistry(mock_http, ProvenanceLedger("run-a"), cache=cache)
+    second = ToolRegistry(mock_http, ProvenanceLedger("run-b"), cache=cache)
+
+    await first.call("pmid_validate", {"pmid": "12345"})
+    assert cache.get("pmid_validate", {"pmid": "12345"}) is not None
+    await second.call("pmid_validate", {"pmid": "12345"})
+    assert (await second.ledger.get_entries())[0].cache_hit
+
+    monkeypatch.setitem(CACHEABLE_TOOLS, "pmid_validate", 0.0)
+    cache.put("pmid_validate", {"pmid": "999"}, {"valid": True}, [])
+    assert cache.get("pmid_validate", {"pmid": "999"}) is None
+
+
+async def test_call_many_preserves_order_and_reports_failures(mock_http):
+    tools = ToolRegistry(mock_http, ProvenanceLedger("test-run"))
+
+    results = await tools.call_many([
+        ("pmid_validate", {"pmid": "12345"}),
+        ("nonexistent_tool", {}),
+        ("cancer_literature", {"gene_symbol": "TP53"}),
+    ])
+
+    assert [r.tool_name for r in results] == [
+        "pmid_validate", "nonexistent_tool", "cancer_literature",
+    ]
+    assert [r.success for r in results] == [True, False, True]
+
+
+async def test_calls_to_one_host_are_bounded(mock_http):
+    in_flight = peak = 0
+
+    async def _slow_lookup(http, gene_symbol, **kw):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"gene_symbol": gene_symbol}
+
+    tools = ToolRegistry(mock_http, ProvenanceLedger("test-run"))
+    tools._tools["ncbi_gene_info"] = _slow_lookup
+
+    results = await tools.call_many(
+        [("ncbi_gene_info", {"gene_symbol": f"G{i}"}) for i in range(10)]
+    )
+
+    assert all(r.success for r in results)
+    assert peak == HOST_CONCURRENCY["eutils.ncbi.nlm.nih.gov"]
+
+
+async def test_identical_in_flight_calls_share_one_request():
+    requests: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return mock_handler(request)
+
+    ledger = ProvenanceLedger("test-run")
+    http = httpx.AsyncClient(transport=_mock_transport(handler))
+    tools = ToolRegistry(http, ledger)
+
+    results = await tools.call_many(
+        [("pmid_validate", {"pmid": "12345"})] * 3 + [("pmid_validate", {"pmid": "999"})]
+    )
+
+    assert all(r.success for r in results)
+    assert len(requests) == 2
+    assert results[0].data == results[1].data == results[2].data
+    assert results[0].data is not results[1].data
+    entries = await ledger.get_entries()
+    assert len(entries) == 4
+    assert [e.cache_hit for e in entries] == [False, True, True, False]
+    assert not tools._inflight
+    await http.aclose()
+
+
+async def test_in_flight_failure_reaches_every_caller(mock_http):
+    calls = 0
+
+    async def _failing_lookup(http, gene_symbol, **kw):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    tools = ToolRegistry(mock_http, ProvenanceLedger("test-run"))
+    tools._tools["ncbi_gene_info"] = _failing_lookup
+
+    results = await tools.call_many([("ncbi_gene_info", {"gene_symbol": "TP53"})] * 2)
+
+    assert calls == 1
+    assert [r.error for r in results] == ["upstream down"] * 2
+    assert tools.cache.get("ncbi_gene_info", {"gene_symbol": "TP53"}) is None
+
+
+async def test_large_literature_response_is_stream_parsed(monkeypatch):
+    import openlab.agents.tools as tools_module
+
+    record = {
+        "pmid": "12345",
+        "title": "TP53 in cancer",
+        "abstractText": "p53 " * 5000,
+        "authorString": "Smith J",
+        "journalTitle": "Nature",
+        "pubYear": "2024",
+        "doi": "10.1234/test",
+        "citedByCount": 100,
+        "meshHeadingList": {"meshHeading": [{"descriptorName": "Neoplasms"}] * 50},
+    }
+    body = {"hitCount": 25, "resultList": {"result": [record] * 25}}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=body)
+
+    def _no_whole_body_parse(content):
+        raise AssertionError("large response should not be parsed in one go")
+
+    monkeypatch.setattr(tools_module.orjson, "loads", _no_whole_body_parse)
+    http = httpx.AsyncClient(transport=_mock_transport(handler))
+    tools = ToolRegistry(http, ProvenanceLedger("test-run"))
+
+    result = await tools.call("cancer_literature", {"gene_symbol": "TP53"})
+
+    assert result.success
+    articles = result.data["articles"]
+    assert len(articles) == 25
+    assert articles[0]["cited_by"] == 100
+    assert articles[0]["abstract"] == record["abstractText"]
+    assert set(articles[0]) == {
+        "pmid", "title", "abstract", "authors", "journal", "year", "doi", "cited_by",
+    }
     await http.aclose()
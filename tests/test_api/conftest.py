@@ -0,0 +1,90 @@
+"""Shared app, client and seeded database for API tests.
+
+The schema and seed data are built once per session in their own in-memory
+database; every test runs in a transaction that is rolled back afterwards,
+so writes made through the API never leak between tests.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from openlab.api.app import create_app
+from openlab.api.deps import get_db
+from openlab.db.models import Base, Evidence, EvidenceType, Gene, Hypothesis, HypothesisEvidence
+from openlab.db.models.hypothesis import EvidenceDirection, HypothesisScope, HypothesisStatus
+from tests._fixture_cache import seed_genes
+
+
+def _seed(db: Session) -> None:
+    seed_genes(db)
+
+    # One evidence row and a hypothesis linked to it, on the first gene
+    gene = db.query(Gene).first()
+    ev = Evidence(
+        gene_id=gene.gene_id,
+        evidence_type=EvidenceType.HOMOLOGY,
+        payload={"source": "BLAST", "hits": [{"accession": "P12345"}]},
+        confidence=0.8,
+    )
+    db.add(ev)
+    db.flush()
+
+    hyp = Hypothesis(
+        title="Test hypothesis for gene",
+        description="Based on BLAST homology to P12345",
+        scope=HypothesisScope.GENE,
+        status=HypothesisStatus.DRAFT,
+        confidence_score=0.75,
+        gene_id=gene.gene_id,
+    )
+    db.add(hyp)
+    db.flush()
+
+    db.add(HypothesisEvidence(
+        hypothesis_id=hyp.hypothesis_id,
+        evidence_id=ev.evidence_id,
+        direction=EvidenceDirection.SUPPORTS,
+        weight=1.0,
+    ))
+    db.commit()
+
+
+@pytest.fixture(scope="session")
+def seeded_engine(make_engine, schema_template):
+    eng = make_engine(template=schema_template)
+    with Session(eng) as db:
+        _seed(db)
+    yield eng
+    Base.metadata.drop_all(eng)
+
+
+@pytest.fixture(scope="session")
+def api_app():
+    return create_app()
+
+
+@pytest.fixture(scope="session")
+def api_client(api_app):
+    return TestClient(api_app)
+
+
+@pytest.fixture
+def test_app(api_app, api_client, seeded_engine):
+    """The shared client, with each request's session inside a per-test transaction."""
+    connection = seeded_engine.connect()
+    transaction = connection.begin()
+
+    def override_get_db():
+        db = Session(bind=connection, join_transaction_mode="create_savepoint")
+        try:
+            yield db
+        finally:
+            db.close()
+
+    api_app.dependency_overrides[get_db] = override_get_db
+    yield api_client
+
+    api_app.dependency_overrides.pop(get_db, None)
+    transaction.rollback()
+    connection.close()
@@ -1,89 +1,5 @@
 """API integration tests for hypothesis endpoints."""
 
-from pathlib import Path
-
-import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
-
-from openlab.api.app import create_app
-from openlab.api.deps import get_db
-from openlab.db.models import Base, Evidence, EvidenceType, Gene, Hypothesis, HypothesisEvidence
-from openlab.db.models.hypothesis import EvidenceDirection, HypothesisScope, HypothesisStatus
-from openlab.services.import_service import import_genbank
-
-FIXTURE = Path(__file__).parent.parent / "fixtures" / "mini_syn3a.gb"
-
-
-@pytest.fixture(scope="module")
-def test_app():
-    engine = create_engine(
-        "sqlite://",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-
-    @event.listens_for(engine, "connect")
-    def set_sqlite_pragma(dbapi_connection, connection_record):
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
-
-    Base.metadata.create_all(engine)
-    TestSession = sessionmaker(bind=engine)
-
-    # Seed data
-    db = TestSession()
-    import_genbank(db, FIXTURE)
-
-    # Add evidence and hypothesis
-    gene = db.query(Gene).first()
-    ev = Evidence(
-        gene_id=gene.gene_id,
-        evidence_type=EvidenceType.HOMOLOGY,
-        payload={"source": "BLAST", "hits": [{"accession": "P12345"}]},
-        confidence=0.8,
-    )
-    db.add(ev)
-    db.flush()
-
-    hyp = Hypothesis(
-        title="Test hypothesis for gene",
-        description="Based on BLAST homology to P12345",
-        scope=HypothesisScope.GENE,
-        status=HypothesisStatus.DRAFT,
-        confidence_score=0.75,
-        gene_id=gene.gene_id,
-    )
-    db.add(hyp)
-    db.flush()
-
-    link = HypothesisEvidence(
-        hypothesis_id=hyp.hypothesis_id,
-        evidence_id=ev.evidence_id,
-        direction=EvidenceDirection.SUPPORTS,
-        weight=1.0,
-    )
-    db.add(link)
-    db.commit()
-    db.close()
-
-    app = create_app()
-
-    def override_get_db():
-        db = TestSession()
-        try:
-            yield db
-        finally:
-            db.close()
-
-    app.dependency_overrides[get_db] = override_get_db
-    yield TestClient(app)
-
-    Base.metadata.drop_all(engine)
-
 
 def test_list_hypotheses(test_app):
     resp = test_app.get("/api/v1/hypotheses")
@@ -0,0 +1,34 @@
+"""API integration tests for the population simulation endpoint."""
+
+from openlab.models import CellSpec, CellSpecGene, CellSpecMetabolite
+
+
+def test_population_response_shape(api_client):
+    spec = CellSpec(
+        genes=[CellSpecGene(locus_tag="G_001"), CellSpecGene(locus_tag="G_002")],
+        metabolites=[
+            CellSpecMetabolite(id="glucose", initial_concentration=5.0),
+            CellSpecMetabolite(id="atp", initial_concentration=3.0),
+        ],
+    )
+    resp = api_client.post(
+        "/api/v1/simulation/population",
+        json={"cellspec": spec.model_dump(), "grid_size": 3, "duration": 120.0},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+
+    assert data["summary"]["num_snapshots"] == len(data["snapshots"])
+    assert data["summary"]["total_cells"] >= 1
+    final = data["snapshots"][-1]
+    assert final["grid_size"] == 3
+    assert len(final["nutrient_field"]) == 3
+    assert all(len(row) == 3 for row in final["nutrient_field"])
+    assert {"cell_id", "row", "col", "generation"} <= set(final["cells"][0])
+
+
+def test_population_rejects_invalid_cellspec(api_client):
+    resp = api_client.post(
+        "/api/v1/simulation/population", json={"cellspec": {"genes": "not-a-list"}}
+    )
+    assert resp.status_code == 422
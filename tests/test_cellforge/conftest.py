@@ -1,4 +1,9 @@
-"""Shared test fixtures for CellForge tests."""
+"""Shared test fixtures for CellForge tests.
+
+The config and knowledge base are validated once per session and shared;
+tests must treat them as read-only. A test that needs to change the
+knowledge base takes ``m_genitalium_kb_mut``, a private deep copy.
+"""
 
 from __future__ import annotations
 
@@ -9,30 +14,38 @@ from openlab.cellforge.core.knowledge_base import Gene, KnowledgeBase, Metabolit
 from openlab.cellforge.core.simulation import Simulation
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_config() -> SimulationConfig:
-    """A default simulation configuration."""
-    return SimulationConfig()
+    """A default simulation configuration (defaults only, so not re-validated)."""
+    return SimulationConfig.model_construct()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def m_genitalium_kb() -> KnowledgeBase:
-    """A minimal M. genitalium knowledge base stub."""
+    """A minimal M. genitalium knowledge base stub.
+
+    The child records are trusted literals, so they are built without
+    validation; the knowledge base itself still goes through validation.
+    """
     return KnowledgeBase(
         organism="Mycoplasma genitalium",
         genome_length=580076,
         gc_content=0.315,
         genes=[
-            Gene(id="MG_001", name="dnaN", locus_tag="MG_001", start=1, end=1500, strand=1),
-            Gene(id="MG_002", name="dnaA", locus_tag="MG_002", start=1501, end=3000, strand=1),
+            Gene.model_construct(
+                id="MG_001", name="dnaN", locus_tag="MG_001", start=1, end=1500, strand=1
+            ),
+            Gene.model_construct(
+                id="MG_002", name="dnaA", locus_tag="MG_002", start=1501, end=3000, strand=1
+            ),
         ],
         metabolites=[
-            Metabolite(id="atp_c", name="ATP", compartment="cytoplasm"),
-            Metabolite(id="adp_c", name="ADP", compartment="cytoplasm"),
-            Metabolite(id="glc_D_e", name="D-Glucose", compartment="extracellular"),
+            Metabolite.model_construct(id="atp_c", name="ATP", compartment="cytoplasm"),
+            Metabolite.model_construct(id="adp_c", name="ADP", compartment="cytoplasm"),
+            Metabolite.model_construct(id="glc_D_e", name="D-Glucose", compartment="extracellular"),
         ],
         reactions=[
-            Reaction(
+            Reaction.model_construct(
                 id="PFK",
                 name="Phosphofructokinase",
                 reactants={"atp_c": 1.0, "f6p_c": 1.0},
@@ -42,7 +55,17 @@ def m_genitalium_kb() -> KnowledgeBase:
     )
 
 
+@pytest.fixture
+def m_genitalium_kb_mut(m_genitalium_kb: KnowledgeBase) -> KnowledgeBase:
+    """A private copy of ``m_genitalium_kb`` that the test may modify."""
+    return m_genitalium_kb.model_copy(deep=True)
+
+
 @pytest.fixture
 def m_genitalium_sim(default_config: SimulationConfig, m_genitalium_kb: KnowledgeBase) -> Simulation:
-    """A minimal M. genitalium simulation stub."""
-    return Simulation.from_knowledge_base(m_genitalium_kb, default_config)
+    """A minimal M. genitalium simulation stub.
+
+    Simulations carry run state and write to their config, so each test gets
+    its own, on a copy of the shared config.
+    """
+    return Simulation.from_knowledge_base(m_genitalium_kb, default_config.model_copy())
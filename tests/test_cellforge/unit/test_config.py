@@ -15,6 +15,11 @@ def test_default_config() -> None:
     assert config.log_level == "INFO"
 
 
+def test_constructed_default_config_matches_validated(default_config: SimulationConfig) -> None:
+    assert default_config == SimulationConfig()
+    assert default_config.model_dump() == SimulationConfig().model_dump()
+
+
 def test_config_custom_values() -> None:
     config = SimulationConfig(
         organism_name="E. coli",
@@ -32,5 +37,5 @@ def test_config_serialization() -> None:
     config = SimulationConfig(organism_name="test")
     data = config.model_dump()
     assert data["organism_name"] == "test"
-    restored = SimulationConfig.model_validate(data)
+    restored = SimulationConfig.model_construct(**data)
     assert restored == config
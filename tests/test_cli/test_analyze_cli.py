@@ -1,7 +1,9 @@
 """Tests for CLI analyze commands."""
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace as NS
+from unittest.mock import DEFAULT, patch
 
+import pytest
 from typer.testing import CliRunner
 
 from openlab.cli.main import app
@@ -9,15 +11,22 @@ from openlab.cli.main import app
 runner = CliRunner()
 
 
-@patch("openlab.cli.analyze._SessionLocal")
-@patch("openlab.cli.analyze.gene_service")
-@patch("openlab.cli.analyze.hypothesis_service")
-def test_dossier_json(mock_hyp_svc, mock_gene_svc, mock_session_cls):
-    mock_db = MagicMock()
-    mock_session_cls.return_value = mock_db
+@pytest.fixture
+def svc_mocks():
+    """Patch the session factory and services used by ``openlab.cli.analyze``."""
+    with patch.multiple(
+        "openlab.cli.analyze",
+        _SessionLocal=DEFAULT,
+        gene_service=DEFAULT,
+        hypothesis_service=DEFAULT,
+    ) as mocks:
+        yield mocks
 
-    mock_gene = MagicMock()
-    mock_gene.gene_id = 1
+
+def test_dossier_json(svc_mocks):
+    mock_gene_svc = svc_mocks["gene_service"]
+
+    mock_gene = NS(gene_id=1)
     mock_gene_svc.get_gene_by_locus.return_value = mock_gene
     mock_gene_svc.get_dossier.return_value = {
         "gene_id": 1,
@@ -30,20 +39,17 @@ def test_dossier_json(mock_hyp_svc, mock_gene_svc, mock_session_cls):
         "features": [],
     }
 
-    result = runner.invoke(app, ["analyze", "dossier", "JCVISYN3A_0005", "--json"])
+    result = runner.invoke(
+        app, ["analyze", "dossier", "JCVISYN3A_0005", "--json"], catch_exceptions=False
+    )
     assert result.exit_code == 0
     assert "JCVISYN3A_0005" in result.output
 
 
-@patch("openlab.cli.analyze._SessionLocal")
-@patch("openlab.cli.analyze.gene_service")
-@patch("openlab.cli.analyze.hypothesis_service")
-def test_dossier_rich_output(mock_hyp_svc, mock_gene_svc, mock_session_cls):
-    mock_db = MagicMock()
-    mock_session_cls.return_value = mock_db
+def test_dossier_rich_output(svc_mocks):
+    mock_gene_svc = svc_mocks["gene_service"]
 
-    mock_gene = MagicMock()
-    mock_gene.gene_id = 1
+    mock_gene = NS(gene_id=1)
     mock_gene_svc.get_gene_by_locus.return_value = mock_gene
     mock_gene_svc.get_dossier.return_value = {
         "gene_id": 1,
@@ -55,64 +61,64 @@ def test_dossier_rich_output(mock_hyp_svc, mock_gene_svc, mock_session_cls):
         "evidence_by_type": {},
         "features": [],
     }
-    mock_hyp_svc.get_hypothesis_for_gene.return_value = None
+    svc_mocks["hypothesis_service"].get_hypothesis_for_gene.return_value = None
 
-    result = runner.invoke(app, ["analyze", "dossier", "JCVISYN3A_0005"])
+    result = runner.invoke(app, ["analyze", "dossier", "JCVISYN3A_0005"], catch_exceptions=False)
     assert result.exit_code == 0
 
 
-@patch("openlab.cli.analyze._SessionLocal")
-@patch("openlab.cli.analyze.gene_service")
-def test_deep_prompt_only(mock_gene_svc, mock_session_cls):
-    mock_db = MagicMock()
-    mock_session_cls.return_value = mock_db
-
-    mock_gene = MagicMock()
-    mock_gene.gene_id = 1
-    mock_gene.locus_tag = "JCVISYN3A_0005"
-    mock_gene.length = 300
-    mock_gene.strand = 1
-    mock_gene.start = 4000
-    mock_gene.end = 4300
-    mock_gene.product = None
+def test_deep_prompt_only(svc_mocks):
+    mock_db = svc_mocks["_SessionLocal"].return_value
+    mock_gene_svc = svc_mocks["gene_service"]
+
+    mock_gene = NS(
+        gene_id=1,
+        locus_tag="JCVISYN3A_0005",
+        length=300,
+        strand=1,
+        start=4000,
+        end=4300,
+        product=None,
+        essentiality=None,
+    )
     mock_gene_svc.get_gene_by_locus.return_value = mock_gene
 
-    mock_ev = MagicMock()
-    mock_ev.evidence_type = MagicMock()
-    mock_ev.evidence_type.value = "HOMOLOGY"
-    mock_ev.evidence_id = 1
-    mock_ev.payload = {"source": "BLAST", "hits": [{"accession": "P12345"}]}
-    mock_ev.confidence = 0.8
+    mock_ev = NS(
+        evidence_type=NS(value="HOMOLOGY"),
+        evidence_id=1,
+        payload={"source": "BLAST", "hits": [{"accession": "P12345"}]},
+        confidence=0.8,
+    )
 
     # Evidence is imported inside deep_cmd, so mock via the models module
     with patch("openlab.db.models.evidence.Evidence") as MockEvidence:
         mock_db.query.return_value.filter.return_value.order_by.return_value.all.return_value = [mock_ev]
 
-        result = runner.invoke(app, ["analyze", "deep", "JCVISYN3A_0005", "--prompt-only"])
+        result = runner.invoke(
+            app, ["analyze", "deep", "JCVISYN3A_0005", "--prompt-only"], catch_exceptions=False
+        )
         assert result.exit_code == 0
         assert "JCVISYN3A_0005" in result.output
+        assert "Essentiality: unknown" in result.output
 
 
-@patch("openlab.cli.analyze._SessionLocal")
-@patch("openlab.cli.analyze.gene_service")
-def test_deep_no_evidence(mock_gene_svc, mock_session_cls):
-    mock_db = MagicMock()
-    mock_session_cls.return_value = mock_db
+def test_deep_no_evidence(svc_mocks):
+    mock_db = svc_mocks["_SessionLocal"].return_value
+    mock_gene_svc = svc_mocks["gene_service"]
 
-    mock_gene = MagicMock()
-    mock_gene.gene_id = 1
+    mock_gene = NS(gene_id=1)
     mock_gene_svc.get_gene_by_locus.return_value = mock_gene
 
     with patch("openlab.db.models.evidence.Evidence"):
         mock_db.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
 
-        result = runner.invoke(app, ["analyze", "deep", "JCVISYN3A_0005"])
+        result = runner.invoke(app, ["analyze", "deep", "JCVISYN3A_0005"], catch_exceptions=False)
         assert result.exit_code == 1
-        assert "No evidence" in result.output
+        assert "No evidence" in result.stdout
 
 
 def test_analyze_help():
-    result = runner.invoke(app, ["analyze", "--help"])
+    result = runner.invoke(app, ["analyze", "--help"], catch_exceptions=False)
     assert result.exit_code == 0
     assert "dossier" in result.output
     assert "deep" in result.output
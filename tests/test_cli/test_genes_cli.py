@@ -1,8 +1,9 @@
 """CLI integration tests."""
 
 from pathlib import Path
-from unittest.mock import patch
 
+import pytest
+from sqlalchemy.orm import sessionmaker
 from typer.testing import CliRunner
 
 from openlab.cli.main import app
@@ -11,45 +12,41 @@ runner = CliRunner()
 FIXTURE = Path(__file__).parent.parent / "fixtures" / "mini_syn3a.gb"
 
 
-def _make_test_session():
-    """Create a test SessionLocal that uses SQLite."""
-    from sqlalchemy import create_engine, event
-    from sqlalchemy.orm import sessionmaker
-    from sqlalchemy.pool import StaticPool
-    from openlab.db.models import Base
+@pytest.fixture(scope="module")
+def test_sessionmaker(connection):
+    """Sessions for the CLI on the shared test database, rolled back afterwards.
 
-    engine = create_engine(
-        "sqlite://",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
+    Commits made by the commands only release SAVEPOINTs, so rows persist
+    across invocations within this module but never outlive it.
+    """
+    transaction = connection.begin()
+    yield sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
+    transaction.rollback()
 
-    @event.listens_for(engine, "connect")
-    def set_sqlite_pragma(dbapi_connection, connection_record):
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
 
-    Base.metadata.create_all(engine)
-    return sessionmaker(bind=engine)
+@pytest.fixture(scope="module")
+def imported_db(test_sessionmaker):
+    """Point the CLI at the test database and import the fixture GenBank once."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("openlab.cli.genes._SessionLocal", test_sessionmaker)
+        result = runner.invoke(app, ["genes", "import", str(FIXTURE)], catch_exceptions=False)
+        assert result.exit_code == 0
+        yield result
 
 
-@patch("openlab.cli.genes._SessionLocal")
-def test_import_and_list(mock_session_local):
-    TestSession = _make_test_session()
-    mock_session_local.side_effect = TestSession
+def test_import(imported_db):
+    assert "imported" in imported_db.output.lower() or "Import complete" in imported_db.output
 
-    # Import
-    result = runner.invoke(app, ["genes", "import", str(FIXTURE)])
-    assert result.exit_code == 0
-    assert "imported" in result.output.lower() or "Import complete" in result.output
-
-    # List
-    result = runner.invoke(app, ["genes", "list"])
-    assert result.exit_code == 0
-    assert "JCVISYN3A_0001" in result.output
 
-    # Show
-    result = runner.invoke(app, ["genes", "show", "JCVISYN3A_0001"])
+@pytest.mark.parametrize(
+    ("args", "needle"),
+    [
+        (["genes", "list"], "JCVISYN3A_0001"),
+        (["genes", "show", "JCVISYN3A_0001"], "dnaA"),
+    ],
+    ids=["list", "show"],
+)
+def test_query(imported_db, args, needle):
+    result = runner.invoke(app, args, catch_exceptions=False)
     assert result.exit_code == 0
-    assert "dnaA" in result.output
+    assert needle in result.output
@@ -1,38 +1,100 @@
-"""Shared fixtures for cancer evidence source tests."""
+"""Shared fixtures for cancer evidence source tests.
+
+Each canned response is read and parsed once per session. Tests only serve
+them through ``routes``, so the parsed dicts are shared and must not be
+modified.
+
+``http_client`` never touches the network: its ``httpx.MockTransport``
+answers from the ``routes`` dict, keyed by ``(method, URL without query)``.
+A route's value is the JSON body to return, already-encoded JSON bytes
+(served as they are), or a handler for anything else (error statuses, say).
+Test modules override ``routes`` with their baseline responses; a test adds
+or replaces entries on its own copy.
+"""
 
-import json
 from pathlib import Path
 
+import httpx
+import orjson
 import pytest
+import pytest_asyncio
+
+from openlab.contrib.cancer import register_all
 
 FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures" / "cancer_responses"
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _cancer_sources():
+    """Register the cancer sources once for every test in this package."""
+    register_all()
+
+
+_JSON = {"content-type": "application/json"}
+
+
+def _dispatch(routes: dict):
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = (request.method, str(request.url.copy_with(query=None)))
+        if key not in routes:
+            return httpx.Response(404)
+        route = routes[key]
+        if callable(route):
+            return route(request)
+        if isinstance(route, bytes):
+            return httpx.Response(200, content=route, headers=_JSON)
+        return httpx.Response(200, json=route)
+
+    return handler
+
+
 @pytest.fixture
+def routes():
+    """The responses ``http_client`` serves; none unless the module overrides it."""
+    return {}
+
+
+@pytest_asyncio.fixture
+async def http_client(routes):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_dispatch(routes))) as client:
+        yield client
+
+
+def _load(name: str):
+    return orjson.loads((FIXTURES_DIR / name).read_bytes())
+
+
+@pytest.fixture(scope="session")
 def clinvar_response():
-    return json.loads((FIXTURES_DIR / "clinvar_tp53.json").read_text())
+    return _load("clinvar_tp53.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cosmic_response():
-    return json.loads((FIXTURES_DIR / "cosmic_braf.json").read_text())
+    return _load("cosmic_braf.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def oncokb_response():
-    return json.loads((FIXTURES_DIR / "oncokb_braf.json").read_text())
+    return _load("oncokb_braf.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def civic_response():
-    return json.loads((FIXTURES_DIR / "civic_tp53.json").read_text())
+    return _load("civic_tp53.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cbioportal_response():
-    return json.loads((FIXTURES_DIR / "cbioportal_tp53.json").read_text())
+    return _load("cbioportal_tp53.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gdc_response():
-    return json.loads((FIXTURES_DIR / "gdc_tp53.json").read_text())
+    return _load("gdc_tp53.json")
+
+
+@pytest.fixture(scope="session")
+def gdc_response_bytes():
+    """The raw GDC response, for routes that serve it unchanged."""
+    return (FIXTURES_DIR / "gdc_tp53.json").read_bytes()
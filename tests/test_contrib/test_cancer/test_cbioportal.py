@@ -1,29 +1,27 @@
 """Tests for cBioPortal cancer evidence source."""
 
-import httpx
 import pytest
-import respx
 
 from openlab.contrib.cancer.sources.cbioportal import CBioPortalSource, search_cbioportal
 
+GENE_URL = "https://www.cbioportal.org/api/genes/TP53"
+MUTATIONS_URL = (
+    "https://www.cbioportal.org/api/molecular-profiles/msk_impact_2017_mutations/mutations"
+)
 
-@pytest.mark.asyncio
-async def test_cbioportal_fetch(cbioportal_response):
+
+@pytest.fixture
+def routes(cbioportal_response):
+    """The TP53 gene and mutation routes; a test may add to its own copy."""
+    return {
+        ("GET", GENE_URL): cbioportal_response["gene"],
+        ("GET", MUTATIONS_URL): cbioportal_response["mutations"],
+    }
+
+
+async def test_cbioportal_fetch(http_client, source):
     """cBioPortal fetch returns normalized mutations."""
-    async with respx.mock:
-        respx.get("https://www.cbioportal.org/api/genes/TP53").respond(
-            json=cbioportal_response["gene"],
-        )
-        respx.get(
-                "https://www.cbioportal.org/api/molecular-profiles/"
-                "msk_impact_2017_mutations/mutations",
-            ).respond(
-            json=cbioportal_response["mutations"],
-        )
-
-        async with httpx.AsyncClient() as http:
-            source = CBioPortalSource()
-            results = await source.fetch("TP53", http)
+    results = await source.fetch("TP53", http_client)
 
     assert len(results) == 2
     assert results[0]["source"] == "cbioportal"
@@ -32,59 +30,44 @@ async def test_cbioportal_fetch(cbioportal_response):
     assert "mutation:loss_of_function" in results[1]["categories"]
 
 
-@pytest.mark.asyncio
-async def test_cbioportal_normalize_mutation_types():
-    """cBioPortal normalizes various mutation types."""
-    source = CBioPortalSource()
+@pytest.fixture(scope="module")
+def source():
+    return CBioPortalSource()
 
-    cases = [
+
+@pytest.mark.parametrize(
+    ("mutation_type", "expected_cat"),
+    [
         ("Missense_Mutation", "mutation:missense"),
         ("Nonsense_Mutation", "mutation:loss_of_function"),
         ("Frame_Shift_Del", "mutation:loss_of_function"),
         ("Splice_Site", "mutation:splice"),
         ("In_Frame_Del", "mutation:in_frame"),
-    ]
-    for mutation_type, expected_cat in cases:
-        result = source.normalize({
-            "uniqueMutationId": "test",
-            "gene": {"hugoGeneSymbol": "TP53", "entrezGeneId": 7157},
-            "proteinChange": "X1Y",
-            "mutationType": mutation_type,
-        })
-        assert expected_cat in result["categories"], f"{mutation_type} should map to {expected_cat}"
-
-
-@pytest.mark.asyncio
-async def test_cbioportal_no_gene():
+    ],
+)
+def test_cbioportal_normalize_mutation_types(source, mutation_type, expected_cat):
+    """cBioPortal normalizes various mutation types."""
+    result = source.normalize({
+        "uniqueMutationId": "test",
+        "gene": {"hugoGeneSymbol": "TP53", "entrezGeneId": 7157},
+        "proteinChange": "X1Y",
+        "mutationType": mutation_type,
+    })
+    assert expected_cat in result["categories"]
+
+
+async def test_cbioportal_no_gene(routes, http_client, source):
     """cBioPortal handles missing gene gracefully."""
-    async with respx.mock:
-        respx.get("https://www.cbioportal.org/api/genes/FAKE").respond(
-            json={"hugoGeneSymbol": "FAKE"},
-        )
+    routes["GET", "https://www.cbioportal.org/api/genes/FAKE"] = {"hugoGeneSymbol": "FAKE"}
 
-        async with httpx.AsyncClient() as http:
-            source = CBioPortalSource()
-            results = await source.fetch("FAKE", http)
+    results = await source.fetch("FAKE", http_client)
 
     assert results == []
 
 
-@pytest.mark.asyncio
-async def test_search_cbioportal_wrapper(cbioportal_response):
+async def test_search_cbioportal_wrapper(http_client):
     """search_cbioportal wraps CBioPortalSource."""
-    async with respx.mock:
-        respx.get("https://www.cbioportal.org/api/genes/TP53").respond(
-            json=cbioportal_response["gene"],
-        )
-        respx.get(
-                "https://www.cbioportal.org/api/molecular-profiles/"
-                "msk_impact_2017_mutations/mutations",
-            ).respond(
-            json=cbioportal_response["mutations"],
-        )
-
-        async with httpx.AsyncClient() as http:
-            result = await search_cbioportal(http, "TP53")
+    result = await search_cbioportal(http_client, "TP53")
 
     assert result["source"] == "cbioportal"
     assert result["total"] == 2
@@ -1,23 +1,21 @@
 """Tests for CIViC cancer evidence source."""
 
-import httpx
 import pytest
-import respx
 
 from openlab.contrib.cancer.sources.civic import CIViCSource, search_civic
 
+GRAPHQL_URL = "https://civicdb.org/api/graphql"
 
-@pytest.mark.asyncio
-async def test_civic_fetch(civic_response):
-    """CIViC fetch returns gene + evidence items."""
-    async with respx.mock:
-        respx.post("https://civicdb.org/api/graphql").respond(
-            json=civic_response,
-        )
 
-        async with httpx.AsyncClient() as http:
-            source = CIViCSource()
-            results = await source.fetch("TP53", http)
+@pytest.fixture
+def routes(civic_response):
+    """The TP53 GraphQL route; a test may replace it on its own copy."""
+    return {("POST", GRAPHQL_URL): civic_response}
+
+
+async def test_civic_fetch(http_client, source):
+    """CIViC fetch returns gene + evidence items."""
+    results = await source.fetch("TP53", http_client)
 
     # 1 gene record + 2 evidence items
     assert len(results) == 3
@@ -40,57 +38,48 @@ async def test_civic_fetch(civic_response):
     assert "AZD1775" in ev1["therapies"]
 
 
-@pytest.mark.asyncio
-async def test_civic_normalize_evidence_types():
-    """CIViC normalizes different evidence types."""
-    source = CIViCSource()
+@pytest.fixture(scope="module")
+def source():
+    return CIViCSource()
+
 
-    cases = [
+@pytest.mark.parametrize(
+    ("ev_type", "expected_cat"),
+    [
         ("PREDICTIVE", "cancer:drug_target"),
         ("DIAGNOSTIC", "cancer:diagnostic_marker"),
         ("PROGNOSTIC", "cancer:prognostic_marker"),
         ("PREDISPOSING", "cancer:risk_factor"),
-    ]
-    for ev_type, expected_cat in cases:
-        result = source.normalize({
-            "id": 1,
-            "evidenceType": ev_type,
-            "evidenceLevel": "B",
-            "status": "accepted",
-            "significance": "",
-            "description": "test",
-            "therapies": [],
-            "disease": {"name": "Cancer", "doid": "162"},
-            "source": {"citationId": "12345", "sourceType": "PUBMED"},
-        })
-        assert expected_cat in result["categories"], f"{ev_type} should map to {expected_cat}"
-
-
-@pytest.mark.asyncio
-async def test_civic_empty_gene():
+    ],
+)
+def test_civic_normalize_evidence_types(source, ev_type, expected_cat):
+    """CIViC normalizes different evidence types."""
+    result = source.normalize({
+        "id": 1,
+        "evidenceType": ev_type,
+        "evidenceLevel": "B",
+        "status": "accepted",
+        "significance": "",
+        "description": "test",
+        "therapies": [],
+        "disease": {"name": "Cancer", "doid": "162"},
+        "source": {"citationId": "12345", "sourceType": "PUBMED"},
+    })
+    assert expected_cat in result["categories"]
+
+
+async def test_civic_empty_gene(routes, http_client, source):
     """CIViC handles unknown gene gracefully."""
-    async with respx.mock:
-        respx.post("https://civicdb.org/api/graphql").respond(
-            json={"data": {"genes": {"nodes": []}}},
-        )
+    routes["POST", GRAPHQL_URL] = {"data": {"genes": {"nodes": []}}}
 
-        async with httpx.AsyncClient() as http:
-            source = CIViCSource()
-            results = await source.fetch("NONEXISTENT", http)
+    results = await source.fetch("NONEXISTENT", http_client)
 
     assert results == []
 
 
-@pytest.mark.asyncio
-async def test_search_civic_wrapper(civic_response):
+async def test_search_civic_wrapper(http_client):
     """search_civic wraps CIViCSource."""
-    async with respx.mock:
-        respx.post("https://civicdb.org/api/graphql").respond(
-            json=civic_response,
-        )
-
-        async with httpx.AsyncClient() as http:
-            result = await search_civic(http, "TP53")
+    result = await search_civic(http_client, "TP53")
 
     assert result["source"] == "civic"
     assert result["total"] == 3
@@ -1,29 +1,31 @@
 """Tests for ClinVar cancer evidence source."""
 
-import httpx
 import pytest
-import respx
 
 from openlab.contrib.cancer.sources.clinvar import ClinVarSource, search_clinvar
 
+ESEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+ESUMMARY_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
+NO_HITS = {"esearchresult": {"count": "0", "idlist": []}}
+
+
+@pytest.fixture(scope="module")
+def source():
+    return ClinVarSource()
 
-@pytest.mark.asyncio
-async def test_clinvar_fetch(clinvar_response):
-    """ClinVar fetch returns normalized variants."""
-    esearch_resp = {"esearchresult": clinvar_response["esearchresult"]}
-    esummary_resp = {"result": clinvar_response["result"]}
 
-    async with respx.mock:
-        respx.get("https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi").respond(
-            json=esearch_resp,
-        )
-        respx.get("https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi").respond(
-            json=esummary_resp,
-        )
+@pytest.fixture
+def routes(clinvar_response):
+    """The TP53 esearch/esummary routes; a test may replace them on its own copy."""
+    return {
+        ("GET", ESEARCH_URL): {"esearchresult": clinvar_response["esearchresult"]},
+        ("GET", ESUMMARY_URL): {"result": clinvar_response["result"]},
+    }
+
 
-        async with httpx.AsyncClient() as http:
-            source = ClinVarSource()
-            results = await source.fetch("TP53", http)
+async def test_clinvar_fetch(http_client, source):
+    """ClinVar fetch returns normalized variants."""
+    results = await source.fetch("TP53", http_client)
 
     assert len(results) == 2
     assert results[0]["source"] == "clinvar"
@@ -32,10 +34,8 @@ async def test_clinvar_fetch(clinvar_response):
     assert "cancer:pathogenic_variant" in results[0]["categories"]
 
 
-@pytest.mark.asyncio
-async def test_clinvar_normalize():
+async def test_clinvar_normalize(source):
     """ClinVar normalize extracts clinical significance categories."""
-    source = ClinVarSource()
     raw = {
         "uid": "99999",
         "title": "test variant",
@@ -51,10 +51,8 @@ async def test_clinvar_normalize():
     assert "cancer:likely_pathogenic" in result["categories"]
 
 
-@pytest.mark.asyncio
-async def test_clinvar_normalize_new_api():
+async def test_clinvar_normalize_new_api(source):
     """ClinVar normalize handles new API format (post-2024) with split classifications."""
-    source = ClinVarSource()
     raw = {
         "uid": "55555",
         "title": "NM_000546.6(TP53):c.524G>A (p.Arg175His)",
@@ -80,10 +78,8 @@ async def test_clinvar_normalize_new_api():
     assert result["gene_symbol"] == "TP53"
 
 
-@pytest.mark.asyncio
-async def test_clinvar_normalize_new_api_oncogenicity():
+async def test_clinvar_normalize_new_api_oncogenicity(source):
     """ClinVar normalize picks oncogenicity_classification when germline is empty."""
-    source = ClinVarSource()
     raw = {
         "uid": "66666",
         "title": "test variant oncogenicity",
@@ -104,31 +100,20 @@ async def test_clinvar_normalize_new_api_oncogenicity():
     assert "cancer:pathogenic_variant" in result["categories"]
 
 
-@pytest.mark.asyncio
-async def test_clinvar_empty_response():
+async def test_clinvar_empty_response(routes, http_client, source):
     """ClinVar returns empty list when no results."""
-    async with respx.mock:
-        respx.get("https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi").respond(
-            json={"esearchresult": {"count": "0", "idlist": []}},
-        )
+    routes["GET", ESEARCH_URL] = NO_HITS
 
-        async with httpx.AsyncClient() as http:
-            source = ClinVarSource()
-            results = await source.fetch("NONEXISTENT_GENE", http)
+    results = await source.fetch("NONEXISTENT_GENE", http_client)
 
     assert results == []
 
 
-@pytest.mark.asyncio
-async def test_search_clinvar_wrapper():
+async def test_search_clinvar_wrapper(routes, http_client):
     """search_clinvar wraps ClinVarSource with error handling."""
-    async with respx.mock:
-        respx.get("https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi").respond(
-            json={"esearchresult": {"count": "0", "idlist": []}},
-        )
+    routes["GET", ESEARCH_URL] = NO_HITS
 
-        async with httpx.AsyncClient() as http:
-            result = await search_clinvar(http, "TP53")
+    result = await search_clinvar(http_client, "TP53")
 
     assert result["source"] == "clinvar"
     assert result["gene_symbol"] == "TP53"
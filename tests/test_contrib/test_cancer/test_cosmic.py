@@ -1,23 +1,26 @@
 """Tests for COSMIC cancer evidence source."""
 
-import httpx
 import pytest
-import respx
 
 from openlab.contrib.cancer.sources.cosmic import CosmicSource, search_cosmic
 
+SEARCH_URL = "https://clinicaltables.nlm.nih.gov/api/cosmic/v4/search"
 
-@pytest.mark.asyncio
-async def test_cosmic_fetch(cosmic_response):
-    """COSMIC fetch returns normalized mutations."""
-    async with respx.mock:
-        respx.get("https://clinicaltables.nlm.nih.gov/api/cosmic/v4/search").respond(
-            json=cosmic_response,
-        )
 
-        async with httpx.AsyncClient() as http:
-            source = CosmicSource()
-            results = await source.fetch("BRAF", http)
+@pytest.fixture(scope="module")
+def source():
+    return CosmicSource()
+
+
+@pytest.fixture
+def routes(cosmic_response):
+    """The BRAF search route; a test may replace it on its own copy."""
+    return {("GET", SEARCH_URL): cosmic_response}
+
+
+async def test_cosmic_fetch(http_client, source):
+    """COSMIC fetch returns normalized mutations."""
+    results = await source.fetch("BRAF", http_client)
 
     assert len(results) == 3
     assert results[0]["source"] == "cosmic"
@@ -26,10 +29,8 @@ async def test_cosmic_fetch(cosmic_response):
     assert "cancer:somatic_mutation" in results[0]["categories"]
 
 
-@pytest.mark.asyncio
-async def test_cosmic_normalize():
+async def test_cosmic_normalize(source):
     """COSMIC normalize categorizes mutation types."""
-    source = CosmicSource()
     raw = {
         "code": "COSM476",
         "display": ["COSM476", "BRAF", "c.1799T>A", "p.V600E", "skin", "melanoma"],
@@ -42,31 +43,18 @@ async def test_cosmic_normalize():
     assert result["histology"] == "melanoma"
 
 
-@pytest.mark.asyncio
-async def test_cosmic_empty_response():
+async def test_cosmic_empty_response(routes, http_client, source):
     """COSMIC handles empty search results."""
-    async with respx.mock:
-        respx.get("https://clinicaltables.nlm.nih.gov/api/cosmic/v4/search").respond(
-            json=[0, [], None, []],
-        )
+    routes["GET", SEARCH_URL] = [0, [], None, []]
 
-        async with httpx.AsyncClient() as http:
-            source = CosmicSource()
-            results = await source.fetch("NONEXISTENT", http)
+    results = await source.fetch("NONEXISTENT", http_client)
 
     assert results == []
 
 
-@pytest.mark.asyncio
-async def test_search_cosmic_wrapper(cosmic_response):
+async def test_search_cosmic_wrapper(http_client):
     """search_cosmic wraps CosmicSource."""
-    async with respx.mock:
-        respx.get("https://clinicaltables.nlm.nih.gov/api/cosmic/v4/search").respond(
-            json=cosmic_response,
-        )
-
-        async with httpx.AsyncClient() as http:
-            result = await search_cosmic(http, "BRAF")
+    result = await search_cosmic(http_client, "BRAF")
 
     assert result["source"] == "cosmic"
     assert result["total"] == 3
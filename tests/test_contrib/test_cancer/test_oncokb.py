@@ -2,25 +2,30 @@
 
 import httpx
 import pytest
-import respx
 
 from openlab.contrib.cancer.sources.oncokb import OncoKBSource, search_oncokb
 
+GENES_URL = "https://www.oncokb.org/api/v1/genes/lookup"
+VARIANTS_URL = "https://www.oncokb.org/api/v1/variants/lookup"
 
-@pytest.mark.asyncio
-async def test_oncokb_fetch(oncokb_response):
+
+@pytest.fixture(scope="module")
+def source():
+    return OncoKBSource()
+
+
+@pytest.fixture
+def routes(oncokb_response):
+    """The BRAF gene and variant lookups; a test may replace them on its own copy."""
+    return {
+        ("GET", GENES_URL): oncokb_response["gene_lookup"],
+        ("GET", VARIANTS_URL): oncokb_response["variants_lookup"],
+    }
+
+
+async def test_oncokb_fetch(http_client, source):
     """OncoKB fetch returns gene + variant entries."""
-    async with respx.mock:
-        respx.get("https://www.oncokb.org/api/v1/genes/lookup").respond(
-            json=oncokb_response["gene_lookup"],
-        )
-        respx.get("https://www.oncokb.org/api/v1/variants/lookup").respond(
-            json=oncokb_response["variants_lookup"],
-        )
-
-        async with httpx.AsyncClient() as http:
-            source = OncoKBSource()
-            results = await source.fetch("BRAF", http)
+    results = await source.fetch("BRAF", http_client)
 
     # 1 gene + 2 variants
     assert len(results) == 3
@@ -39,10 +44,8 @@ async def test_oncokb_fetch(oncokb_response):
     assert "cancer:oncogenic" in variant_results[0]["categories"]
 
 
-@pytest.mark.asyncio
-async def test_oncokb_normalize_tsg():
+async def test_oncokb_normalize_tsg(source):
     """OncoKB normalizes tumor suppressors correctly."""
-    source = OncoKBSource()
     gene_data = {
         "hugoSymbol": "TP53",
         "entrezGeneId": 7157,
@@ -54,28 +57,21 @@ async def test_oncokb_normalize_tsg():
     assert "cancer:oncogene" not in result["categories"]
 
 
-@pytest.mark.asyncio
-async def test_oncokb_empty_gene():
+async def test_oncokb_empty_gene(routes, http_client, source):
     """OncoKB returns empty list for unknown gene."""
-    async with respx.mock:
-        respx.get("https://www.oncokb.org/api/v1/genes/lookup").respond(json=[])
-        respx.get("https://www.oncokb.org/api/v1/variants/lookup").respond(json=[])
+    routes["GET", GENES_URL] = []
+    routes["GET", VARIANTS_URL] = []
 
-        async with httpx.AsyncClient() as http:
-            source = OncoKBSource()
-            results = await source.fetch("FAKE_GENE", http)
+    results = await source.fetch("FAKE_GENE", http_client)
 
     assert results == []
 
 
-@pytest.mark.asyncio
-async def test_search_oncokb_error_handling():
+async def test_search_oncokb_error_handling(routes, http_client):
     """search_oncokb handles API errors gracefully."""
-    async with respx.mock:
-        respx.get("https://www.oncokb.org/api/v1/genes/lookup").respond(status_code=500)
+    routes["GET", GENES_URL] = lambda request: httpx.Response(500)
 
-        async with httpx.AsyncClient() as http:
-            result = await search_oncokb(http, "BRAF")
+    result = await search_oncokb(http_client, "BRAF")
 
     assert result["source"] == "oncokb"
     assert result["entries"] == []
@@ -1,23 +1,26 @@
 """Tests for TCGA/GDC cancer evidence source."""
 
-import httpx
 import pytest
-import respx
 
 from openlab.contrib.cancer.sources.tcga_gdc import TcgaGdcSource, search_tcga_gdc
 
+SSMS_URL = "https://api.gdc.cancer.gov/ssms"
 
-@pytest.mark.asyncio
-async def test_tcga_gdc_fetch(gdc_response):
-    """GDC fetch returns normalized SSM hits."""
-    async with respx.mock:
-        respx.get("https://api.gdc.cancer.gov/ssms").respond(
-            json=gdc_response,
-        )
 
-        async with httpx.AsyncClient() as http:
-            source = TcgaGdcSource()
-            results = await source.fetch("TP53", http)
+@pytest.fixture(scope="module")
+def source():
+    return TcgaGdcSource()
+
+
+@pytest.fixture
+def routes(gdc_response_bytes):
+    """The TP53 SSM route; a test may replace it on its own copy."""
+    return {("GET", SSMS_URL): gdc_response_bytes}
+
+
+async def test_tcga_gdc_fetch(http_client, source):
+    """GDC fetch returns normalized SSM hits."""
+    results = await source.fetch("TP53", http_client)
 
     assert len(results) == 2
     assert results[0]["source"] == "tcga_gdc"
@@ -32,10 +35,8 @@ async def test_tcga_gdc_fetch(gdc_response):
     assert "mutation:loss_of_function" in results[1]["categories"]
 
 
-@pytest.mark.asyncio
-async def test_tcga_gdc_normalize():
+async def test_tcga_gdc_normalize(source):
     """GDC normalize extracts project counts correctly."""
-    source = TcgaGdcSource()
     raw = {
         "ssm_id": "test_ssm",
         "genomic_dna_change": "chr1:g.100A>T",
@@ -58,31 +59,18 @@ async def test_tcga_gdc_normalize():
     assert "mutation:splice" in result["categories"]
 
 
-@pytest.mark.asyncio
-async def test_tcga_gdc_empty_response():
+async def test_tcga_gdc_empty_response(routes, http_client, source):
     """GDC returns empty for no hits."""
-    async with respx.mock:
-        respx.get("https://api.gdc.cancer.gov/ssms").respond(
-            json={"data": {"hits": [], "pagination": {"count": 0, "total": 0}}},
-        )
+    routes["GET", SSMS_URL] = {"data": {"hits": [], "pagination": {"count": 0, "total": 0}}}
 
-        async with httpx.AsyncClient() as http:
-            source = TcgaGdcSource()
-            results = await source.fetch("NONEXISTENT", http)
+    results = await source.fetch("NONEXISTENT", http_client)
 
     assert results == []
 
 
-@pytest.mark.asyncio
-async def test_search_tcga_gdc_wrapper(gdc_response):
+async def test_search_tcga_gdc_wrapper(http_client):
     """search_tcga_gdc wraps TcgaGdcSource."""
-    async with respx.mock:
-        respx.get("https://api.gdc.cancer.gov/ssms").respond(
-            json=gdc_response,
-        )
-
-        async with httpx.AsyncClient() as http:
-            result = await search_tcga_gdc(http, "TP53")
+    result = await search_tcga_gdc(http_client, "TP53")
 
     assert result["source"] == "tcga_gdc"
     assert result["total"] == 2
@@ -1,20 +1,32 @@
 from pathlib import Path
 
+import pytest
+
 from openlab.ingestion.genbank import parse_genbank
 
 FIXTURE = Path(__file__).parent.parent / "fixtures" / "mini_syn3a.gb"
 
 
-def test_parse_genbank_counts():
-    result = parse_genbank(FIXTURE)
+@pytest.fixture(scope="module")
+def parsed_genbank():
+    """The fixture GenBank file, parsed once for the module."""
+    return parse_genbank(FIXTURE)
+
+
+@pytest.fixture(scope="module")
+def genes_by_tag(parsed_genbank):
+    """The parsed genes, indexed by locus tag."""
+    return {g.locus_tag: g for g in parsed_genbank.genes}
+
+
+def test_parse_genbank_counts(parsed_genbank):
     # 3 CDS + 1 tRNA = 4 genes
-    assert len(result.genes) == 4
-    assert result.accession == "CP016816.2"
+    assert len(parsed_genbank.genes) == 4
+    assert parsed_genbank.accession == "CP016816.2"
 
 
-def test_parse_genbank_cds():
-    result = parse_genbank(FIXTURE)
-    dnaA = next(g for g in result.genes if g.locus_tag == "JCVISYN3A_0001")
+def test_parse_genbank_cds(genes_by_tag):
+    dnaA = genes_by_tag["JCVISYN3A_0001"]
     assert dnaA.name == "dnaA"
     assert dnaA.product == "chromosomal replication initiator protein DnaA"
     assert dnaA.strand == 1
@@ -22,15 +34,13 @@ def test_parse_genbank_cds():
     assert dnaA.gene_type == "CDS"
 
 
-def test_parse_genbank_hypothetical():
-    result = parse_genbank(FIXTURE)
-    hyp = next(g for g in result.genes if g.locus_tag == "JCVISYN3A_0002")
+def test_parse_genbank_hypothetical(genes_by_tag):
+    hyp = genes_by_tag["JCVISYN3A_0002"]
     assert hyp.name is None
     assert "hypothetical" in hyp.product.lower()
 
 
-def test_parse_genbank_trna():
-    result = parse_genbank(FIXTURE)
-    trna = next(g for g in result.genes if g.locus_tag == "JCVISYN3A_0003")
+def test_parse_genbank_trna(genes_by_tag):
+    trna = genes_by_tag["JCVISYN3A_0003"]
     assert trna.gene_type == "tRNA"
     assert trna.protein_sequence is None
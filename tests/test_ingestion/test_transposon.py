@@ -1,5 +1,6 @@
 """Tests for transposon mutagenesis TSV parser."""
 
+import io
 from pathlib import Path
 
 import pytest
@@ -8,16 +9,21 @@ from openlab.exceptions import ParseError
 from openlab.ingestion.transposon import parse_transposon_tsv
 
 FIXTURE = Path(__file__).parent.parent / "fixtures" / "mini_transposon.tsv"
+HEADER = "locus_tag\tessentiality\ttn5_class\tn_insertions\tnotes\n"
 
 
-def test_parse_fixture():
-    entries = parse_transposon_tsv(FIXTURE)
-    assert len(entries) == 4
+@pytest.fixture(scope="module")
+def parsed_transposon():
+    """The fixture transposon entries, parsed once for the module."""
+    return parse_transposon_tsv(FIXTURE)
 
 
-def test_first_entry_fields():
-    entries = parse_transposon_tsv(FIXTURE)
-    e = entries[0]
+def test_parse_fixture(parsed_transposon):
+    assert len(parsed_transposon) == 4
+
+
+def test_first_entry_fields(parsed_transposon):
+    e = parsed_transposon[0]
     assert e.locus_tag == "JCVISYN3A_0001"
     assert e.essentiality == "essential"
     assert e.tn5_class == "e"
@@ -25,9 +31,8 @@ def test_first_entry_fields():
     assert e.notes == "DnaA replication initiation"
 
 
-def test_all_classes_present():
-    entries = parse_transposon_tsv(FIXTURE)
-    classes = {e.tn5_class for e in entries}
+def test_all_classes_present(parsed_transposon):
+    classes = {e.tn5_class for e in parsed_transposon}
     assert classes == {"e", "i", "n", "d"}
 
 
@@ -36,37 +41,16 @@ def test_file_not_found():
         parse_transposon_tsv("/nonexistent/file.tsv")
 
 
-def test_bad_class(tmp_path):
-    bad = tmp_path / "bad.tsv"
-    bad.write_text(
-        "locus_tag\tessentiality\ttn5_class\tn_insertions\tnotes\n"
-        "GENE_001\tessential\tx\t0\t\n"
-    )
-    with pytest.raises(ParseError, match="invalid tn5_class"):
-        parse_transposon_tsv(bad)
-
-
-def test_bad_insertions(tmp_path):
-    bad = tmp_path / "bad.tsv"
-    bad.write_text(
-        "locus_tag\tessentiality\ttn5_class\tn_insertions\tnotes\n"
-        "GENE_001\tessential\te\tNaN\t\n"
-    )
-    with pytest.raises(ParseError, match="n_insertions must be an integer"):
-        parse_transposon_tsv(bad)
-
-
-def test_empty_file(tmp_path):
-    empty = tmp_path / "empty.tsv"
-    empty.write_text(
-        "locus_tag\tessentiality\ttn5_class\tn_insertions\tnotes\n"
-    )
-    with pytest.raises(ParseError, match="No data rows"):
-        parse_transposon_tsv(empty)
-
-
-def test_missing_column(tmp_path):
-    bad = tmp_path / "bad.tsv"
-    bad.write_text("locus_tag\tessentiality\n" "GENE_001\tessential\n")
-    with pytest.raises(ParseError, match="Missing required columns"):
-        parse_transposon_tsv(bad)
+@pytest.mark.parametrize(
+    ("text", "match"),
+    [
+        (HEADER + "GENE_001\tessential\tx\t0\t\n", "invalid tn5_class"),
+        (HEADER + "GENE_001\tessential\te\tNaN\t\n", "n_insertions must be an integer"),
+        (HEADER, "No data rows"),
+        ("locus_tag\tessentiality\nGENE_001\tessential\n", "Missing required columns"),
+    ],
+    ids=["bad_class", "bad_insertions", "empty_file", "missing_column"],
+)
+def test_bad_input(text, match):
+    with pytest.raises(ParseError, match=match):
+        parse_transposon_tsv(io.StringIO(text))
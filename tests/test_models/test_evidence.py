@@ -2,6 +2,8 @@ import json
 
 from openlab.db.models import Evidence, EvidenceType, Gene
 
+EVIDENCE_TYPE_VALUES = frozenset(e.value for e in EvidenceType)
+
 
 def test_create_evidence(db):
     gene = Gene(
@@ -35,6 +37,5 @@ def test_create_evidence(db):
 def test_evidence_type_enum():
     assert EvidenceType.HOMOLOGY.value == "HOMOLOGY"
     assert EvidenceType.GROWTH_CURVE.value == "GROWTH_CURVE"
-    members = [e.value for e in EvidenceType]
-    assert "STRUCTURE" in members
-    assert "EXPRESSION" in members
+    assert "STRUCTURE" in EVIDENCE_TYPE_VALUES
+    assert "EXPRESSION" in EVIDENCE_TYPE_VALUES
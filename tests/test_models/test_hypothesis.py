@@ -45,15 +45,12 @@ def test_hypothesis_evidence_link(db):
         payload={"hit": "ABC_transporter"},
         confidence=0.8,
     )
-    db.add(ev)
-    db.flush()
-
     hyp = Hypothesis(
         title="0050 is ABC transporter",
         scope=HypothesisScope.GENE,
         status=HypothesisStatus.TESTING,
     )
-    db.add(hyp)
+    db.add_all([ev, hyp])
     db.flush()
 
     link = HypothesisEvidence(
@@ -1,5 +1,7 @@
 """Tests for methods section finder."""
 
+import pytest
+
 from openlab.paper.methods_finder import find_methods_section
 
 
@@ -39,23 +41,24 @@ def test_no_methods_section():
     assert methods == ""
 
 
-def test_methods_heading_variations():
-    """Various heading styles should be detected."""
-    headings = [
+@pytest.mark.parametrize(
+    "heading",
+    [
         "## Methods",
         "## Materials and Methods",
         "## METHODS",
         "## Experimental Procedures",
         "## Online Methods",
         "## STAR Methods",
-    ]
-    for heading in headings:
-        text = f"""{heading}
+    ],
+)
+def test_methods_heading_variations(heading):
+    """Various heading styles should be detected."""
+    text = f"""{heading}
 
 We performed RNA-seq and analyzed the results.
 
 ## Results
 
 We found things."""
-        methods = find_methods_section(text)
-        assert methods, f"Failed to find methods with heading: {heading}"
+    assert find_methods_section(text)
@@ -1,5 +1,7 @@
 """Tests for pipeline YAML validator."""
 
+import pytest
+
 from openlab.paper.protocol_models import PipelineConfig, PipelineStage
 from openlab.paper.validator import validate_config, validate_yaml
 
@@ -22,81 +24,71 @@ stages:
     assert errors == []
 
 
-def test_missing_pipeline_section():
-    """Missing pipeline section is an error."""
-    yaml_str = """
+@pytest.mark.parametrize(
+    ("yaml_str", "expected"),
+    [
+        pytest.param(
+            """
 stages:
   - name: step1
-"""
-    errors = validate_yaml(yaml_str)
-    assert any("pipeline" in e.lower() for e in errors)
-
-
-def test_missing_pipeline_name():
-    """Missing pipeline name is an error."""
-    yaml_str = """
+""",
+            "pipeline",
+            id="missing_pipeline_section",
+        ),
+        pytest.param(
+            """
 pipeline:
   description: no name
 stages:
   - name: step1
-"""
-    errors = validate_yaml(yaml_str)
-    assert any("name" in e.lower() for e in errors)
-
-
-def test_empty_stages():
-    """Empty stages list is an error."""
-    yaml_str = """
+""",
+            "name",
+            id="missing_pipeline_name",
+        ),
+        pytest.param(
+            """
 pipeline:
   name: Test
 stages: []
-"""
-    errors = validate_yaml(yaml_str)
-    assert any("no stages" in e.lower() for e in errors)
-
-
-def test_duplicate_stage_names():
-    """Duplicate stage names are caught."""
-    yaml_str = """
+""",
+            "no stages",
+            id="empty_stages",
+        ),
+        pytest.param(
+            """
 pipeline:
   name: Test
 stages:
   - name: step1
   - name: step1
-"""
-    errors = validate_yaml(yaml_str)
-    assert any("duplicate" in e.lower() for e in errors)
-
-
-def test_missing_stage_name():
-    """Stages without names are caught."""
-    yaml_str = """
+""",
+            "duplicate",
+            id="duplicate_stage_names",
+        ),
+        pytest.param(
+            """
 pipeline:
   name: Test
 stages:
   - tool: STAR
-"""
-    errors = validate_yaml(yaml_str)
-    assert any("missing 'name'" in e.lower() for e in errors)
-
-
-def test_nonexistent_dependency():
-    """References to nonexistent stages are caught."""
-    yaml_str = """
+""",
+            "missing 'name'",
+            id="missing_stage_name",
+        ),
+        pytest.param(
+            """
 pipeline:
   name: Test
 stages:
   - name: step1
     depends_on:
       - nonexistent
-"""
-    errors = validate_yaml(yaml_str)
-    assert any("does not exist" in e.lower() for e in errors)
-
-
-def test_circular_dependency():
-    """Circular dependencies are detected."""
-    yaml_str = """
+""",
+            "does not exist",
+            id="nonexistent_dependency",
+        ),
+        pytest.param(
+            """
 pipeline:
   name: Test
 stages:
@@ -106,9 +98,16 @@ stages:
   - name: step2
     depends_on:
       - step1
-"""
+""",
+            "circular",
+            id="circular_dependency",
+        ),
+    ],
+)
+def test_invalid_pipeline(yaml_str, expected):
+    """Structural problems are reported with a matching error message."""
     errors = validate_yaml(yaml_str)
-    assert any("circular" in e.lower() for e in errors)
+    assert any(expected in e.lower() for e in errors)
 
 
 def test_invalid_yaml():
@@ -5,6 +5,15 @@ import yaml
 from openlab.paper.protocol_models import PipelineConfig, PipelineStage
 from openlab.paper.yaml_generator import generate_yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+def _load(yaml_str: str):
+    return yaml.load(yaml_str, Loader=_SafeLoader)
+
 
 def _sample_config() -> PipelineConfig:
     return PipelineConfig(
@@ -34,7 +43,7 @@ def _sample_config() -> PipelineConfig:
 def test_generate_yaml_valid():
     """Generated YAML is valid."""
     yaml_str = generate_yaml(_sample_config())
-    data = yaml.safe_load(yaml_str)
+    data = _load(yaml_str)
     assert data is not None
     assert "pipeline" in data
     assert "stages" in data
@@ -43,7 +52,7 @@ def test_generate_yaml_valid():
 def test_generate_yaml_pipeline_info():
     """Pipeline section contains name and description."""
     yaml_str = generate_yaml(_sample_config())
-    data = yaml.safe_load(yaml_str)
+    data = _load(yaml_str)
     assert data["pipeline"]["name"] == "Test Pipeline"
     assert data["pipeline"]["source_doi"] == "10.1234/test"
 
@@ -51,7 +60,7 @@ def test_generate_yaml_pipeline_info():
 def test_generate_yaml_stages():
     """Stages are correctly represented."""
     yaml_str = generate_yaml(_sample_config())
-    data = yaml.safe_load(yaml_str)
+    data = _load(yaml_str)
     stages = data["stages"]
     assert len(stages) == 2
     assert stages[0]["name"] == "alignment"
@@ -67,7 +76,7 @@ def test_generate_yaml_warnings():
         warnings=["Could not map step 3"],
     )
     yaml_str = generate_yaml(config)
-    data = yaml.safe_load(yaml_str)
+    data = _load(yaml_str)
     assert "warnings" in data
     assert len(data["warnings"]) == 1
 
@@ -76,6 +85,6 @@ def test_generate_yaml_empty_pipeline():
     """Empty pipeline generates valid but minimal YAML."""
     config = PipelineConfig(name="Empty")
     yaml_str = generate_yaml(config)
-    data = yaml.safe_load(yaml_str)
+    data = _load(yaml_str)
     assert data["pipeline"]["name"] == "Empty"
     assert data["stages"] == []
@@ -1,11 +1,9 @@
 """Tests for ResearchBook DB models."""
 
 import pytest
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from openlab.db.models.agent import AgentRun
-from openlab.db.models.base import Base
 from openlab.researchbook.models import (
     CommentType,
     HumanComment,
@@ -17,10 +15,8 @@ from openlab.researchbook.models import (
 
 
 @pytest.fixture
-def db():
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine)
+def db(fresh_engine):
+    SessionLocal = sessionmaker(bind=fresh_engine)
     session = SessionLocal()
     yield session
     session.close()
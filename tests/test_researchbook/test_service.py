@@ -1,20 +1,16 @@
 """Tests for ResearchBook service functions."""
 
 import pytest
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from openlab.db.models.agent import AgentRun
-from openlab.db.models.base import Base
 from openlab.researchbook import service
 from openlab.researchbook.models import ResearchThread, ThreadStatus
 
 
 @pytest.fixture
-def db():
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine)
+def db(fresh_engine):
+    SessionLocal = sessionmaker(bind=fresh_engine)
     session = SessionLocal()
     yield session
     session.close()
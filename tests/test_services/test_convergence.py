@@ -9,8 +9,11 @@ from openlab.services.gene_service import (
     detect_all_disagreements,
 )
 from openlab.services.convergence import (
+    _agreement_matrix,
+    _agreement_sets,
     _pairwise_agreement,
     _make_bigrams,
+    compute_convergence,
 )
 from openlab.services.evidence_normalizer import normalize_evidence, NormalizedEvidence
 from openlab.services.validation_service import _classify_tier
@@ -353,6 +356,50 @@ class TestPairwiseAgreement:
         assert score == 0.0
 
 
+class TestAgreementMatrix:
+    """The sparse all-pairs path must match the pairwise loop exactly."""
+
+    @staticmethod
+    def _records(n):
+        return [
+            NormalizedEvidence(
+                go_terms={f"GO:{(i * 7 + k) % 11:07d}" for k in range(i % 3)},
+                ec_numbers={f"2.7.{i % 2}.{i % 5}"} if i % 4 else set(),
+                categories={"enzyme:kinase"} if i % 2 else {"transporter"},
+                keywords={
+                    w for k, w in enumerate(("atp", "kinase", "membrane", "dna")) if (i >> k) & 1
+                },
+            )
+            for i in range(n)
+        ]
+
+    def test_matches_pairwise_agreement(self):
+        records = self._records(30)
+        matrix = _agreement_matrix([_agreement_sets(r) for r in records])
+        for i, a in enumerate(records):
+            for j, b in enumerate(records):
+                if i != j:
+                    assert matrix[i, j] == _pairwise_agreement(a, b)
+
+    def test_large_input_matches_loop(self, monkeypatch):
+        import openlab.services.convergence as convergence
+
+        evidence = [
+            {"source": src, "go_terms": [f"GO:{i % 9:07d}", f"GO:{i % 4:07d}"]}
+            for i, src in enumerate(["ncbi_blast", "uniprot", "interpro", "string"] * 20)
+        ]
+        via_matrix = compute_convergence(evidence)
+        monkeypatch.setattr(convergence, "_MATRIX_MIN_RECORDS", 10**9)
+        assert compute_convergence(evidence) == via_matrix
+
+    def test_two_sources_scalar_result(self):
+        evidence = [
+            {"source": "ncbi_blast", "go_terms": ["GO:0006915"]},
+            {"source": "uniprot", "go_terms": ["GO:0006915", "GO:0006281"]},
+        ]
+        assert compute_convergence(evidence) == 0.5
+
+
 class TestMakeBigrams:
     def test_creates_bigrams(self):
         bigrams = _make_bigrams({"alpha", "beta", "gamma"})
@@ -1,14 +1,11 @@
-from pathlib import Path
-
 from openlab.db.models.gene import Gene
 from openlab.db.models.hypothesis import Hypothesis, HypothesisScope
-from openlab.services import gene_service, import_service
-
-FIXTURE = Path(__file__).parent.parent / "fixtures" / "mini_syn3a.gb"
+from openlab.services import gene_service
+from tests._fixture_cache import seed_genes
 
 
 def _seed(db):
-    import_service.import_genbank(db, FIXTURE)
+    seed_genes(db)
 
 
 def test_list_genes(db):
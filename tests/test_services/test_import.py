@@ -23,3 +23,16 @@ def test_import_genbank_idempotent(db):
 
     genes = db.query(Gene).all()
     assert len(genes) == 4
+
+
+def test_import_genbank_skips_only_existing(db):
+    db.add(Gene(locus_tag="JCVISYN3A_0001", sequence="ATG", length=3, strand=1, start=0, end=3))
+    db.flush()
+
+    result = import_genbank(db, FIXTURE)
+    assert result["imported"] == 3
+    assert result["skipped"] == 1
+
+    genes = db.query(Gene).order_by(Gene.locus_tag).all()
+    assert len(genes) == 4
+    assert genes[0].sequence == "ATG"
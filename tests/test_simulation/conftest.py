@@ -0,0 +1,41 @@
+"""Shared test fixtures for simulation tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from openlab.models import CellSpec, CellSpecGene, CellSpecMetabolite, CellSpecReaction
+
+
+@pytest.fixture
+def mini_cellspec() -> CellSpec:
+    """A tiny CellSpec: four genes, one glycolysis-like reaction, core metabolites."""
+    return CellSpec(
+        organism="Test organism",
+        genes=[
+            CellSpecGene(locus_tag="G_001", classification="metabolism"),
+            CellSpecGene(locus_tag="G_002", classification="gene_expression", is_essential=False),
+            CellSpecGene(locus_tag="G_003", classification="unknown"),
+            CellSpecGene(locus_tag="G_004", classification="unknown", predicted_function="kinase"),
+        ],
+        metabolites=[
+            CellSpecMetabolite(id="glucose", initial_concentration=5.0),
+            CellSpecMetabolite(id="atp", initial_concentration=3.0),
+            CellSpecMetabolite(id="adp", initial_concentration=1.0),
+            CellSpecMetabolite(id="aa_pool", initial_concentration=2.0),
+            CellSpecMetabolite(id="ctp", initial_concentration=1.0),
+            CellSpecMetabolite(id="utp", initial_concentration=1.0),
+        ],
+        reactions=[
+            CellSpecReaction.model_validate({
+                "id": "GLYC",
+                "gene_locus_tags": ["G_001"],
+                "substrates": [
+                    {"metabolite_id": "glucose", "coefficient": -1},
+                    {"metabolite_id": "adp", "coefficient": -2},
+                ],
+                "products": [{"metabolite_id": "atp", "coefficient": 2}],
+                "kinetics": {"kcat": {"value": 50.0}},
+            }),
+        ],
+    )
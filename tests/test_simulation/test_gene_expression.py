@@ -0,0 +1,145 @@
+"""Tests for the vectorized gene expression module."""
+
+import numpy as np
+import pytest
+
+from openlab.simulation import gene_expression as ge
+from openlab.simulation.gene_expression import GeneExpressionModule
+from openlab.simulation.state import CellState
+
+
+def _reference_step(genes, state: CellState, dt: float) -> None:
+    """Deterministic per-gene loop the vectorized step must reproduce."""
+    atp_conc = state.get_metabolite("atp")
+    aa_conc = state.get_metabolite("aa_pool")
+    atp_factor = atp_conc / (ge.KM_ATP + atp_conc)
+    aa_factor = aa_conc / (ge.KM_AA + aa_conc)
+    totals = {"atp": 0.0, "gtp": 0.0, "ntp": 0.0, "aa": 0.0}
+
+    for i, gene in enumerate(genes):
+        mrna, protein = state.mrna_counts[i], state.protein_counts[i]
+        if state.is_knocked_out(gene.locus_tag):
+            state.mrna_counts[i] = max(0.0, mrna - ge.MRNA_DEGRADATION_RATE * mrna * dt)
+            state.protein_counts[i] = max(
+                0.0, protein - ge.PROTEIN_DEGRADATION_RATE * protein * dt
+            )
+            continue
+
+        modifier = state.gene_expression_modifiers[i] * (1.0 - state.methylation[i] * 0.8)
+        modifier *= gene.expression_rate
+        new_mrna = ge.BASE_TRANSCRIPTION_RATE * atp_factor * modifier * dt
+        state.mrna_counts[i] = max(0.0, mrna + new_mrna - ge.MRNA_DEGRADATION_RATE * mrna * dt)
+        if new_mrna > 0:
+            ntp_cost = new_mrna * ge.AVG_MRNA_LENGTH * ge.NTP_PER_NUCLEOTIDE
+            totals["atp"] += ntp_cost * 0.25
+            totals["gtp"] += ntp_cost * 0.25
+            totals["ntp"] += ntp_cost * 0.50
+
+        tln_rate = ge.BASE_TRANSLATION_RATE * atp_factor * aa_factor * modifier
+        new_protein = tln_rate * state.mrna_counts[i] * dt
+        state.protein_counts[i] = max(
+            0.0, protein + new_protein - ge.PROTEIN_DEGRADATION_RATE * protein * dt
+        )
+        if new_protein > 0:
+            aa_used = new_protein * ge.AVG_PROTEIN_LENGTH
+            totals["atp"] += aa_used * ge.ATP_PER_AMINO_ACID
+            totals["gtp"] += aa_used * ge.GTP_PER_AMINO_ACID
+            totals["aa"] += aa_used * ge.AA_PER_AMINO_ACID
+
+        if gene.classification == "unknown" and not gene.predicted_function:
+            state.protein_counts[i] = max(state.protein_counts[i], 20.0)
+
+    mol_to_mm = 1.0 / (6.022e23 * state.volume * 1e-15) * 1e3
+    for met_id, amount in (
+        ("atp", totals["atp"] + totals["gtp"]),
+        ("aa_pool", totals["aa"]),
+        ("ctp", totals["ntp"] * 0.5),
+        ("utp", totals["ntp"] * 0.5),
+    ):
+        idx = state.metabolite_index[met_id]
+        state.metabolite_concentrations[idx] = max(
+            0.0, state.metabolite_concentrations[idx] - amount * mol_to_mm
+        )
+
+
+def _make_state(spec, knockouts=None) -> CellState:
+    state = CellState.from_spec(spec, knockouts=knockouts)
+    state.mrna_counts[:] = [0.5, 2.0, 1.0, 0.3]
+    state.protein_counts[:] = [150.0, 80.0, 10.0, 40.0]
+    # Methylation above 1.25 makes G_004's synthesis negative in deterministic mode
+    state.methylation[:] = [0.0, 0.4, 0.1, 1.5]
+    return state
+
+
+@pytest.mark.parametrize("knockouts", [None, {"G_002", "G_003"}])
+def test_deterministic_step_matches_per_gene_reference(mini_cellspec, knockouts):
+    vectorized = _make_state(mini_cellspec, knockouts)
+    reference = _make_state(mini_cellspec, knockouts)
+    module = GeneExpressionModule(mini_cellspec.genes)
+
+    for _ in range(5):
+        module.step(vectorized, 0.5)
+        _reference_step(mini_cellspec.genes, reference, 0.5)
+
+    np.testing.assert_allclose(vectorized.mrna_counts, reference.mrna_counts, rtol=1e-12)
+    np.testing.assert_allclose(vectorized.protein_counts, reference.protein_counts, rtol=1e-12)
+    np.testing.assert_allclose(
+        vectorized.metabolite_concentrations, reference.metabolite_concentrations, rtol=1e-12
+    )
+
+
+def test_knocked_out_genes_only_degrade_and_skip_protein_floor(mini_cellspec):
+    state = _make_state(mini_cellspec, knockouts={"G_003"})
+    module = GeneExpressionModule(mini_cellspec.genes)
+
+    module.step(state, 0.5)
+
+    # G_003 is an unknown gene, but knocked out: it decays below the 20-protein floor
+    assert state.protein_counts[2] == pytest.approx(
+        10.0 * (1 - ge.PROTEIN_DEGRADATION_RATE * 0.5)
+    )
+    assert state.mrna_counts[2] == pytest.approx(1.0 * (1 - ge.MRNA_DEGRADATION_RATE * 0.5))
+
+
+def test_unknown_gene_protein_floor(mini_cellspec):
+    state = _make_state(mini_cellspec)
+    module = GeneExpressionModule(mini_cellspec.genes)
+
+    module.step(state, 0.5)
+
+    assert state.protein_counts[2] == 20.0
+    # G_004 has a predicted function, so no floor applies
+    assert state.protein_counts[3] < 40.0
+
+
+def test_stochastic_step_draws_integer_synthesis(mini_cellspec):
+    state = _make_state(mini_cellspec)
+    before = state.mrna_counts.copy()
+    module = GeneExpressionModule(mini_cellspec.genes, stochastic=True)
+
+    module.step(state, 0.5)
+
+    assert np.all(state.mrna_counts >= 0.0)
+    assert np.all(np.isfinite(state.protein_counts))
+    assert state.mrna_counts.shape == before.shape
+
+
+def test_step_is_bound_to_mode_variant(mini_cellspec):
+    stochastic = GeneExpressionModule(mini_cellspec.genes, stochastic=True)
+    deterministic = GeneExpressionModule(mini_cellspec.genes)
+
+    assert stochastic.step == stochastic._step_stochastic
+    assert deterministic.step == deterministic._step_deterministic
+
+
+def test_step_without_metabolites_skips_resource_coupling(mini_cellspec):
+    mini_cellspec.metabolites = []
+    state = _make_state(mini_cellspec)
+    module = GeneExpressionModule(mini_cellspec.genes)
+
+    module.step(state, 0.5)
+
+    assert not state.has_metabolites
+    # Uncoupled transcription runs at the full base rate for G_001
+    expected = 0.5 * (1 - ge.MRNA_DEGRADATION_RATE * 0.5) + ge.BASE_TRANSCRIPTION_RATE * 0.5
+    assert state.mrna_counts[0] == pytest.approx(expected)
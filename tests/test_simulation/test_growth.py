@@ -0,0 +1,29 @@
+"""Tests for growth and division."""
+
+import numpy as np
+
+from openlab.simulation.growth import GrowthModule
+from openlab.simulation.state import CellState
+
+
+def test_stochastic_division_partitions_counts_in_place(mini_cellspec):
+    state = CellState.from_spec(mini_cellspec, seed=3)
+    state.protein_counts[:] = [200.0, 150.7, -1.0, 0.0]
+    protein_buffer = state.protein_counts
+
+    GrowthModule(stochastic=True)._divide(state)
+
+    assert state.protein_counts is protein_buffer
+    assert state.protein_counts.dtype == np.float64
+    assert np.all(state.protein_counts == np.round(state.protein_counts))
+    assert np.all(state.protein_counts >= 0.0)
+    assert np.all(state.protein_counts <= [200.0, 150.0, 0.0, 0.0])
+    assert state.generation == 1
+
+
+def test_deterministic_division_halves_counts(mini_cellspec):
+    state = CellState.from_spec(mini_cellspec)
+
+    GrowthModule()._divide(state)
+
+    np.testing.assert_array_equal(state.protein_counts, 167.0 * 0.5)
@@ -0,0 +1,31 @@
+"""Tests for Michaelis-Menten metabolism."""
+
+import math
+
+import pytest
+
+from openlab.simulation.metabolism import MetabolismModule
+from openlab.simulation.state import CellState
+
+
+def test_step_converts_substrate_to_product(mini_cellspec):
+    state = CellState.from_spec(mini_cellspec)
+    glucose_before = state.get_metabolite("glucose")
+    atp_before = state.get_metabolite("atp")
+
+    MetabolismModule(mini_cellspec.reactions).step(state, 0.5)
+
+    assert state.get_metabolite("glucose") < glucose_before
+    assert state.get_metabolite("atp") > atp_before
+
+
+@pytest.mark.parametrize("bad_rate", [math.nan, math.inf, -1.0, 0.0])
+def test_non_finite_or_non_positive_rates_are_skipped(mini_cellspec, monkeypatch, bad_rate):
+    state = CellState.from_spec(mini_cellspec)
+    before = state.metabolite_concentrations.copy()
+    module = MetabolismModule(mini_cellspec.reactions)
+    monkeypatch.setattr(module, "_compute_rate", lambda rxn, st: bad_rate)
+
+    module.step(state, 0.5)
+
+    assert (state.metabolite_concentrations == before).all()
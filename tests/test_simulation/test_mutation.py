@@ -0,0 +1,26 @@
+"""Tests for division-time mutations."""
+
+import numpy as np
+
+from openlab.simulation.mutation import MutationModule
+from openlab.simulation.state import CellState
+
+
+def test_zero_rate_leaves_state_untouched(mini_cellspec):
+    state = CellState.from_spec(mini_cellspec)
+
+    MutationModule(mutation_rate=0.0).apply_division_mutations(state, mini_cellspec.genes)
+
+    assert state.mutations == {}
+    np.testing.assert_array_equal(state.gene_expression_modifiers, 1.0)
+
+
+def test_certain_mutation_records_every_gene(mini_cellspec):
+    state = CellState.from_spec(mini_cellspec)
+
+    MutationModule(mutation_rate=1.0).apply_division_mutations(state, mini_cellspec.genes)
+
+    assert set(state.mutations) == {g.locus_tag for g in mini_cellspec.genes}
+    for i, gene in enumerate(mini_cellspec.genes):
+        assert state.mutations[gene.locus_tag] == state.gene_expression_modifiers[i]
+    assert np.all(state.gene_expression_modifiers != 1.0)
@@ -0,0 +1,121 @@
+"""Tests for the multi-cell population engine."""
+
+import json
+
+import numpy as np
+import pytest
+
+from openlab.simulation.population import PopulationEngine, serialize_snapshots
+
+
+def test_serialize_snapshots_converts_nutrient_field():
+    field = np.array([[0.1, 5.0], [2.5, 0.0]])
+    snapshots = [{"time": 0.0, "nutrient_field": field}, {"time": 60.0}]
+
+    result = serialize_snapshots(snapshots)
+
+    assert result[0]["nutrient_field"] == [[0.1, 5.0], [2.5, 0.0]]
+    assert result[1] == {"time": 60.0}
+    # Input snapshots are left untouched
+    assert snapshots[0]["nutrient_field"] is field
+
+
+def test_run_returns_json_ready_snapshots(mini_cellspec):
+    mini_cellspec.simulation_parameters.grid_size = 4
+    engine = PopulationEngine(mini_cellspec, seed=7)
+
+    snapshots = engine.run(180.0)
+
+    assert snapshots[0]["time"] == 0.0
+    assert snapshots[-1]["time"] == 180.0
+    for snap in snapshots:
+        field = snap["nutrient_field"]
+        assert isinstance(field, list)
+        assert len(field) == 4 and all(len(row) == 4 for row in field)
+    # Untouched edge cells keep the exact float64 base concentration
+    assert snapshots[0]["nutrient_field"][0][0] == 5.0
+    json.dumps(snapshots)
+
+
+def test_progress_payload_is_lightweight_and_detached(mini_cellspec):
+    params = mini_cellspec.simulation_parameters
+    params.grid_size = 4
+    params.expression_dt = 1.0
+    payloads: list[tuple[float, dict]] = []
+
+    def on_progress(pct, time, snapshot):
+        payloads.append((time, snapshot))
+        snapshot["cells"].clear()
+        snapshot["total_cells"] = -1
+
+    engine = PopulationEngine(mini_cellspec, seed=7, on_progress=on_progress)
+    snapshots = engine.run(300.0)
+
+    # t=100 and t=200 fall between recordings; t=300 coincides with one
+    assert [t for t, _ in payloads] == [100.0, 200.0, 300.0]
+    for _, snapshot in payloads:
+        assert "nutrient_field" not in snapshot
+        json.dumps(snapshot)
+
+    recorded = next(s for s in snapshots if s["time"] == 300.0)
+    assert recorded["total_cells"] >= 1
+    assert recorded["cells"]
+    assert isinstance(recorded["nutrient_field"], list)
+
+
+def test_run_replicates_are_independent_and_reproducible(mini_cellspec):
+    mini_cellspec.simulation_parameters.grid_size = 4
+    engine = PopulationEngine(mini_cellspec, seed=11)
+
+    first = engine.run_replicates(120.0, n_replicates=2, n_workers=2)
+    second = engine.run_replicates(120.0, n_replicates=2, n_workers=2)
+
+    assert len(first) == 2
+    assert all(reps[-1]["time"] == 120.0 for reps in first)
+    assert first == second
+
+
+def test_daughter_placement_fills_free_neighbors_only(mini_cellspec):
+    mini_cellspec.simulation_parameters.grid_size = 4
+    engine = PopulationEngine(mini_cellspec, seed=5)
+    parent = (2, 2)
+
+    placed = [engine._try_place_daughter(parent) for _ in range(9)]
+
+    # Eight Moore neighbours, then the parent is boxed in
+    assert placed == [True] * 8 + [False]
+    assert len(engine.cells) == 9
+    assert engine._occupied.sum() == 9
+    for r, c in engine.cells:
+        assert max(abs(r - 2), abs(c - 2)) <= 1
+
+
+def test_daughter_placement_wraps_around_grid_edges(mini_cellspec):
+    mini_cellspec.simulation_parameters.grid_size = 4
+    engine = PopulationEngine(mini_cellspec, seed=5)
+    engine.cells[(0, 0)] = engine.cells.pop((2, 2))
+    engine._occupied[:] = False
+    engine._occupied[0, 0] = True
+
+    for _ in range(8):
+        assert engine._try_place_daughter((0, 0))
+
+    assert {(3, 3), (0, 3), (3, 0)} <= set(engine.cells)
+
+
+def test_snapshot_aggregates_match_per_cell_values(mini_cellspec):
+    mini_cellspec.simulation_parameters.grid_size = 4
+    engine = PopulationEngine(mini_cellspec, seed=3)
+    engine.cells[(2, 2)].mutations = {"G_001": 1.1, "G_002": 0.9}
+    for _ in range(3):
+        engine._try_place_daughter((2, 2))
+    engine._step_all(num_sub_steps=2)
+
+    snap = engine._snapshot(60.0, lightweight=True)
+    cells = list(engine.cells.values())
+
+    assert len(cells) == 4
+    assert snap["total_mutations"] == sum(len(c.mutations) for c in cells) == 8
+    assert snap["mean_fitness"] == pytest.approx(
+        sum(c.growth_rate for c in cells) / len(cells)
+    )
@@ -0,0 +1,281 @@
+"""Tests for the sparse stoichiometric matrix."""
+
+import numpy as np
+import pytest
+
+from openlab.models import CellSpecMetabolite, CellSpecReaction
+from openlab.simulation import stoichiometric_matrix
+from openlab.simulation.stoichiometric_matrix import StoichiometricMatrix
+
+
+@pytest.fixture(autouse=True)
+def _clear_memo():
+    """Memoized instances are shared; keep per-instance caches from leaking across tests."""
+    stoichiometric_matrix._memo.clear()
+
+
+@pytest.fixture
+def network_inputs() -> tuple[list[CellSpecReaction], list[CellSpecMetabolite]]:
+    metabolites = [CellSpecMetabolite(id=m) for m in ("glc", "atp", "adp", "pyr", "h2o")]
+    reactions = [
+        CellSpecReaction.model_validate({
+            "id": "GLYC",
+            "substrates": [
+                {"metabolite_id": "glc", "coefficient": -1},
+                {"metabolite_id": "adp", "coefficient": -2},
+            ],
+            "products": [
+                {"metabolite_id": "pyr", "coefficient": 2},
+                {"metabolite_id": "atp", "coefficient": 2},
+            ],
+        }),
+        CellSpecReaction.model_validate({
+            "id": "ATPASE",
+            "substrates": [{"metabolite_id": "atp", "coefficient": 1}],
+            "products": [
+                {"metabolite_id": "adp", "coefficient": 1},
+                {"metabolite_id": "unknown_met", "coefficient": 1},
+            ],
+        }),
+        CellSpecReaction.model_validate({"id": "EMPTY"}),
+    ]
+    return reactions, metabolites
+
+
+@pytest.fixture
+def network(network_inputs) -> StoichiometricMatrix:
+    return StoichiometricMatrix.from_reactions(*network_inputs)
+
+
+EXPECTED = np.array([
+    [-1.0, 0.0, 0.0],
+    [2.0, -1.0, 0.0],
+    [-2.0, 1.0, 0.0],
+    [2.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0],
+])
+
+
+def test_from_reactions_builds_signed_matrix(network):
+    assert network.num_metabolites == 5
+    assert network.num_reactions == 3
+    # The participant on an unknown metabolite is dropped
+    assert network.num_nonzero == 6
+    np.testing.assert_array_equal(network.to_dense(), EXPECTED)
+
+
+def test_from_reactions_with_no_reactions():
+    sm = StoichiometricMatrix.from_reactions([], [CellSpecMetabolite(id="glc")])
+    assert sm.to_dense().shape == (1, 0)
+    assert sm.num_nonzero == 0
+
+
+def test_check_mass_balance(network):
+    results = {r.reaction_id: r for r in network.check_mass_balance()}
+
+    assert results["GLYC"].sum_coefficients == 1.0
+    assert results["GLYC"].num_participants == 4
+    assert not results["GLYC"].balanced
+    assert results["ATPASE"].sum_coefficients == 0.0
+    assert results["ATPASE"].num_participants == 2
+    assert results["ATPASE"].balanced
+    assert results["EMPTY"].num_participants == 0
+    assert results["EMPTY"].balanced
+
+
+def test_row_and_column_accessors(network):
+    for j in range(network.num_reactions):
+        np.testing.assert_array_equal(network.get_reaction_column(j), EXPECTED[:, j])
+    for i in range(network.num_metabolites):
+        np.testing.assert_array_equal(network.get_metabolite_row(i), EXPECTED[i])
+    assert network.get(1, 0) == 2.0
+
+
+def test_compute_flux_matches_dense_product(network):
+    rates = np.array([0.5, 2.0, 7.0])
+
+    flux = network.compute_flux(rates)
+
+    np.testing.assert_allclose(flux, EXPECTED @ rates)
+    # Each call returns a fresh array
+    assert network.compute_flux(rates) is not flux
+
+
+def test_compute_flux_rejects_wrong_length(network):
+    with pytest.raises(ValueError, match="expected one per reaction"):
+        network.compute_flux(np.ones(2))
+    with pytest.raises(ValueError, match="expected one per reaction"):
+        network.compute_flux(np.ones(4))
+
+
+def test_compute_flux_accepts_column_vector(network):
+    rates = np.array([[0.5], [2.0], [7.0]])
+
+    flux = network.compute_flux(rates)
+
+    assert flux.shape == (5,)
+    np.testing.assert_allclose(flux, EXPECTED @ rates.ravel())
+
+
+def test_compute_flux_without_numba(network, monkeypatch):
+    monkeypatch.setattr(stoichiometric_matrix, "njit", None)
+    rates = np.array([1.0, 1.0, 1.0])
+
+    np.testing.assert_allclose(network.compute_flux(rates), EXPECTED @ rates)
+
+
+def test_coo_list_round_trip(network):
+    coo_list = network.to_coo_list()
+
+    assert len(coo_list) == network.num_nonzero
+    assert all(isinstance(v, float) for entry in coo_list for v in entry)
+    rebuilt = StoichiometricMatrix.from_coo_list(
+        coo_list, network.metabolite_ids, network.reaction_ids
+    )
+    np.testing.assert_array_equal(rebuilt.to_dense(), EXPECTED)
+
+
+def test_from_empty_coo_list():
+    sm = StoichiometricMatrix.from_coo_list([], ["a", "b"], ["r1"])
+    np.testing.assert_array_equal(sm.to_dense(), np.zeros((2, 1)))
+
+
+def test_storage_is_csc(network):
+    assert network.matrix.format == "csc"
+
+
+def test_compiled_spmv_matches_dense_product(network):
+    rates = np.array([0.5, 2.0, 7.0])
+
+    spmv = network.compile_spmv()
+
+    np.testing.assert_allclose(spmv(rates, np.empty(5)), EXPECTED @ rates)
+    assert network.compile_spmv() is spmv
+    np.testing.assert_allclose(network.compute_flux(rates), EXPECTED @ rates)
+
+
+def test_compiled_spmv_rates_are_validated(network):
+    network.compile_spmv()
+
+    with pytest.raises(ValueError, match="expected one per reaction"):
+        network.compute_flux(np.ones(2))
+    np.testing.assert_allclose(
+        network.compute_flux(np.array([[0.5], [2.0], [7.0]])), EXPECTED @ [0.5, 2.0, 7.0]
+    )
+
+
+def test_compute_flux_batch(network):
+    rates = np.arange(12, dtype=np.float64).reshape(3, 4)
+
+    fluxes = network.compute_flux_batch(rates)
+
+    assert fluxes.shape == (5, 4)
+    np.testing.assert_allclose(fluxes, EXPECTED @ rates)
+    np.testing.assert_allclose(fluxes[:, 2], network.compute_flux(rates[:, 2]))
+
+
+def test_from_reactions_is_memoized_on_content(network_inputs):
+    reactions, metabolites = network_inputs
+    first = StoichiometricMatrix.from_reactions(reactions, metabolites)
+
+    rebuilt_inputs = [r.model_copy(deep=True) for r in reactions]
+    assert StoichiometricMatrix.from_reactions(rebuilt_inputs, metabolites) is first
+
+    rebuilt_inputs[0].products[0].coefficient = 3
+    changed = StoichiometricMatrix.from_reactions(rebuilt_inputs, metabolites)
+    assert changed is not first
+    assert changed.get(3, 0) == 3.0
+
+
+def test_from_coo_list_is_memoized_on_content():
+    triples = [[0, 0, -1.0], [1, 0, 1.0]]
+    first = StoichiometricMatrix.from_coo_list(triples, ["a", "b"], ["r1"])
+
+    copied = [list(t) for t in triples]
+    assert StoichiometricMatrix.from_coo_list(copied, ["a", "b"], ["r1"]) is first
+    assert StoichiometricMatrix.from_coo_list(triples, ["a", "c"], ["r1"]) is not first
+
+
+def test_memoized_matrix_does_not_alias_caller_ids():
+    met_ids = ["a", "b"]
+    first = StoichiometricMatrix.from_coo_list([[0, 0, -1.0], [1, 0, 1.0]], met_ids, ["r1"])
+
+    met_ids.append("c")
+    second = StoichiometricMatrix.from_coo_list([[0, 0, -1.0], [1, 0, 1.0]], ["a", "b"], ["r1"])
+    assert second is first
+    assert second.metabolite_ids == ["a", "b"]
+    assert second.num_metabolites == 2
+
+
+def test_npz_round_trip(network, tmp_path):
+    path = tmp_path / "network.npz"
+
+    network.to_npz(path)
+    loaded = StoichiometricMatrix.from_npz(path)
+
+    assert loaded.metabolite_ids == network.metabolite_ids
+    assert loaded.reaction_ids == network.reaction_ids
+    assert loaded.num_nonzero == network.num_nonzero
+    np.testing.assert_array_equal(loaded.to_dense(), EXPECTED)
+
+
+def test_npz_round_trip_empty(tmp_path):
+    path = tmp_path / "empty.npz"
+
+    StoichiometricMatrix([], []).to_npz(path)
+    loaded = StoichiometricMatrix.from_npz(path)
+
+    assert loaded.metabolite_ids == []
+    assert loaded.to_dense().shape == (0, 0)
+
+
+def test_integer_coefficients_are_stored_as_int16(network):
+    assert network.matrix.dtype == np.int16
+    assert network.to_dense().dtype == np.float64
+    assert network.get_reaction_column(0).dtype == np.float64
+    flux = network.compute_flux(np.array([0.5, 2.0, 7.0]))
+    assert flux.dtype == np.float64
+    np.testing.assert_allclose(flux, EXPECTED @ np.array([0.5, 2.0, 7.0]))
+
+
+def test_fractional_coefficients_stay_float64():
+    sm = StoichiometricMatrix.from_coo_list([[0, 0, -0.5], [1, 0, 1.0]], ["a", "b"], ["r1"])
+
+    assert sm.matrix.dtype == np.float64
+    np.testing.assert_allclose(sm.compute_flux(np.array([2.0])), [-1.0, 2.0])
+
+
+def test_compute_flux_parallel_kernel(network, monkeypatch):
+    monkeypatch.setattr(stoichiometric_matrix, "_PARALLEL_MIN_ROWS", 0)
+    rates = np.array([0.5, 2.0, 7.0])
+
+    np.testing.assert_allclose(network.compute_flux(rates), EXPECTED @ rates)
+
+
+def test_duplicate_participants_are_summed():
+    metabolites = [CellSpecMetabolite(id=m) for m in ("atp", "adp")]
+    reactions = [
+        CellSpecReaction.model_validate({
+            "id": "CYCLE",
+            "substrates": [
+                {"metabolite_id": "atp", "coefficient": 1},
+                {"metabolite_id": "adp", "coefficient": 1},
+            ],
+            "products": [{"metabolite_id": "atp", "coefficient": 3}],
+        }),
+    ]
+
+    sm = StoichiometricMatrix.from_reactions(reactions, metabolites)
+
+    assert sm.num_nonzero == 2
+    assert sm.matrix.has_sorted_indices
+    np.testing.assert_array_equal(sm.to_dense(), [[2.0], [-1.0]])
+
+
+def test_from_coo_list_sorts_unordered_triples():
+    triples = [[1, 1, 4.0], [0, 1, 3.0], [1, 0, 2.0], [0, 0, 1.0], [0, 0, 1.0]]
+
+    sm = StoichiometricMatrix.from_coo_list(triples, ["a", "b"], ["r1", "r2"])
+
+    np.testing.assert_array_equal(sm.matrix.indices, [0, 1, 0, 1])
+    np.testing.assert_array_equal(sm.to_dense(), [[2.0, 3.0], [2.0, 4.0]])
@@ -1,7 +1,6 @@
 """Tests for variant annotator."""
 
 import httpx
-import pytest
 import respx
 
 from openlab.cancer.annotation.annotator import _parse_clinical_significance, annotate_variants
@@ -21,7 +20,6 @@ def test_parse_clinical_significance():
     assert _parse_clinical_significance("unknown") is None
 
 
-@pytest.mark.asyncio
 async def test_annotate_variants_no_gene():
     """Variants without gene symbol get no annotation."""
     variants = [VariantRecord(chrom="chr1", pos=100, ref="A", alt="T")]
@@ -34,7 +32,6 @@ async def test_annotate_variants_no_gene():
     assert results[0].annotation_sources == []
 
 
-@pytest.mark.asyncio
 async def test_annotate_variants_with_gene():
     """Variants with gene symbol attempt annotation."""
     variants = [VariantRecord(chrom="chr17", pos=7674220, ref="C", alt="T", gene_symbol="TP53")]